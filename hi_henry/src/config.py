@@ -16,7 +16,8 @@ __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 
-__all__ = ['database_file_name', 'activity_log_file_name', 'core_log_file_name', 'error_log_file_name']
+__all__ = ['database_file_name', 'activity_log_file_name', 'core_log_file_name', 'error_log_file_name',
+           'schema_store_folder', 'history_folder']
 
 from pathlib import Path
 import click
@@ -63,3 +64,16 @@ def map_file_name() -> Path:
     """
     return _app_folder().joinpath('map.cfg')
 
+
+def schema_store_folder() -> Path:
+    """
+    This function returns the name of the folder holding the saved project schemas
+    """
+    return _app_folder().joinpath('schemas')
+
+
+def history_folder() -> Path:
+    """
+    This function returns the name of the folder holding the schema history of each project
+    """
+    return _app_folder().joinpath('history')
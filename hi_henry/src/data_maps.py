@@ -16,12 +16,17 @@ __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 
-__all__ = ['load_config', 'populate_map_table', 'TypeMap']
+__all__ = ['load_config', 'load_type_maps', 'populate_map_table', 'ResolvedType', 'TypeMap', 'compose_type_maps',
+           'OverrideRule', 'TypeOverrides']
 
 import pathlib
+import re
+import typing
+import attrs
 import tomli
-from collections import UserDict
-from .model import DataTypeMap
+from collections import OrderedDict, UserDict
+from itertools import pairwise
+from .model import DataTypeMap, StandardDataType
 from .dbms import MapStore
 
 
@@ -52,6 +57,18 @@ def load_config(file: pathlib.Path) -> list[DataTypeMap]:
     return maps
 
 
+def load_type_maps(file: pathlib.Path) -> dict[str, 'TypeMap']:
+    """
+    This function loads the maps from the original data file as type maps, by name
+    """
+    type_maps = dict()
+    for record in load_config(file):
+        type_map = type_maps[record.name] = TypeMap(record.name, record.from_type, record.to_type,
+                                                    record.default_type)
+        type_map.update(record.map)
+    return type_maps
+
+
 def populate_map_table(source: pathlib.Path, database_file: pathlib.Path) -> None:
     """
     This function populates the app database with the data type maps
@@ -63,6 +80,190 @@ def populate_map_table(source: pathlib.Path, database_file: pathlib.Path) -> Non
         db.insert(item)
 
 
+# The arguments of a data type, such as the length of VARCHAR(255) or the precision and scale of DECIMAL(10, 2)
+_ARGUMENTS = re.compile(r'\(([^()]*)\)')
+
+# The words that qualify a data type rather than name it
+_MODIFIERS = frozenset({'UNSIGNED', 'SIGNED', 'ZEROFILL'})
+
+# The target types whose arguments are a precision and scale rather than a length
+_PRECISION_TYPES = frozenset({'Decimal', 'Float', 'Double', 'DateTime', 'TimeStamp'})
+
+# The target types whose single argument is a length
+_LENGTH_TYPES = frozenset({'String', 'Binary', 'Bit'})
+
+# The times of day, which have no standard type of their own, whose argument is the precision of the seconds
+_TIME_TYPES = frozenset({'TIME', 'TIMETZ', 'TIME WITHOUT TIME ZONE', 'TIME WITH TIME ZONE'})
+
+# The other names of data types, used when a map does not hold the name found
+_ALIASES = {'INT': 'INTEGER', 'INT2': 'SMALLINT', 'INT4': 'INTEGER', 'INT8': 'BIGINT', 'DEC': 'DECIMAL',
+            'FLOAT4': 'REAL', 'FLOAT8': 'DOUBLE PRECISION', 'DOUBLE': 'DOUBLE PRECISION', 'BOOL': 'BOOLEAN',
+            'BPCHAR': 'CHARACTER', 'VARBIT': 'BIT VARYING', 'TIMESTAMP': 'TIMESTAMP WITHOUT TIME ZONE',
+            'TIMESTAMPTZ': 'TIMESTAMP WITH TIME ZONE', 'TIME': 'TIME WITHOUT TIME ZONE',
+            'TIMETZ': 'TIME WITH TIME ZONE'}
+
+
+def _sqlite_affinity(base: str) -> str:
+    """
+    This function returns the type affinity SQLite gives a declared type
+    """
+    if 'INT' in base:
+        return 'INTEGER'
+    if 'CHAR' in base or 'CLOB' in base or 'TEXT' in base:
+        return 'TEXT'
+    if 'BLOB' in base:
+        return 'BLOB'
+    if 'REAL' in base or 'FLOA' in base or 'DOUB' in base:
+        return 'REAL'
+    return 'NUMERIC'
+
+
+@attrs.frozen
+class ResolvedType:
+    """
+    This class holds a data type parsed into its base name, arguments and modifiers, and the type it maps to
+    """
+    raw: str = attrs.field(validator=[attrs.validators.instance_of(str)])
+    base: str = attrs.field(validator=[attrs.validators.instance_of(str)])
+    target: str = attrs.field(validator=[attrs.validators.instance_of(str)])
+    length: int | None = None
+    precision: int | None = None
+    scale: int | None = None
+    modifiers: tuple[str, ...] = ()
+    is_default: bool = False
+
+
+@attrs.frozen
+class OverrideRule:
+    """
+    This class holds a rule giving the type of the columns it matches, by a pattern matched against the table
+    and column name joined by a dot. The pattern is a glob, where * matches any characters but a dot and ?
+    one of them, or a regular expression. The type is one of the standard data types.
+    """
+    pattern: str = attrs.field(validator=[attrs.validators.instance_of(str)])
+    target: str = attrs.field(validator=[attrs.validators.instance_of(str),
+                                         attrs.validators.in_([data_type.value for data_type in StandardDataType])])
+    is_regex: bool = attrs.field(default=False, validator=[attrs.validators.instance_of(bool)])
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """
+    This function converts a glob over a table and column name, a pattern without a dot matching the column
+    of any table
+    """
+    if '.' not in pattern:
+        pattern = f"*.{pattern}"
+    return ''.join('[^.]*' if char == '*' else '[^.]' if char == '?' else re.escape(char) for char in pattern)
+
+
+class TypeOverrides:
+    """
+    This class gives the type of a column from the first of a list of override rules matching it. The rules
+    naming a column of a table, or a column of any table, are looked up in dicts and the others are compiled
+    into a single regular expression, with a group around each rule, so a column is matched in one pass
+    whatever the number of rules. A regular expression with groups of its own is matched on its own, as its
+    group numbers would change in the single one. The number of columns each rule matched is counted.
+    """
+    _rules: tuple[OverrideRule, ...]
+    _ignore_case: bool
+    _exact: dict[str, int]
+    _by_column: dict[str, int]
+    _filter: re.Pattern | None
+    _matcher: re.Pattern | None
+    _group_rules: dict[int, int]
+    _grouped: list[tuple[int, re.Pattern]]
+    _hits: list[int]
+
+    def __init__(self, rules: typing.Iterable[OverrideRule], ignore_case: bool = False):
+        """
+        Initializes an instance of the class, compiling the rules
+
+        :param rules: The rules, in the order they are tried
+        :param ignore_case: Matches the table and column names without regard to case
+        """
+        self._rules = tuple(rules)
+        self._ignore_case = ignore_case
+        self._exact = dict()
+        self._by_column = dict()
+        self._grouped = list()
+        self._hits = [0] * len(self._rules)
+
+        flags = re.IGNORECASE if ignore_case else 0
+        alternatives = list()
+        for position, rule in enumerate(self._rules):
+            pattern = rule.pattern.lower() if ignore_case and not rule.is_regex else rule.pattern
+            # A glob naming a column without a table, or of any table, is looked up by the column name
+            column = pattern[2:] if pattern.startswith('*.') else pattern
+            if rule.is_regex:
+                compiled = re.compile(pattern, flags)
+                if compiled.groups:
+                    self._grouped.append((position, compiled))
+                else:
+                    alternatives.append((position, pattern))
+            elif '.' in pattern and not any(char in pattern for char in '*?'):
+                self._exact.setdefault(pattern, position)
+            elif not any(char in column for char in '*?.'):
+                self._by_column.setdefault(column, position)
+            else:
+                alternatives.append((position, _glob_to_regex(pattern)))
+
+        # The groups around the rules stop the regular expression engine from skipping the alternatives that
+        # cannot match, so most columns, which match no rule, are tried against the rules without them first
+        self._filter = self._matcher = None
+        self._group_rules = dict()
+        if alternatives:
+            self._filter = re.compile('|'.join(f"(?:{pattern})" for _, pattern in alternatives), flags)
+            pattern = '|'.join(f"(?P<_rule{position}>{pattern})" for position, pattern in alternatives)
+            self._matcher = re.compile(pattern, flags)
+            self._group_rules = {self._matcher.groupindex[f"_rule{position}"]: position for position, _ in alternatives}
+
+    @property
+    def rules(self) -> tuple[OverrideRule, ...]:
+        return self._rules
+
+    def match(self, table: str, column: str) -> OverrideRule | None:
+        """
+        This method returns the first rule matching a column, or None when no rule matches it
+        """
+        if self._ignore_case:
+            table, column = table.lower(), column.lower()
+
+        name = f"{table}.{column}"
+        found = self._exact.get(name, len(self._rules))
+        position = self._by_column.get(column)
+        if position is not None and position < found:
+            found = position
+
+        if self._filter is not None and self._filter.fullmatch(name) is not None:
+            match = self._matcher.fullmatch(name)
+            if match is not None:
+                # The group around a rule closes after the groups within it, so it is the last group matched
+                position = self._group_rules[match.lastindex]
+                if position < found:
+                    found = position
+
+        for position, compiled in self._grouped:
+            if position >= found:
+                break
+            if compiled.fullmatch(name) is not None:
+                found = position
+                break
+
+        if found == len(self._rules):
+            return None
+        self._hits[found] += 1
+        return self._rules[found]
+
+    def hits(self) -> list[tuple[OverrideRule, int]]:
+        """
+        This method returns each rule with the number of columns it matched
+        """
+        return list(zip(self._rules, self._hits))
+
+    def reset_hits(self) -> None:
+        self._hits = [0] * len(self._rules)
+
+
 class TypeMap(UserDict):
     """
     Holds the mapping between two types
@@ -71,8 +272,14 @@ class TypeMap(UserDict):
     _from_type: str
     _to_type: str
     _default: str
+    _version: int
+    _keys: dict[str, str] | None
+    _resolved: dict[str, ResolvedType]
 
     def __init__(self, name: str, from_type: str, to_type: str, default: str):
+        self._version = 0
+        self._keys = None
+        self._resolved = dict()
         super().__init__({})
         self._name = name
         self._from_type = from_type
@@ -96,7 +303,159 @@ class TypeMap(UserDict):
     def default(self) -> str:
         return self._default
 
+    @property
+    def version(self) -> int:
+        """
+        This property returns the number of changes made to the map
+        """
+        return self._version
+
     def __getitem__(self, item) -> str:
         if item in self.data:
             return self.data[item]
         return self._default
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._version += 1
+        self._keys = None
+        self._resolved.clear()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._version += 1
+        self._keys = None
+        self._resolved.clear()
+
+    def _find_key(self, base: str) -> str | None:
+        """
+        This method returns the key of the map for a base type name, trying its alias, the longest leading
+        words found in the map and, for SQLite, its type affinity
+        """
+        if self._keys is None:
+            self._keys = {' '.join(key.upper().split()): key for key in self.data}
+        keys = self._keys
+
+        candidates = [base, _ALIASES.get(base)]
+        words = base.split()
+        candidates.extend(' '.join(words[:count]) for count in range(len(words) - 1, 0, -1))
+        # A column declared without a type has no affinity to map
+        if self._from_type == 'SQLite' and base:
+            candidates.append(_sqlite_affinity(base))
+
+        for candidate in candidates:
+            if candidate in keys:
+                return keys[candidate]
+        return None
+
+    def resolve(self, data_type: str) -> ResolvedType:
+        """
+        This method parses a data type, such as VARCHAR(255), DECIMAL(10,2), INT UNSIGNED or TIMESTAMP(6) WITH
+        TIME ZONE, and returns it with the type it maps to. Each distinct data type is parsed and looked up
+        once, the result is kept until the map changes.
+        """
+        resolved = self._resolved.get(data_type)
+        if resolved is not None:
+            return resolved
+
+        text = data_type.upper()
+        arguments = [part.strip() for match in _ARGUMENTS.finditer(text) for part in match.group(1).split(',')]
+        text = _ARGUMENTS.sub(' ', text)
+
+        modifiers = list()
+        if '[]' in text:
+            text = text.replace('[]', ' ')
+            modifiers.append('ARRAY')
+        words = text.split()
+        modifiers.extend(word for word in words if word in _MODIFIERS)
+        base = ' '.join(word for word in words if word not in _MODIFIERS)
+
+        # An array is not of the type of its elements
+        if modifiers and modifiers[0] == 'ARRAY':
+            key, target = None, self._default
+        else:
+            key = self._find_key(base)
+            target = self[base if key is None else key]
+
+        numbers = [int(argument) for argument in arguments] if all(map(str.isdigit, arguments)) else []
+        length = precision = scale = None
+        if numbers and (target in _PRECISION_TYPES or base in _TIME_TYPES):
+            precision = numbers[0]
+            scale = numbers[1] if len(numbers) > 1 else None
+        elif len(numbers) == 1 and target in _LENGTH_TYPES:
+            length = numbers[0]
+
+        resolved = self._resolved[data_type] = ResolvedType(data_type, base, target, length, precision, scale,
+                                                            tuple(modifiers), key is None)
+        return resolved
+
+
+class _ReadOnlyTypeMap(TypeMap):
+    """
+    This class holds a type map shared by its callers, which can not be changed, a copy of it can be
+    """
+
+    def __setitem__(self, key, value) -> typing.NoReturn:
+        raise TypeError(f"The type map {self.name} is shared and can not be changed, change a copy of it instead")
+
+    def __delitem__(self, key) -> typing.NoReturn:
+        raise TypeError(f"The type map {self.name} is shared and can not be changed, change a copy of it instead")
+
+    def copy(self) -> TypeMap:
+        type_map = TypeMap(self.name, self.from_type, self.to_type, self.default)
+        type_map.update(self.data)
+        return type_map
+
+
+def _read_only_type_map(name: str, from_type: str, to_type: str, default: str,
+                       data: dict[str, str]) -> TypeMap:
+    """
+    This function returns a type map that can not be changed, for the maps shared by the callers of a cache
+    """
+    type_map = _ReadOnlyTypeMap(name, from_type, to_type, default)
+    type_map.data.update(data)
+    return type_map
+
+
+# The number of composed maps kept, the least recently used ones are dropped first
+_MAX_CHAINS = 32
+
+# The composed maps by the ids of the maps composed, with the maps, which are held so that their ids are not
+# reused, and their versions
+_chains: OrderedDict[tuple[int, ...], tuple[tuple[TypeMap, ...], tuple[int, ...], TypeMap]] = OrderedDict()
+
+
+def compose_type_maps(*type_maps: TypeMap) -> TypeMap:
+    """
+    This function returns a map going straight from the source type of the first map to the target type of the
+    last, such as SQLite_To_Standard followed by Standard_To_Python, so that a type is mapped with one lookup.
+    The composed map is shared and can not be changed, it is kept until one of the maps changes or it is one of
+    the least recently used when more than 32 are kept.
+    """
+    if not type_maps:
+        raise ValueError("At least one type map must be given")
+    for first, second in pairwise(type_maps):
+        if first.to_type != second.from_type:
+            raise ValueError(f"The map {second.name} does not follow the map {first.name}")
+
+    key = tuple(map(id, type_maps))
+    versions = tuple(type_map.version for type_map in type_maps)
+    entry = _chains.get(key)
+    if entry is not None and entry[1] == versions:
+        _chains.move_to_end(key)
+        return entry[2]
+
+    def follow(value: str) -> str:
+        for type_map in type_maps[1:]:
+            value = type_map[value]
+        return value
+
+    first, last = type_maps[0], type_maps[-1]
+    composed = _read_only_type_map(f"{first.from_type}_To_{last.to_type}", first.from_type, last.to_type,
+                                  follow(first.default), {name: follow(value) for name, value in first.data.items()})
+
+    _chains[key] = (type_maps, versions, composed)
+    _chains.move_to_end(key)
+    while len(_chains) > _MAX_CHAINS:
+        _chains.popitem(last=False)
+    return composed
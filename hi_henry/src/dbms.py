@@ -16,7 +16,7 @@ __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 
-__all__ = ['ProjectStore']
+__all__ = ['ProjectStore', 'MapStore']
 
 import typing
 import pathlib
@@ -27,6 +27,9 @@ import attrs
 from .model import Project, ProjectMetadata, ProjectMetadataList, DataTypeMap
 from .errors import DuplicateRecordError, RecordNotFoundError
 
+if typing.TYPE_CHECKING:
+    from .data_maps import TypeMap
+
 
 class ProjectStore:
     """
@@ -99,11 +102,28 @@ class ProjectStore:
         self._table.update(data, tinydb.where("name") == record.name)
 
 
+@attrs.define
+class _CachedMaps:
+    """
+    This class holds the maps read from a map store file, with the file details used to tell when it changes
+    """
+    signature: tuple[int, int, int]
+    records: dict[tuple[str, str], DataTypeMap]
+    type_maps: dict[tuple[str, str], 'TypeMap'] = attrs.Factory(dict)
+
+
+# The maps of each map store file, shared by the stores of the process
+_map_cache: dict[pathlib.Path, _CachedMaps] = dict()
+
+
 class MapStore:
     """
     This class provides access to the map table in the
-    application database
+    application database. The maps are read once and kept, by source and target type, until the file is
+    written or changes on disk. As the maps kept are shared by the stores of the process, the records returned
+    are copies and the type maps can not be changed.
     """
+    _file: pathlib.Path
     _table: tinydb.table.Table
 
     def __init__(self, file: pathlib.Path):
@@ -112,6 +132,7 @@ class MapStore:
         and a link to the desired table
         """
         db = tinydb.TinyDB(file)
+        self._file = pathlib.Path(file).resolve()
         self._table = db.table('maps')
 
     @staticmethod
@@ -125,14 +146,65 @@ class MapStore:
 
         return data
 
+    def _maps(self) -> _CachedMaps:
+        """
+        This method returns the maps of the file, reading them when they are not cached or the file changed
+        """
+        stat = self._file.stat()
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        cached = _map_cache.get(self._file)
+        if cached is None or cached.signature != signature:
+            records = dict()
+            for data in self._table.all():
+                record = DataTypeMap(**data)
+                records.setdefault((record.from_type, record.to_type), record)
+            cached = _map_cache[self._file] = _CachedMaps(signature, records)
+        return cached
+
+    def _invalidate(self) -> None:
+        _map_cache.pop(self._file, None)
+
     def get(self, from_type: str, to_type: str) -> DataTypeMap | None:
         """
-        Returns the requested project if it exists
+        Returns a copy of the requested data map if it exists
         """
-        data = self._table.search((tinydb.where("from_type") == from_type) & (tinydb.where("to_type") == to_type))
-        if data:
-            data = data[0]
-            return DataTypeMap(**data)
+        record = self._maps().records.get((from_type, to_type))
+        return None if record is None else attrs.evolve(record, map=dict(record.map))
+
+    def type_map(self, from_type: str, to_type: str) -> 'TypeMap | None':
+        """
+        Returns the requested data map as a TypeMap, built once and shared until the maps change, or None when
+        the data map does not exist. The map can not be changed, a copy of it can.
+        """
+        # Imported here as the data maps module uses this one
+        from .data_maps import _read_only_type_map
+
+        key = (from_type, to_type)
+        cached = self._maps()
+        type_map = cached.type_maps.get(key)
+        if type_map is None:
+            record = cached.records.get(key)
+            if record is None:
+                return None
+            type_map = cached.type_maps[key] = _read_only_type_map(record.name, record.from_type, record.to_type,
+                                                                   record.default_type, record.map)
+        return type_map
+
+    def type_map_chain(self, *types: str) -> 'TypeMap':
+        """
+        Returns the data maps going from each type to the next composed into a single TypeMap, such as SQLite,
+        Standard and Python for the map from SQLite to Python types. The map can not be changed, a copy of it can.
+        """
+        from .data_maps import compose_type_maps
+
+        type_maps = list()
+        for from_type, to_type in zip(types, types[1:]):
+            type_map = self.type_map(from_type, to_type)
+            if type_map is None:
+                raise RecordNotFoundError(f"A Data Map from: {from_type} to: {to_type} does not exist")
+            type_maps.append(type_map)
+        return compose_type_maps(*type_maps)
 
     def insert(self, record: DataTypeMap) -> int:
         """
@@ -142,17 +214,24 @@ class MapStore:
             raise DuplicateRecordError(f"A Data Map with the name: {record.name} already exists in the database")
 
         data = self._record_to_dict(record)
-        return self._table.insert(data)
+        try:
+            return self._table.insert(data)
+        finally:
+            self._invalidate()
 
-    def update(self, record: Project) -> None:
+    def update(self, record: DataTypeMap) -> None:
         """
-        Updates an existing record in the database
+        Updates an existing data map record in the database
         """
-        if not self.get(record.name):
-            raise RecordNotFoundError(f"A project with the name: {record.name} does not exist")
+        if not self.get(record.from_type, record.to_type):
+            raise RecordNotFoundError(f"A Data Map with the name: {record.name} does not exist")
 
         data = self._record_to_dict(record)
         data['lock_version'] = data['lock_version'] + 1
         data['updated_at'] = pendulum.now().to_iso8601_string()
 
-        self._table.update(data, tinydb.where("name") == record.name)
+        try:
+            self._table.update(data, (tinydb.where("from_type") == record.from_type) &
+                               (tinydb.where("to_type") == record.to_type))
+        finally:
+            self._invalidate()
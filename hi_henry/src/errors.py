@@ -16,7 +16,8 @@ __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 
-__all__ = ['DuplicateRecordError', 'RecordNotFoundError', 'DatabaseNotFoundError', 'SchemaNotFoundError']
+__all__ = ['DuplicateRecordError', 'RecordNotFoundError', 'DatabaseNotFoundError', 'SchemaNotFoundError',
+           'CatalogReplayError']
 
 
 class AppError(Exception):
@@ -52,3 +53,10 @@ class SchemaNotFoundError(DatabaseNotFoundError):
     Raised when the DBMS does not contain the required schema
     """
     pass
+
+
+class CatalogReplayError(AppError):
+    """
+    Raised when a catalog query is replayed that was not captured in the recording
+    """
+    pass
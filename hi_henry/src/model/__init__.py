@@ -22,7 +22,14 @@ __all__ = ['DatabaseType', 'DtoType', 'Project', 'ProjectList', 'ProjectDict', '
            'View', 'ViewList', 'Column', 'Columns', 'ColumnNames', 'Index', 'Indexes', 'ForeignKey', 'ForeignKeys',
            'Table', 'TableList', 'Database', 'DatabaseInfo', 'IConnection', 'IDatabaseExplorer', 'IPluginInterface',
            'CreateExplorerPluginFunction', 'SchemaInfo', 'DataTypeMap', 'StandardDataType', 'DatabaseMetadata',
-           'TableMetaData', 'ColumnMetadata', 'IndexMetadata', 'ForeignKeyMetadata', 'ViewMetaData', 'ViewColumnMetadata']
+           'TableMetaData', 'ColumnMetadata', 'IndexMetadata', 'ForeignKeyMetadata', 'ViewMetaData', 'ViewColumnMetadata',
+           'ConnectionFactory', 'StringTable', 'ColumnarDatabaseMetadata', 'ColumnarTable', 'ColumnarColumn',
+           'ColumnarIndex', 'ColumnarForeignKey', 'ColumnarView', 'ColumnarViewColumn', 'SchemaSnapshot',
+           'dump_snapshot', 'write_snapshot', 'Changes', 'TableDiff', 'SchemaDiff', 'diff_schemas',
+           'fingerprint', 'FingerprintCache', 'ForeignKeyGraph', 'foreign_key_graph',
+           'SchemaQuery', 'schema_query', 'SchemaJsonWriter', 'SchemaJsonReader', 'write_schema_json',
+           'CATALOG_DATASETS', 'catalog_to_arrow', 'write_catalog_parquet', 'SchemaStore', 'HistoryEntry',
+           'SchemaHistory']
 
 from ._model import *
 from ._schema_interface import *
@@ -30,3 +37,13 @@ from ._schema import *
 from ._plugin import *
 from ._data_type_map import *
 from ._standard import *
+from ._columnar import *
+from ._snapshot import *
+from ._diff import *
+from ._fingerprint import *
+from ._graph import *
+from ._query import *
+from ._stream import *
+from ._arrow import *
+from ._store import *
+from ._history import *
@@ -0,0 +1,148 @@
+# *******************************************************************************************
+#  File:  _arrow.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['CATALOG_DATASETS', 'catalog_to_arrow', 'write_catalog_parquet']
+
+import importlib
+import typing
+from collections.abc import Mapping
+from pathlib import Path
+
+# The datasets of a catalog and their columns, with the name of the pyarrow function giving the column type
+_COLUMNS: dict[str, tuple[tuple[str, str], ...]] = {
+    'databases': (('project', 'string'), ('database', 'string'), ('database_type', 'string'),
+                  ('table_count', 'int32'), ('view_count', 'int32')),
+    'tables': (('project', 'string'), ('table', 'string'), ('column_count', 'int32'), ('index_count', 'int32'),
+               ('foreign_key_count', 'int32'), ('has_primary_key', 'bool_')),
+    'columns': (('project', 'string'), ('table', 'string'), ('column', 'string'), ('position', 'int32'),
+                ('data_type', 'string'), ('length', 'int64'), ('is_nullable', 'bool_'), ('is_unique', 'bool_'),
+                ('is_auto', 'bool_'), ('is_primary', 'bool_')),
+    'indexes': (('project', 'string'), ('table', 'string'), ('index', 'string'), ('columns', 'list_'),
+                ('is_unique', 'bool_'), ('is_primary', 'bool_')),
+    'foreign_keys': (('project', 'string'), ('table', 'string'), ('foreign_key', 'string'), ('column', 'string'),
+                     ('foreign_table', 'string'), ('foreign_column', 'string')),
+    'views': (('project', 'string'), ('view', 'string'), ('column_count', 'int32')),
+    'view_columns': (('project', 'string'), ('view', 'string'), ('column', 'string'), ('position', 'int32'),
+                     ('data_type', 'string'), ('length', 'int64'))
+}
+
+CATALOG_DATASETS = tuple(_COLUMNS)
+
+
+def _pyarrow() -> typing.Any:
+    """
+    This function imports pyarrow, which is only needed by the catalog export
+    """
+    try:
+        return importlib.import_module('pyarrow')
+    except ImportError as e:
+        raise ImportError("The catalog export needs pyarrow, install it with: pip install pyarrow") from e
+
+
+def _arrow_schemas(pa: typing.Any) -> dict[str, typing.Any]:
+    schemas = dict()
+    for dataset, columns in _COLUMNS.items():
+        fields = [pa.field(name, pa.list_(pa.string()) if type_name == 'list_' else getattr(pa, type_name)())
+                  for name, type_name in columns]
+        schemas[dataset] = pa.schema(fields)
+    return schemas
+
+
+def _catalog_items(schemas: typing.Any) -> typing.Iterable[tuple[str, typing.Any]]:
+    return schemas.items() if isinstance(schemas, Mapping) else schemas
+
+
+def _project_columns(project: str, schema: typing.Any) -> dict[str, dict[str, list]]:
+    """
+    This function returns the values of each column of each dataset for the schema of a project
+    """
+    data = {dataset: {name: list() for name, _ in columns} for dataset, columns in _COLUMNS.items()}
+
+    def add(dataset: str, *values: typing.Any) -> None:
+        for values_list, value in zip(data[dataset].values(), values):
+            values_list.append(value)
+
+    tables, views = schema.tables, schema.views
+    add('databases', project, schema.name, schema.type.value, len(tables), len(views))
+
+    for table in tables.values():
+        columns = table.columns.values()
+        has_primary_key = any(col.is_primary for col in columns) or any(index.is_primary for index in table.indexes)
+        add('tables', project, table.name, len(table.columns), len(table.indexes), len(table.foreign_keys),
+            has_primary_key)
+        for position, col in enumerate(columns, 1):
+            add('columns', project, table.name, col.name, position, col.data_type.value, col.length, col.is_nullable,
+                col.is_unique, col.is_auto, col.is_primary)
+        for index in table.indexes:
+            add('indexes', project, table.name, index.name, list(index.columns), index.is_unique, index.is_primary)
+        for key in table.foreign_keys:
+            add('foreign_keys', project, table.name, key.name, key.column, key.foreign_table, key.foreign_column)
+
+    for view in views.values():
+        add('views', project, view.name, len(view.columns))
+        for col in view.columns.values():
+            add('view_columns', project, view.name, col.name, col.order, col.data_type.value, col.length)
+
+    return data
+
+
+def catalog_to_arrow(schemas: typing.Any) -> dict[str, typing.Any]:
+    """
+    This function returns the standard metadata of many projects as Arrow tables, one for each dataset in
+    CATALOG_DATASETS, with a row for each database, table, column, index, foreign key, view and view column
+    and the project it belongs to
+
+    :param schemas: The DatabaseMetadata of each project, as a mapping or pairs of project name and schema
+    """
+    pa = _pyarrow()
+    arrow_schemas = _arrow_schemas(pa)
+    parts: dict[str, list] = {dataset: list() for dataset in _COLUMNS}
+
+    for project, schema in _catalog_items(schemas):
+        for dataset, columns in _project_columns(project, schema).items():
+            parts[dataset].append(pa.Table.from_pydict(columns, schema=arrow_schemas[dataset]))
+
+    return {dataset: pa.concat_tables(tables) if tables else arrow_schemas[dataset].empty_table()
+            for dataset, tables in parts.items()}
+
+
+def write_catalog_parquet(schemas: typing.Any, folder: Path) -> dict[str, Path]:
+    """
+    This function writes the standard metadata of many projects as a Parquet file for each dataset in
+    CATALOG_DATASETS. The projects are written one at a time, as a row group of each file, so the catalog is
+    not held in memory.
+
+    :param schemas: The DatabaseMetadata of each project, as a mapping or pairs of project name and schema
+    :param folder: The folder to write the files to
+    :return: The file written for each dataset
+    """
+    pa = _pyarrow()
+    parquet = importlib.import_module('pyarrow.parquet')
+    arrow_schemas = _arrow_schemas(pa)
+
+    folder.mkdir(parents=True, exist_ok=True)
+    files = {dataset: folder.joinpath(f"{dataset}.parquet") for dataset in _COLUMNS}
+    writers = {dataset: parquet.ParquetWriter(str(files[dataset]), arrow_schemas[dataset]) for dataset in _COLUMNS}
+    try:
+        for project, schema in _catalog_items(schemas):
+            for dataset, columns in _project_columns(project, schema).items():
+                writers[dataset].write_table(pa.Table.from_pydict(columns, schema=arrow_schemas[dataset]))
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    return files
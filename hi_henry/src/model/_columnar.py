@@ -0,0 +1,583 @@
+# *******************************************************************************************
+#  File:  _columnar.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['StringTable', 'ColumnarDatabaseMetadata', 'ColumnarTable', 'ColumnarColumn', 'ColumnarIndex',
+           'ColumnarForeignKey', 'ColumnarView', 'ColumnarViewColumn']
+
+import typing
+from array import array
+from collections.abc import Mapping
+from ._model import DatabaseType
+from ._data_type_map import StandardDataType
+from ._standard import _ReadOnlyMetadata, DatabaseMetadata, TableMetaData, ColumnMetadata, IndexMetadata, \
+    ForeignKeyMetadata, ViewMetaData, ViewColumnMetadata
+
+# The data types are stored as their position in a list of types held by the schema, which starts out as
+# the standard data types in this order
+_DATA_TYPES = tuple(StandardDataType)
+_DATA_TYPE_CODES = {data_type: code for code, data_type in enumerate(_DATA_TYPES)}
+
+# The column and index flags are stored as bits
+_NULLABLE = 1
+_UNIQUE = 2
+_AUTO = 4
+_PRIMARY = 8
+
+# Lengths are stored as integers, with this value standing for None
+_NO_LENGTH = -1
+
+
+class StringTable:
+    """
+    This class holds each distinct string once, the schema arrays refer to them by their position
+    """
+    __slots__ = ('_values', '_ids')
+
+    def __init__(self):
+        self._values: list[str] = list()
+        self._ids: dict[str, int] = dict()
+
+    def add(self, value: str) -> int:
+        """
+        This method returns the position of a string, adding it to the table if needed
+        """
+        sid = self._ids.get(value)
+        if sid is None:
+            sid = self._ids[value] = len(self._values)
+            self._values.append(value)
+        return sid
+
+    def find(self, value: str) -> int:
+        """
+        This method returns the position of a string, or -1 when it is not in the table
+        """
+        return self._ids.get(value, -1)
+
+    def __getitem__(self, sid: int) -> str:
+        return self._values[sid]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+def _span(starts: array, position: int, total: int) -> range:
+    """
+    This function returns the range of rows held by an entry, given the offset of the first row of each entry
+    """
+    end = starts[position + 1] if position + 1 < len(starts) else total
+    return range(starts[position], end)
+
+
+class _RowView:
+    """
+    This class is the base of the lightweight objects that read a row of a columnar schema. They
+    compare equal to the standard metadata object holding the same values.
+    """
+    __slots__ = ('_db', '_row')
+    _fields: tuple[str, ...] = ()
+
+    def __init__(self, db: 'ColumnarDatabaseMetadata', row: int):
+        self._db = db
+        self._row = row
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not all(hasattr(other, name) for name in self._fields):
+            return NotImplemented
+        return self._values() == tuple(getattr(other, name) for name in self._fields)
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{self.__class__.__name__}({values})"
+
+
+class ColumnarColumn(_RowView):
+    """
+    This class reads a table column of a columnar schema, it has the interface of ColumnMetadata
+    """
+    __slots__ = ()
+    _fields = ('name', 'data_type', 'length', 'is_nullable', 'is_unique', 'is_auto', 'is_primary')
+
+    @property
+    def name(self) -> str:
+        return self._db.strings[self._db._column_names[self._row]]
+
+    @property
+    def data_type(self) -> StandardDataType:
+        return self._db._column_type_values[self._db._column_types[self._row]]
+
+    @property
+    def length(self) -> int | None:
+        length = self._db._column_lengths[self._row]
+        return None if length == _NO_LENGTH else length
+
+    @property
+    def is_nullable(self) -> bool:
+        return bool(self._db._column_flags[self._row] & _NULLABLE)
+
+    @property
+    def is_unique(self) -> bool:
+        return bool(self._db._column_flags[self._row] & _UNIQUE)
+
+    @property
+    def is_auto(self) -> bool:
+        return bool(self._db._column_flags[self._row] & _AUTO)
+
+    @property
+    def is_primary(self) -> bool:
+        return bool(self._db._column_flags[self._row] & _PRIMARY)
+
+
+class ColumnarIndex(_RowView):
+    """
+    This class reads an index of a columnar schema, it has the interface of IndexMetadata
+    """
+    __slots__ = ()
+    _fields = ('name', 'columns', 'is_unique', 'is_primary')
+
+    @property
+    def name(self) -> str:
+        return self._db.strings[self._db._index_names[self._row]]
+
+    @property
+    def columns(self) -> list[str]:
+        db = self._db
+        return [db.strings[db._index_columns[row]]
+                for row in _span(db._index_column_starts, self._row, len(db._index_columns))]
+
+    @property
+    def is_unique(self) -> bool:
+        return bool(self._db._index_flags[self._row] & _UNIQUE)
+
+    @property
+    def is_primary(self) -> bool:
+        return bool(self._db._index_flags[self._row] & _PRIMARY)
+
+
+class ColumnarForeignKey(_RowView):
+    """
+    This class reads a foreign key of a columnar schema, it has the interface of ForeignKeyMetadata
+    """
+    __slots__ = ()
+    _fields = ('name', 'column', 'foreign_table', 'foreign_column')
+
+    @property
+    def name(self) -> str:
+        return self._db.strings[self._db._foreign_key_names[self._row]]
+
+    @property
+    def column(self) -> str:
+        return self._db.strings[self._db._foreign_key_columns[self._row]]
+
+    @property
+    def foreign_table(self) -> str:
+        return self._db.strings[self._db._foreign_key_tables[self._row]]
+
+    @property
+    def foreign_column(self) -> str:
+        return self._db.strings[self._db._foreign_key_foreign_columns[self._row]]
+
+
+class ColumnarViewColumn(_RowView):
+    """
+    This class reads a view column of a columnar schema, it has the interface of ViewColumnMetadata
+    """
+    __slots__ = ()
+    _fields = ('name', 'data_type', 'order', 'length')
+
+    @property
+    def name(self) -> str:
+        return self._db.strings[self._db._view_column_names[self._row]]
+
+    @property
+    def data_type(self) -> StandardDataType:
+        return self._db._view_column_type_values[self._db._view_column_types[self._row]]
+
+    @property
+    def order(self) -> int:
+        return self._db._view_column_orders[self._row]
+
+    @property
+    def length(self) -> int | None:
+        length = self._db._view_column_lengths[self._row]
+        return None if length == _NO_LENGTH else length
+
+
+class _ColumnsView(Mapping):
+    """
+    This class maps the names of a range of columns to the objects reading them
+    """
+    __slots__ = ('_db', '_rows', '_names', '_view_type')
+
+    def __init__(self, db: 'ColumnarDatabaseMetadata', rows: range, names: array, view_type: type):
+        self._db = db
+        self._rows = rows
+        self._names = names
+        self._view_type = view_type
+
+    def _find(self, name: typing.Any) -> int:
+        sid = self._db.strings.find(name) if isinstance(name, str) else -1
+        if sid >= 0:
+            try:
+                return self._names.index(sid, self._rows.start, self._rows.stop)
+            except ValueError:
+                pass
+        return -1
+
+    def __getitem__(self, name: str) -> typing.Any:
+        row = self._find(name)
+        if row < 0:
+            raise KeyError(name)
+        return self._view_type(self._db, row)
+
+    def __contains__(self, name: typing.Any) -> bool:
+        return self._find(name) >= 0
+
+    def __iter__(self) -> typing.Iterator[str]:
+        strings = self._db.strings
+        for row in self._rows:
+            yield strings[self._names[row]]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def values(self) -> typing.Iterator[typing.Any]:
+        for row in self._rows:
+            yield self._view_type(self._db, row)
+
+    def items(self) -> typing.Iterator[tuple[str, typing.Any]]:
+        for row in self._rows:
+            view = self._view_type(self._db, row)
+            yield view.name, view
+
+
+class ColumnarTable(_RowView):
+    """
+    This class reads a table of a columnar schema, it has the interface of TableMetaData
+    """
+    __slots__ = ()
+    _fields = ('name', 'columns', 'indexes', 'foreign_keys')
+
+    @property
+    def name(self) -> str:
+        return self._db.strings[self._db._table_names[self._row]]
+
+    @property
+    def columns(self) -> Mapping[str, ColumnarColumn]:
+        db = self._db
+        return _ColumnsView(db, _span(db._table_column_starts, self._row, len(db._column_names)),
+                            db._column_names, ColumnarColumn)
+
+    @property
+    def indexes(self) -> list[ColumnarIndex]:
+        db = self._db
+        return [ColumnarIndex(db, row) for row in _span(db._table_index_starts, self._row, len(db._index_names))]
+
+    @property
+    def foreign_keys(self) -> list[ColumnarForeignKey]:
+        db = self._db
+        return [ColumnarForeignKey(db, row)
+                for row in _span(db._table_foreign_key_starts, self._row, len(db._foreign_key_names))]
+
+    def _values(self) -> tuple:
+        return self.name, dict(self.columns.items()), self.indexes, self.foreign_keys
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not all(hasattr(other, name) for name in self._fields):
+            return NotImplemented
+        return self._values() == (other.name, dict(other.columns.items()), list(other.indexes),
+                                  list(other.foreign_keys))
+
+
+class ColumnarView(_RowView):
+    """
+    This class reads a view of a columnar schema, it has the interface of ViewMetaData
+    """
+    __slots__ = ()
+    _fields = ('name', 'columns')
+
+    @property
+    def name(self) -> str:
+        return self._db.strings[self._db._view_names[self._row]]
+
+    @property
+    def columns(self) -> Mapping[str, ColumnarViewColumn]:
+        db = self._db
+        return _ColumnsView(db, _span(db._view_column_starts, self._row, len(db._view_column_names)),
+                            db._view_column_names, ColumnarViewColumn)
+
+    def _values(self) -> tuple:
+        return self.name, dict(self.columns.items())
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not all(hasattr(other, name) for name in self._fields):
+            return NotImplemented
+        return self._values() == (other.name, dict(other.columns.items()))
+
+
+class _ObjectsView(Mapping):
+    """
+    This class maps the names of the tables or views of a columnar schema to the objects reading them
+    """
+    __slots__ = ('_db', '_positions', '_view_type')
+
+    def __init__(self, db: 'ColumnarDatabaseMetadata', positions: dict[str, int], view_type: type):
+        self._db = db
+        self._positions = positions
+        self._view_type = view_type
+
+    def __getitem__(self, name: str) -> typing.Any:
+        return self._view_type(self._db, self._positions[name])
+
+    def __contains__(self, name: typing.Any) -> bool:
+        return name in self._positions
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
+class ColumnarDatabaseMetadata(_ReadOnlyMetadata):
+    """
+    This class holds the metadata for a database with the columns of all the tables stored in parallel
+    arrays, rather than as one object per column. Each table refers to its rows through the offset of its
+    first column, index and foreign key, and the names are held once in a string table.
+
+    The tables and views must be added in order, each one followed by its own columns, indexes and
+    foreign keys. The tables and views properties give read-only objects with the interface of the
+    standard metadata classes.
+    """
+    _name: str
+    _type: DatabaseType
+
+    def __init__(self, name: str, database_type: DatabaseType):
+        self._name = name
+        self._type = database_type
+        self.strings = StringTable()
+
+        self._tables: dict[str, int] = dict()
+        self._table_names = array('i')
+        self._table_column_starts = array('i')
+        self._table_index_starts = array('i')
+        self._table_foreign_key_starts = array('i')
+
+        self._column_names = array('i')
+        self._column_types = array('B')
+        self._column_type_values: typing.Sequence[StandardDataType] = _DATA_TYPES
+        self._column_lengths = array('q')
+        self._column_flags = array('B')
+
+        self._index_names = array('i')
+        self._index_flags = array('B')
+        self._index_column_starts = array('i')
+        self._index_columns = array('i')
+
+        self._foreign_key_names = array('i')
+        self._foreign_key_columns = array('i')
+        self._foreign_key_tables = array('i')
+        self._foreign_key_foreign_columns = array('i')
+
+        self._views: dict[str, int] = dict()
+        self._view_names = array('i')
+        self._view_column_starts = array('i')
+
+        self._view_column_names = array('i')
+        self._view_column_types = array('B')
+        self._view_column_type_values: typing.Sequence[StandardDataType] = _DATA_TYPES
+        self._view_column_orders = array('i')
+        self._view_column_lengths = array('q')
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def type(self) -> DatabaseType:
+        return self._type
+
+    @property
+    def tables(self) -> Mapping[str, ColumnarTable]:
+        return _ObjectsView(self, self._tables, ColumnarTable)
+
+    @property
+    def views(self) -> Mapping[str, ColumnarView]:
+        return _ObjectsView(self, self._views, ColumnarView)
+
+    @property
+    def column_count(self) -> int:
+        return len(self._column_names)
+
+    # region Loading
+
+    def add_table(self, name: str) -> None:
+        self._tables[name] = len(self._table_names)
+        self._table_names.append(self.strings.add(name))
+        self._table_column_starts.append(len(self._column_names))
+        self._table_index_starts.append(len(self._index_names))
+        self._table_foreign_key_starts.append(len(self._foreign_key_names))
+
+    def add_column(self, name: str, data_type: StandardDataType | None, length: int | None = None,
+                   is_nullable: bool = False, is_unique: bool = False, is_auto: bool = False,
+                   is_primary: bool = False) -> None:
+        """
+        This method adds a column to the last table added, a data type of None is left to be set for all the
+        columns at once by set_column_types
+        """
+        self._column_names.append(self.strings.add(name))
+        if data_type is not None and self._column_type_values is not _DATA_TYPES:
+            self._column_types = self._standard_codes(self._column_types, self._column_type_values)
+            self._column_type_values = _DATA_TYPES
+        self._column_types.append(0 if data_type is None else _DATA_TYPE_CODES[data_type])
+        self._column_lengths.append(_NO_LENGTH if length is None else length)
+        self._column_flags.append((_NULLABLE if is_nullable else 0) | (_UNIQUE if is_unique else 0) |
+                                  (_AUTO if is_auto else 0) | (_PRIMARY if is_primary else 0))
+
+    def add_index(self, name: str, columns: list[str], is_unique: bool = False, is_primary: bool = False) -> None:
+        """
+        This method adds an index to the last table added
+        """
+        self._index_names.append(self.strings.add(name))
+        self._index_flags.append((_UNIQUE if is_unique else 0) | (_PRIMARY if is_primary else 0))
+        self._index_column_starts.append(len(self._index_columns))
+        self._index_columns.extend(self.strings.add(column) for column in columns)
+
+    def add_foreign_key(self, name: str, column: str, foreign_table: str, foreign_column: str) -> None:
+        """
+        This method adds a foreign key to the last table added
+        """
+        self._foreign_key_names.append(self.strings.add(name))
+        self._foreign_key_columns.append(self.strings.add(column))
+        self._foreign_key_tables.append(self.strings.add(foreign_table))
+        self._foreign_key_foreign_columns.append(self.strings.add(foreign_column))
+
+    def add_view(self, name: str) -> None:
+        self._views[name] = len(self._view_names)
+        self._view_names.append(self.strings.add(name))
+        self._view_column_starts.append(len(self._view_column_names))
+
+    def add_view_column(self, name: str, data_type: StandardDataType | None, order: int,
+                        length: int | None = None) -> None:
+        """
+        This method adds a column to the last view added, a data type of None is left to be set for all the
+        view columns at once by set_view_column_types
+        """
+        self._view_column_names.append(self.strings.add(name))
+        if data_type is not None and self._view_column_type_values is not _DATA_TYPES:
+            self._view_column_types = self._standard_codes(self._view_column_types, self._view_column_type_values)
+            self._view_column_type_values = _DATA_TYPES
+        self._view_column_types.append(0 if data_type is None else _DATA_TYPE_CODES[data_type])
+        self._view_column_orders.append(order)
+        self._view_column_lengths.append(_NO_LENGTH if length is None else length)
+
+    @staticmethod
+    def _standard_codes(types: array, values: typing.Sequence[StandardDataType]) -> array:
+        """
+        This method returns a data type column holding the positions of the standard data types, used when a
+        column with a data type of its own is added after the data types were set in one batch
+        """
+        codes = [_DATA_TYPE_CODES[data_type] for data_type in values]
+        return array('B', bytes(map(codes.__getitem__, types)))
+
+    @staticmethod
+    def _check_types(data_types: typing.Sequence[StandardDataType], inverse: array, rows: int) -> None:
+        if len(inverse) != rows:
+            raise ValueError(f"Expected a data type for each of the {rows} columns, found {len(inverse)}")
+        # Byte positions can not be out of range when there are 256 data types or more
+        if len(inverse) and not (inverse.typecode == 'B' and len(data_types) > 255) and \
+                max(inverse) >= len(data_types):
+            raise ValueError(f"Expected a data type position below {len(data_types)}, found {max(inverse)}")
+
+    def set_column_types(self, data_types: typing.Sequence[StandardDataType], inverse: array) -> None:
+        """
+        This method sets the data type of all the table columns at once, from the distinct data types and the
+        position of the data type of each column among them. The positions are kept as the data type column
+        rather than converted one column at a time, the only pass over them is the check that each position
+        is in range, which runs in C.
+        """
+        self._check_types(data_types, inverse, len(self._column_names))
+        self._column_type_values = tuple(data_types)
+        self._column_types = inverse
+
+    def set_view_column_types(self, data_types: typing.Sequence[StandardDataType], inverse: array) -> None:
+        """
+        This method sets the data type of all the view columns at once, from the distinct data types and the
+        position of the data type of each column among them
+        """
+        self._check_types(data_types, inverse, len(self._view_column_names))
+        self._view_column_type_values = tuple(data_types)
+        self._view_column_types = inverse
+
+    # endregion
+
+    # region Conversion
+
+    @classmethod
+    def from_metadata(cls, metadata: DatabaseMetadata) -> 'ColumnarDatabaseMetadata':
+        """
+        This method stores the standard metadata of a database in columns
+        """
+        db = cls(metadata.name, metadata.type)
+
+        for table in metadata.tables.values():
+            db.add_table(table.name)
+            for col in table.columns.values():
+                db.add_column(col.name, col.data_type, col.length, col.is_nullable, col.is_unique, col.is_auto,
+                              col.is_primary)
+            for index in table.indexes:
+                db.add_index(index.name, index.columns, index.is_unique, index.is_primary)
+            for key in table.foreign_keys:
+                db.add_foreign_key(key.name, key.column, key.foreign_table, key.foreign_column)
+
+        for view in metadata.views.values():
+            db.add_view(view.name)
+            for col in view.columns.values():
+                db.add_view_column(col.name, col.data_type, col.order, col.length)
+
+        return db
+
+    def to_metadata(self) -> DatabaseMetadata:
+        """
+        This method returns the schema as standard metadata objects
+        """
+        metadata = DatabaseMetadata(self._name, self._type)
+
+        for name, table in self.tables.items():
+            columns = {col.name: ColumnMetadata(col.name, col.data_type, col.length, col.is_nullable,
+                                                col.is_unique, col.is_auto, col.is_primary)
+                       for col in table.columns.values()}
+            indexes = [IndexMetadata(index.name, index.columns, index.is_unique, index.is_primary)
+                       for index in table.indexes]
+            foreign_keys = [ForeignKeyMetadata(key.name, key.column, key.foreign_table, key.foreign_column)
+                            for key in table.foreign_keys]
+            metadata.tables[name] = TableMetaData(name, columns, indexes, foreign_keys)
+
+        for name, view in self.views.items():
+            columns = {col.name: ViewColumnMetadata(col.name, col.data_type, col.order, col.length)
+                       for col in view.columns.values()}
+            metadata.views[name] = ViewMetaData(name, columns)
+
+        return metadata
+
+    # endregion
+
@@ -0,0 +1,178 @@
+# *******************************************************************************************
+#  File:  _diff.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['Changes', 'TableDiff', 'SchemaDiff', 'diff_schemas']
+
+import typing
+import attrs
+
+# The fields of a table or view that hold its parts, the others are compared as attributes
+_PARTS = ('columns', 'indexes', 'foreign_keys')
+
+
+@attrs.frozen
+class Changes:
+    """
+    This class holds the items added to, removed from and altered in a part of a table, the altered items
+    are given as pairs of the old and new item
+    """
+    added: list[typing.Any] = attrs.Factory(list)
+    removed: list[typing.Any] = attrs.Factory(list)
+    altered: list[tuple[typing.Any, typing.Any]] = attrs.Factory(list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.altered)
+
+
+@attrs.frozen
+class TableDiff:
+    """
+    This class holds the changes to a table or view. The attributes hold the old and new values of the
+    table fields that changed, other than its parts. A view has no indexes or foreign keys.
+    """
+    name: str
+    columns: Changes = attrs.Factory(Changes)
+    indexes: Changes = attrs.Factory(Changes)
+    foreign_keys: Changes = attrs.Factory(Changes)
+    attributes: dict[str, tuple[typing.Any, typing.Any]] = attrs.Factory(dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.columns or self.indexes or self.foreign_keys or self.attributes)
+
+
+@attrs.frozen
+class SchemaDiff:
+    """
+    This class holds the changes between two versions of a database schema
+    """
+    added_tables: list[str] = attrs.Factory(list)
+    removed_tables: list[str] = attrs.Factory(list)
+    altered_tables: dict[str, TableDiff] = attrs.Factory(dict)
+    added_views: list[str] = attrs.Factory(list)
+    removed_views: list[str] = attrs.Factory(list)
+    altered_views: dict[str, TableDiff] = attrs.Factory(dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added_tables or self.removed_tables or self.altered_tables or self.added_views or
+                    self.removed_views or self.altered_views)
+
+
+def _attribute_names(table: typing.Any) -> tuple[str, ...]:
+    """
+    This function returns the names of the fields of a table or view that are not its parts
+    """
+    return tuple(field.name for field in attrs.fields(type(table)) if field.init and field.name not in _PARTS)
+
+
+def _dict_changes(old: dict[str, typing.Any], new: dict[str, typing.Any]) -> Changes:
+    """
+    This function returns the changes to a part of a table keyed by name, such as the columns
+    """
+    if old == new:
+        return Changes()
+    return Changes([item for name, item in new.items() if name not in old],
+                   [item for name, item in old.items() if name not in new],
+                   [(item, new[name]) for name, item in old.items() if name in new and new[name] != item])
+
+
+def _list_changes(old: list[typing.Any], new: list[typing.Any]) -> Changes:
+    """
+    This function returns the changes to a part of a table held as a list, such as the indexes. Names are
+    not unique in every DBMS, so the items are matched by value and an item removed is paired with an
+    item added under the same name as an alteration.
+    """
+    if old == new:
+        return Changes()
+
+    added = list(new)
+    removed = list()
+    for item in old:
+        for position, candidate in enumerate(added):
+            if candidate == item:
+                del added[position]
+                break
+        else:
+            removed.append(item)
+
+    altered = list()
+    for item in list(removed):
+        for position, candidate in enumerate(added):
+            if candidate.name == item.name:
+                altered.append((item, candidate))
+                removed.remove(item)
+                del added[position]
+                break
+
+    return Changes(added, removed, altered)
+
+
+def _table_diff(old: typing.Any, new: typing.Any) -> TableDiff:
+    """
+    This function returns the changes between two versions of a table or view
+    """
+    attributes = {name: (getattr(old, name), getattr(new, name)) for name in _attribute_names(old)
+                  if name != 'name' and getattr(old, name) != getattr(new, name)}
+    return TableDiff(new.name, _dict_changes(old.columns, new.columns),
+                     _list_changes(getattr(old, 'indexes', []), getattr(new, 'indexes', [])),
+                     _list_changes(getattr(old, 'foreign_keys', []), getattr(new, 'foreign_keys', [])),
+                     attributes)
+
+
+def _diff_entries(old: typing.Mapping[str, typing.Any], new: typing.Mapping[str, typing.Any],
+                  fingerprint: typing.Callable[[typing.Any], typing.Any] | None) \
+        -> tuple[list[str], list[str], dict[str, TableDiff]]:
+    """
+    This function returns the names of the tables or views added and removed, and the changes to the
+    others. A table that is the same in both versions, or has the same fingerprint, is skipped.
+    """
+    added = [name for name in new if name not in old]
+    removed = [name for name in old if name not in new]
+
+    altered = dict()
+    for name, old_table in old.items():
+        new_table = new.get(name)
+        if new_table is None or new_table is old_table:
+            continue
+        if fingerprint is None:
+            if old_table == new_table:
+                continue
+        elif fingerprint(old_table) == fingerprint(new_table):
+            continue
+
+        diff = _table_diff(old_table, new_table)
+        if diff:
+            altered[name] = diff
+
+    return added, removed, altered
+
+
+def diff_schemas(old: typing.Any, new: typing.Any,
+                 fingerprint: typing.Callable[[typing.Any], typing.Any] | None = None) -> SchemaDiff:
+    """
+    This function returns the changes between two versions of a schema. It accepts a Database, a
+    DatabaseMetadata or any object with their interface whose tables and views are attrs classes.
+
+    :param old: The earlier version of the schema
+    :param new: The later version of the schema
+    :param fingerprint: Returns a structural hash of a table or view, when it is given the tables with the
+        same hash are skipped without comparing them, otherwise the tables are compared. The function
+        fingerprint hashes the tables on each call, a FingerprintCache kept by the caller hashes each of them
+        once, which suits a version compared many times.
+    """
+    added_tables, removed_tables, altered_tables = _diff_entries(old.tables, new.tables, fingerprint)
+    added_views, removed_views, altered_views = _diff_entries(old.views, new.views, fingerprint)
+    return SchemaDiff(added_tables, removed_tables, altered_tables, added_views, removed_views, altered_views)
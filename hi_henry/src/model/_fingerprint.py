@@ -0,0 +1,156 @@
+# *******************************************************************************************
+#  File:  _fingerprint.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['fingerprint', 'FingerprintCache']
+
+import functools
+import typing
+import weakref
+from enum import Enum
+from hashlib import blake2b
+from operator import attrgetter
+import attrs
+
+_DIGEST_SIZE = 16
+
+# Changes to the encoding must change the key, so that fingerprints kept from an earlier version are not reused
+_KEY = b'hi-henry.1'
+
+
+class _Plan:
+    """
+    This class holds how the fields of a schema class are read for its fingerprint. The parts held in the
+    dict and list fields are given by their fingerprint when they are made of other objects and by the
+    values of their fields otherwise, and the enums by their values.
+    """
+    __slots__ = ('tag', 'values', 'single', 'parts', 'enums', 'composite')
+
+    def __init__(self, cls: type):
+        fields = [field for field in attrs.fields(cls) if field.init]
+        self.tag = cls.__name__
+        self.values = attrgetter(*(field.name for field in fields))
+        self.single = len(fields) == 1
+
+        parts = list()
+        for position, field in enumerate(fields):
+            container = typing.get_origin(field.type)
+            if container in (dict, list):
+                item_type = typing.get_args(field.type)[-1]
+                if isinstance(item_type, type) and attrs.has(item_type):
+                    parts.append((position, container is dict, _plan(item_type)))
+        self.parts = tuple(parts)
+        self.enums = tuple(position for position, field in enumerate(fields)
+                           if isinstance(field.type, type) and issubclass(field.type, Enum))
+        self.composite = bool(parts)
+
+
+_plans: dict[type, _Plan] = dict()
+
+
+def _plan(cls: type) -> _Plan:
+    plan = _plans.get(cls)
+    if plan is None:
+        plan = _plans[cls] = _Plan(cls)
+    return plan
+
+
+def _encode(value: typing.Any, plan: _Plan) -> tuple:
+    """
+    This function returns the values that make up the fingerprint of an object
+    """
+    values = plan.values(value)
+    if plan.single:
+        values = (values,)
+    if not plan.parts and not plan.enums:
+        return values
+
+    values = list(values)
+    for position, is_mapping, item_plan in plan.parts:
+        if item_plan.composite:
+            encode = fingerprint
+        else:
+            encode = lambda item, item_plan=item_plan: _encode(item, item_plan)
+        items = values[position]
+        values[position] = (tuple(items), tuple(map(encode, items.values()))) if is_mapping else \
+            tuple(map(encode, items))
+    for position in plan.enums:
+        values[position] = getattr(values[position], 'value', values[position])
+    return tuple(values)
+
+
+def fingerprint(value: typing.Any) -> bytes:
+    """
+    This function returns a structural hash of a schema object, a BLAKE2 digest of the values of its fields
+    that is the same in every process and on every machine. The fingerprint of an object made of others is
+    computed from the fingerprints of its parts, a database from those of its tables and views. The columns,
+    indexes and foreign keys of a table can still be changed after it is built, so the fingerprint is not
+    kept with the object, a caller comparing a version many times keeps them in a FingerprintCache. Objects with the
+    same fingerprint compare equal, though objects that compare equal have different fingerprints when only
+    the order of their columns or tables differs.
+    """
+    plan = _plan(type(value))
+
+    # The repr of the strings, numbers, booleans, bytes and tuples held is the same in every process
+    return blake2b(repr((plan.tag, _encode(value, plan))).encode('UTF-8'), digest_size=_DIGEST_SIZE,
+                   key=_KEY).digest()
+
+
+class FingerprintCache:
+    """
+    This class keeps the fingerprints of the objects it is given, so a version of a schema compared many times,
+    as by diff_schemas(old, new, fingerprint=cache), hashes each of its tables once. The objects are looked up
+    by identity and dropped from the cache when they are collected. The columns, indexes and foreign keys of
+    a table can be changed in place, which the cache does not see, so a cache is used while the versions it
+    has seen are not changed, and cleared or replaced when they are.
+    """
+    _fingerprints: dict[int, tuple[weakref.ref, bytes]]
+
+    def __init__(self):
+        self._fingerprints = dict()
+
+    def _drop(self, key: int, ref: weakref.ref) -> None:
+        """
+        This method drops the fingerprint of a collected object
+        """
+        # The id of a collected object can be reused by an object cached since
+        entry = self._fingerprints.get(key)
+        if entry is not None and entry[0] is ref:
+            del self._fingerprints[key]
+
+    def __call__(self, value: typing.Any) -> bytes:
+        """
+        This method returns the fingerprint of an object, computed the first time the object is given
+        """
+        key = id(value)
+        entry = self._fingerprints.get(key)
+        if entry is not None and entry[0]() is value:
+            return entry[1]
+
+        digest = fingerprint(value)
+        try:
+            ref = weakref.ref(value, functools.partial(self._drop, key))
+        except TypeError:
+            # An object that can not be referred to weakly is not kept
+            return digest
+        self._fingerprints[key] = (ref, digest)
+        return digest
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def clear(self) -> None:
+        self._fingerprints.clear()
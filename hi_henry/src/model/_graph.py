@@ -0,0 +1,160 @@
+# *******************************************************************************************
+#  File:  _graph.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['ForeignKeyGraph', 'foreign_key_graph']
+
+import typing
+
+
+class ForeignKeyGraph:
+    """
+    This class holds the tables of a schema linked by their foreign keys. The tables a table references and
+    the tables that reference it are looked up by name. The tables are grouped into strongly connected
+    components, the groups of tables that reference each other through a cycle of foreign keys, and the
+    components are ordered so that the tables referenced by a table come before it.
+    """
+    _references: dict[str, tuple[str, ...]]
+    _referenced_by: dict[str, tuple[str, ...]]
+    _components: list[tuple[str, ...]]
+    _component_of: dict[str, int]
+
+    def __init__(self, tables: typing.Mapping[str, typing.Any]):
+        """
+        Initializes an instance of the class
+
+        :param tables: The tables of the schema, the foreign keys to tables not in the schema are ignored
+        """
+        references = {name: tuple(dict.fromkeys(key.foreign_table for key in table.foreign_keys
+                                                if key.foreign_table in tables))
+                      for name, table in tables.items()}
+
+        referenced_by: dict[str, list[str]] = {name: list() for name in references}
+        for name, targets in references.items():
+            for target in targets:
+                referenced_by[target].append(name)
+
+        self._references = references
+        self._referenced_by = {name: tuple(sources) for name, sources in referenced_by.items()}
+        self._components = self._find_components(references)
+        self._component_of = {name: position for position, component in enumerate(self._components)
+                              for name in component}
+
+    @staticmethod
+    def _find_components(references: dict[str, tuple[str, ...]]) -> list[tuple[str, ...]]:
+        """
+        This method returns the strongly connected components, using Tarjan's algorithm without recursion so
+        that long chains of foreign keys do not reach the recursion limit. A component is found after the
+        components it references, so they are returned in dependency order.
+        """
+        position = {name: order for order, name in enumerate(references)}
+        index: dict[str, int] = dict()
+        low: dict[str, int] = dict()
+        stack: list[str] = list()
+        on_stack: set[str] = set()
+        components: list[tuple[str, ...]] = list()
+
+        for root in references:
+            if root in index:
+                continue
+
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(references[root]))]
+
+            while work:
+                name, targets = work[-1]
+                for target in targets:
+                    if target not in index:
+                        index[target] = low[target] = len(index)
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(references[target])))
+                        break
+                    if target in on_stack and index[target] < low[name]:
+                        low[name] = index[target]
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if low[name] < low[parent]:
+                            low[parent] = low[name]
+
+                    if low[name] == index[name]:
+                        members = list()
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            members.append(member)
+                            if member == name:
+                                break
+                        members.sort(key=position.__getitem__)
+                        components.append(tuple(members))
+
+        return components
+
+    @property
+    def tables(self) -> typing.KeysView[str]:
+        return self._references.keys()
+
+    def references(self, table: str) -> tuple[str, ...]:
+        """
+        This method returns the tables referenced by the foreign keys of a table
+        """
+        return self._references[table]
+
+    def referenced_by(self, table: str) -> tuple[str, ...]:
+        """
+        This method returns the tables with foreign keys that reference a table
+        """
+        return self._referenced_by[table]
+
+    @property
+    def components(self) -> list[tuple[str, ...]]:
+        return self._components
+
+    def component(self, table: str) -> tuple[str, ...]:
+        """
+        This method returns the strongly connected component holding a table
+        """
+        return self._components[self._component_of[table]]
+
+    @property
+    def cycles(self) -> list[tuple[str, ...]]:
+        """
+        This property returns the components where the tables reference each other, including the tables
+        that reference themselves
+        """
+        return [component for component in self._components
+                if len(component) > 1 or component[0] in self._references[component[0]]]
+
+    @property
+    def topological_order(self) -> list[str]:
+        """
+        This property returns the tables ordered so that a table comes after the tables it references, the
+        tables of a cycle are given together in schema order
+        """
+        return [name for component in self._components for name in component]
+
+
+def foreign_key_graph(schema: typing.Any) -> ForeignKeyGraph:
+    """
+    This function builds the foreign key graph of a Database or DatabaseMetadata. The graph holds the
+    foreign keys as they were when it was built, as the tables of a schema can still be changed, so a new
+    graph is built on each call and a caller keeps it for as long as the schema is not changed.
+    """
+    return ForeignKeyGraph(schema.tables)
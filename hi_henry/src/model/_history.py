@@ -0,0 +1,236 @@
+# *******************************************************************************************
+#  File:  _history.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['HistoryEntry', 'SchemaHistory']
+
+import json
+import typing
+from bisect import bisect_right
+from pathlib import Path
+import attrs
+import pendulum
+from ._model import DatabaseType
+from ._standard import DatabaseMetadata
+from ._stream import _table_record, _view_record, _table, _view
+
+
+@attrs.frozen
+class HistoryEntry:
+    """
+    This class holds a version of a schema in its history, with the names of the tables and views added or
+    changed and removed since the version before
+    """
+    version: int = attrs.field(validator=[attrs.validators.instance_of(int)])
+    recorded_at: pendulum.DateTime = attrs.field(validator=[attrs.validators.instance_of(pendulum.DateTime)])
+    checkpoint: bool = attrs.field(default=False, validator=[attrs.validators.instance_of(bool)])
+    tables: list[str] = attrs.Factory(list)
+    removed_tables: list[str] = attrs.Factory(list)
+    views: list[str] = attrs.Factory(list)
+    removed_views: list[str] = attrs.Factory(list)
+
+
+def _changes(old: typing.Mapping[str, typing.Any], new: typing.Mapping[str, typing.Any]) -> tuple[list, list]:
+    """
+    This function returns the names of the entries added or changed and removed
+    """
+    changed = list()
+    for name, value in new.items():
+        old_value = old.get(name)
+        if old_value is not value and old_value != value:
+            changed.append(name)
+    return changed, [name for name in old if name not in new]
+
+
+def _applied_order(old: typing.Mapping[str, typing.Any], changed: list[str], removed: list[str]) -> list[str]:
+    """
+    This function returns the order of the entries given by applying the changes to the version before
+    """
+    names = dict.fromkeys(old)
+    for name in removed:
+        del names[name]
+    names.update(dict.fromkeys(changed))
+    return list(names)
+
+
+class SchemaHistory:
+    """
+    This class keeps the versions of the schema of a project in a log file. A version records only the
+    tables and views that changed since the version before, and every checkpoint_interval versions the
+    whole schema is recorded, so a version is rebuilt from the checkpoint before it and the changes after.
+    Each line of the log holds the entry of a version, which is read when the log is opened, and the
+    definitions, which are read when a version is rebuilt.
+    """
+    _file_name: Path
+    _checkpoint_interval: int
+    _entries: list[HistoryEntry]
+    _offsets: list[int]
+    _latest: DatabaseMetadata | None
+
+    def __init__(self, file_name: Path, checkpoint_interval: int = 16):
+        """
+        Initializes an instance of the class, reading the entries of the log when it exists
+
+        :param file_name: The log file
+        :param checkpoint_interval: The number of versions between versions recording the whole schema
+        """
+        if checkpoint_interval < 1:
+            raise ValueError(f"The checkpoint interval must be at least 1: {checkpoint_interval}")
+
+        self._file_name = file_name
+        self._checkpoint_interval = checkpoint_interval
+        self._entries = list()
+        self._offsets = list()
+        self._latest = None
+
+        if file_name.exists():
+            offset = 0
+            with open(file_name, 'rb') as f:
+                for line in f:
+                    self._entries.append(self._parse_entry(json.loads(line[:line.index(b'\t')])))
+                    self._offsets.append(offset)
+                    offset += len(line)
+
+    @staticmethod
+    def _parse_entry(data: dict[str, typing.Any]) -> HistoryEntry:
+        return HistoryEntry(data['version'], pendulum.parse(data['recorded_at']), data['checkpoint'], data['tables'],
+                            data['removed_tables'], data['views'], data['removed_views'])
+
+    def _body(self, version: int) -> dict[str, typing.Any]:
+        with open(self._file_name, 'rb') as f:
+            f.seek(self._offsets[version - 1])
+            line = f.readline()
+        return json.loads(line[line.index(b'\t') + 1:])
+
+    @property
+    def entries(self) -> list[HistoryEntry]:
+        return self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(self, schema: DatabaseMetadata, recorded_at: pendulum.DateTime | None = None) -> HistoryEntry:
+        """
+        This method adds a version of the schema to the log, it accepts any object with the interface of
+        DatabaseMetadata
+
+        :param schema: The schema
+        :param recorded_at: The time of the version, now when not given, it can not be before the time of the
+            last version as the versions are looked up by time
+        :return: The entry of the version
+        """
+        recorded_at = recorded_at or pendulum.now()
+        if self._entries and recorded_at < self._entries[-1].recorded_at:
+            raise ValueError(f"The version can not be recorded before the last one, at "
+                             f"{self._entries[-1].recorded_at.to_iso8601_string()}: {recorded_at.to_iso8601_string()}")
+
+        previous = self.latest()
+        version = len(self._entries) + 1
+        checkpoint = previous is None or (version - 1) % self._checkpoint_interval == 0
+        old_tables = dict() if previous is None else previous.tables
+        old_views = dict() if previous is None else previous.views
+
+        tables, removed_tables = _changes(old_tables, schema.tables)
+        views, removed_views = _changes(old_views, schema.views)
+        entry = HistoryEntry(version, recorded_at, checkpoint, tables, removed_tables, views, removed_views)
+
+        body = {'database': schema.name, 'type': schema.type.value}
+        if checkpoint:
+            body['tables'] = [_table_record(table) for table in schema.tables.values()]
+            body['views'] = [_view_record(view) for view in schema.views.values()]
+        else:
+            body['tables'] = [_table_record(schema.tables[name]) for name in tables]
+            body['views'] = [_view_record(schema.views[name]) for name in views]
+            if _applied_order(old_tables, tables, removed_tables) != list(schema.tables):
+                body['table_order'] = list(schema.tables)
+            if _applied_order(old_views, views, removed_views) != list(schema.views):
+                body['view_order'] = list(schema.views)
+
+        header = attrs.asdict(entry)
+        header['recorded_at'] = entry.recorded_at.to_iso8601_string()
+        with open(self._file_name, 'ab') as f:
+            offset = f.tell()
+            f.write(f"{json.dumps(header)}\t{json.dumps(body)}\n".encode('utf-8'))
+
+        self._entries.append(entry)
+        self._offsets.append(offset)
+        # The latest version is rebuilt from the records written, the schema given can still be changed by the caller
+        written_tables = {record['table']: _table(record) for record in body['tables']}
+        written_views = {record['view']: _view(record) for record in body['views']}
+        self._latest = DatabaseMetadata(schema.name, schema.type,
+                                        {name: written_tables.get(name) or old_tables[name] for name in schema.tables},
+                                        {name: written_views.get(name) or old_views[name] for name in schema.views})
+        return entry
+
+    def version(self, version: int) -> DatabaseMetadata:
+        """
+        This method rebuilds a version of the schema from the checkpoint before it and the changes after
+        """
+        if not 1 <= version <= len(self._entries):
+            raise ValueError(f"The history holds versions 1 to {len(self._entries)}: {version}")
+
+        start = version
+        while not self._entries[start - 1].checkpoint:
+            start -= 1
+
+        tables: dict[str, dict] = dict()
+        views: dict[str, dict] = dict()
+        body = dict()
+        for number in range(start, version + 1):
+            entry = self._entries[number - 1]
+            body = self._body(number)
+            if number > start:
+                for name in entry.removed_tables:
+                    del tables[name]
+                for name in entry.removed_views:
+                    del views[name]
+            tables.update((record['table'], record) for record in body['tables'])
+            views.update((record['view'], record) for record in body['views'])
+            if 'table_order' in body:
+                tables = {name: tables[name] for name in body['table_order']}
+            if 'view_order' in body:
+                views = {name: views[name] for name in body['view_order']}
+
+        return DatabaseMetadata(body['database'], DatabaseType(body['type']),
+                                {name: _table(record) for name, record in tables.items()},
+                                {name: _view(record) for name, record in views.items()})
+
+    def latest(self) -> DatabaseMetadata | None:
+        """
+        This method returns the last version of the schema, or None when the history is empty
+        """
+        if self._latest is None and self._entries:
+            self._latest = self.version(len(self._entries))
+        return self._latest
+
+    def at(self, moment: pendulum.DateTime) -> DatabaseMetadata | None:
+        """
+        This method returns the version of the schema current at a time, or None when the history starts after it
+        """
+        version = bisect_right(self._entries, moment, key=lambda entry: entry.recorded_at)
+        return self.version(version) if version else None
+
+    def since(self, moment: pendulum.DateTime) -> list[HistoryEntry]:
+        """
+        This method returns the entries of the versions recorded after a time
+        """
+        return self._entries[bisect_right(self._entries, moment, key=lambda entry: entry.recorded_at):]
+
+    def table_changes(self, name: str) -> list[HistoryEntry]:
+        """
+        This method returns the entries of the versions where a table was added, changed or removed
+        """
+        return [entry for entry in self._entries if name in entry.tables or name in entry.removed_tables]
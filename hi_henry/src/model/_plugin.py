@@ -16,7 +16,7 @@ __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 
-__all__ = ['IConnection', 'IDatabaseExplorer', 'IPluginInterface', 'CreateExplorerPluginFunction']
+__all__ = ['IConnection', 'IDatabaseExplorer', 'IPluginInterface', 'CreateExplorerPluginFunction', 'ConnectionFactory']
 
 import typing
 from ._schema_interface import IDatabase
@@ -68,3 +68,5 @@ class IPluginInterface(typing.Protocol):
 
 
 CreateExplorerPluginFunction: typing.TypeAlias = typing.Callable[..., IDatabaseExplorer]
+
+ConnectionFactory: typing.TypeAlias = typing.Callable[[IConnection], typing.Any]
@@ -0,0 +1,171 @@
+# *******************************************************************************************
+#  File:  _query.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['SchemaQuery', 'schema_query']
+
+import typing
+from itertools import compress
+from operator import attrgetter
+
+# The column fields held as flags, their index holds the ids of the columns where the flag is set and not set
+_FLAGS = ('is_nullable', 'is_unique', 'is_auto', 'is_primary')
+
+
+class SchemaQuery:
+    """
+    This class finds the columns and tables of a schema that match a filter. The lookups use secondary
+    indexes over the columns, by name, data type and flags, and over the tables, each built the first time
+    a filter uses it, so a query reads only the columns that match. The indexes hold the schema as it was
+    when they were built, so a new query object is made after the schema is changed.
+    """
+    _schema: typing.Any
+    _columns: list[typing.Any] | None
+    _column_tables: list[str] | None
+    _table_names: list[str] | None
+    _indexes: dict[str, dict[typing.Any, set[int]]]
+
+    def __init__(self, schema: typing.Any):
+        """
+        Initializes an instance of the class
+
+        :param schema: A Database, DatabaseMetadata or any object with their interface
+        """
+        self._schema = schema
+        self._columns = None
+        self._column_tables = None
+        self._table_names = None
+        self._indexes = dict()
+
+    def _all_columns(self) -> list[typing.Any]:
+        """
+        This method returns the columns of the schema, the position of a column in the list is its id in the
+        indexes
+        """
+        if self._columns is None:
+            tables = self._schema.tables.values()
+            self._columns = [col for table in tables for col in table.columns.values()]
+            self._column_tables = [table.name for table in tables for _ in range(len(table.columns))]
+        return self._columns
+
+    def _column_index(self, key: str) -> dict[typing.Any, set[int]]:
+        """
+        This method returns the ids of the columns for each value of a column field
+        """
+        index = self._indexes.get(key)
+        if index is not None:
+            return index
+
+        columns = self._all_columns()
+        if key == 'indexed':
+            index = self._index_membership()
+        elif key in _FLAGS:
+            flagged = set(compress(range(len(columns)), map(attrgetter(key), columns)))
+            index = {True: flagged, False: set(range(len(columns))).difference(flagged)}
+        else:
+            values = map(attrgetter('name'), columns) if key == 'lower_name' else map(attrgetter(key), columns)
+            if key == 'lower_name':
+                values = map(str.lower, values)
+            index = dict()
+            for cid, value in enumerate(values):
+                ids = index.get(value)
+                if ids is None:
+                    ids = index[value] = set()
+                ids.add(cid)
+
+        self._indexes[key] = index
+        return index
+
+    def _index_membership(self) -> dict[bool, set[int]]:
+        """
+        This method returns the ids of the columns used and not used by an index of their table
+        """
+        indexed = set()
+        cid = 0
+        for table in self._schema.tables.values():
+            names = {name for table_index in table.indexes for name in table_index.columns}
+            if names:
+                indexed.update(position for position, col_name in enumerate(table.columns, cid) if col_name in names)
+            cid += len(table.columns)
+        return {True: indexed, False: set(range(cid)).difference(indexed)}
+
+    def _table_index(self, key: str) -> dict[typing.Any, set[int]]:
+        """
+        This method returns the positions of the tables for each value of a table property
+        """
+        index = self._indexes.get(key)
+        if index is None:
+            if self._table_names is None:
+                self._table_names = list(self._schema.tables)
+            index = self._indexes[key] = {True: set(), False: set()}
+            for position, table in enumerate(self._schema.tables.values()):
+                if key == 'has_primary_key':
+                    value = any(col.is_primary for col in table.columns.values()) or \
+                        any(table_index.is_primary for table_index in table.indexes)
+                else:
+                    value = bool(table.foreign_keys)
+                index[value].add(position)
+        return index
+
+    def columns(self, name: str | None = None, data_type: typing.Any = None, is_nullable: bool | None = None,
+                is_unique: bool | None = None, is_auto: bool | None = None, is_primary: bool | None = None,
+                indexed: bool | None = None, ignore_case: bool = False) -> list[tuple[str, typing.Any]]:
+        """
+        This method returns the table name and column of the columns that match all the values given, in
+        schema order
+
+        :param name: The name of the column
+        :param data_type: The data type, a standard data type for standard metadata
+        :param is_nullable: Whether the column allows nulls
+        :param is_unique: Whether the column is unique
+        :param is_auto: Whether the column value is generated
+        :param is_primary: Whether the column is part of the primary key
+        :param indexed: Whether the column is used by an index of its table
+        :param ignore_case: Matches the column name without regard to case
+        """
+        filters = {'lower_name' if ignore_case else 'name': name.lower() if ignore_case and name else name,
+                   'data_type': data_type, 'is_nullable': is_nullable, 'is_unique': is_unique, 'is_auto': is_auto,
+                   'is_primary': is_primary, 'indexed': indexed}
+        postings = [self._column_index(key).get(value, set()) for key, value in filters.items() if value is not None]
+        columns, column_tables = self._all_columns(), self._column_tables
+        if not postings:
+            return list(zip(column_tables, columns))
+
+        postings.sort(key=len)
+        ids = postings[0].intersection(*postings[1:])
+        return [(column_tables[cid], columns[cid]) for cid in sorted(ids)]
+
+    def tables(self, has_primary_key: bool | None = None, has_foreign_keys: bool | None = None) -> list[str]:
+        """
+        This method returns the names of the tables that match all the values given, in schema order
+        """
+        postings = [self._table_index(key)[value] for key, value in
+                    (('has_primary_key', has_primary_key), ('has_foreign_keys', has_foreign_keys))
+                    if value is not None]
+        if not postings:
+            return list(self._schema.tables)
+
+        postings.sort(key=len)
+        positions = postings[0].intersection(*postings[1:])
+        return [self._table_names[position] for position in sorted(positions)]
+
+
+def schema_query(schema: typing.Any) -> SchemaQuery:
+    """
+    This function returns a new query object for a Database or DatabaseMetadata, the caller keeps it to reuse
+    its indexes for as long as the schema is not changed
+    """
+    return SchemaQuery(schema)
@@ -0,0 +1,384 @@
+# *******************************************************************************************
+#  File:  _snapshot.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['SchemaSnapshot', 'dump_snapshot', 'write_snapshot']
+
+import mmap
+import struct
+import typing
+import zlib
+from collections.abc import Mapping
+from pathlib import Path
+from ._model import DatabaseType
+from ._data_type_map import StandardDataType
+from ._standard import _ReadOnlyMetadata, DatabaseMetadata, TableMetaData, ColumnMetadata, IndexMetadata, \
+    ForeignKeyMetadata, ViewMetaData, ViewColumnMetadata
+from ._columnar import StringTable, _NULLABLE, _UNIQUE, _AUTO, _PRIMARY, _NO_LENGTH
+
+# A snapshot file starts with a header giving the position and size of each section. The strings are held
+# once, in UTF-8, and the records refer to them by their position. All the records of a section have the
+# same size, so the record for a table, and from it the records for its columns, indexes and foreign keys,
+# are read at a computed offset without reading the rest of the file. The tables and views are found by name
+# through a hash table of their positions, so a lookup reads only the names in its probe sequence.
+_MAGIC = b'HHSCHEMA'
+_VERSION = 2
+
+_SECTIONS = ('strings', 'string_data', 'data_types', 'tables', 'columns', 'indexes', 'index_columns',
+             'foreign_keys', 'views', 'view_columns', 'table_slots', 'view_slots')
+
+# magic, version, name, database type and the offset and count of each section
+_HEADER = struct.Struct('<8sH2xII' + 'QI' * len(_SECTIONS))
+
+_STRING_OFFSET = struct.Struct('<I')
+_STRING_SPAN = struct.Struct('<II')
+_DATA_TYPE = struct.Struct('<I')
+# name, first column, column count, first index, index count, first foreign key, foreign key count
+_TABLE = struct.Struct('<7I')
+# length, name, data type, flags
+_COLUMN = struct.Struct('<qIBB2x')
+# name, first column name, column count, flags
+_INDEX = struct.Struct('<IIIB3x')
+_INDEX_COLUMN = struct.Struct('<I')
+# name, column, foreign table, foreign column
+_FOREIGN_KEY = struct.Struct('<4I')
+# name, first column, column count
+_VIEW = struct.Struct('<3I')
+# length, name, order, data type
+_VIEW_COLUMN = struct.Struct('<qIIB3x')
+# position + 1 of the entry whose name hashes to the slot, or 0 for an empty slot
+_SLOT = struct.Struct('<I')
+
+_ALIGNMENT = 8
+
+
+def _length(value: int | None) -> int:
+    return _NO_LENGTH if value is None else value
+
+
+def _name_hash(name: str) -> int:
+    return zlib.crc32(name.encode('UTF-8'))
+
+
+def _name_slots(names: typing.Iterable[str]) -> tuple[bytes, int]:
+    """
+    This function returns the hash table giving the position of each name, using linear probing in a table at
+    least twice the size of the number of names
+    """
+    names = list(names)
+    size = 1 << (2 * len(names)).bit_length()
+    mask = size - 1
+    slots = [0] * size
+    for position, name in enumerate(names):
+        slot = _name_hash(name) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = position + 1
+    return struct.pack(f"<{size}I", *slots), size
+
+
+def dump_snapshot(schema: DatabaseMetadata) -> bytes:
+    """
+    This function returns the snapshot of a schema in the standard format, it accepts any object with the
+    interface of DatabaseMetadata
+    """
+    strings = StringTable()
+    add = strings.add
+    data_types: dict[StandardDataType, int] = dict()
+
+    def type_code(data_type: StandardDataType) -> int:
+        code = data_types.get(data_type)
+        if code is None:
+            code = data_types[data_type] = len(data_types)
+        return code
+
+    name_sid = add(schema.name)
+    type_sid = add(schema.type.value)
+
+    tables, columns, indexes, index_columns, foreign_keys = list(), list(), list(), list(), list()
+    for table in schema.tables.values():
+        tables.append(_TABLE.pack(add(table.name), len(columns), len(table.columns), len(indexes),
+                                  len(table.indexes), len(foreign_keys), len(table.foreign_keys)))
+        for col in table.columns.values():
+            flags = (_NULLABLE if col.is_nullable else 0) | (_UNIQUE if col.is_unique else 0) | \
+                    (_AUTO if col.is_auto else 0) | (_PRIMARY if col.is_primary else 0)
+            columns.append(_COLUMN.pack(_length(col.length), add(col.name), type_code(col.data_type), flags))
+        for index in table.indexes:
+            flags = (_UNIQUE if index.is_unique else 0) | (_PRIMARY if index.is_primary else 0)
+            indexes.append(_INDEX.pack(add(index.name), len(index_columns), len(index.columns), flags))
+            index_columns.extend(_INDEX_COLUMN.pack(add(column)) for column in index.columns)
+        for key in table.foreign_keys:
+            foreign_keys.append(_FOREIGN_KEY.pack(add(key.name), add(key.column), add(key.foreign_table),
+                                                  add(key.foreign_column)))
+
+    views, view_columns = list(), list()
+    for view in schema.views.values():
+        views.append(_VIEW.pack(add(view.name), len(view_columns), len(view.columns)))
+        for col in view.columns.values():
+            view_columns.append(_VIEW_COLUMN.pack(_length(col.length), add(col.name), col.order,
+                                                  type_code(col.data_type)))
+
+    if len(data_types) > 256:
+        raise ValueError(f"A snapshot holds at most 256 data types: {len(data_types)}")
+
+    data_type_records = [_DATA_TYPE.pack(add(data_type.value)) for data_type in data_types]
+
+    encoded = [strings[sid].encode('UTF-8') for sid in range(len(strings))]
+    string_offsets = [0] * (len(encoded) + 1)
+    position = 0
+    for sid, value in enumerate(encoded):
+        position += len(value)
+        string_offsets[sid + 1] = position
+    if position > 0xFFFFFFFF:
+        raise ValueError(f"The strings of a snapshot are limited to 4 GB: {position}")
+
+    sections = {
+        'strings': (struct.pack(f"<{len(string_offsets)}I", *string_offsets), len(encoded)),
+        'string_data': (b''.join(encoded), position),
+        'data_types': (b''.join(data_type_records), len(data_type_records)),
+        'tables': (b''.join(tables), len(tables)),
+        'columns': (b''.join(columns), len(columns)),
+        'indexes': (b''.join(indexes), len(indexes)),
+        'index_columns': (b''.join(index_columns), len(index_columns)),
+        'foreign_keys': (b''.join(foreign_keys), len(foreign_keys)),
+        'views': (b''.join(views), len(views)),
+        'view_columns': (b''.join(view_columns), len(view_columns)),
+        'table_slots': _name_slots(schema.tables),
+        'view_slots': _name_slots(schema.views),
+    }
+
+    body = list()
+    locations = list()
+    offset = _HEADER.size
+    for name in _SECTIONS:
+        data, count = sections[name]
+        padding = -offset % _ALIGNMENT
+        body.append(b'\0' * padding)
+        offset += padding
+        locations.extend((offset, count))
+        body.append(data)
+        offset += len(data)
+
+    return _HEADER.pack(_MAGIC, _VERSION, name_sid, type_sid, *locations) + b''.join(body)
+
+
+def write_snapshot(schema: DatabaseMetadata, file_name: Path) -> None:
+    """
+    This function writes the snapshot of a schema in the standard format to a file
+    """
+    Path(file_name).write_bytes(dump_snapshot(schema))
+
+
+class _SnapshotEntries(Mapping):
+    """
+    This class maps the names of the tables or views held in a snapshot to their metadata, which is read
+    from the snapshot each time an entry is used
+    """
+    __slots__ = ('_count', '_name_at', '_find', '_read')
+
+    def __init__(self, count: int, name_at: typing.Callable[[int], str], find: typing.Callable[[str], int | None],
+                 read: typing.Callable[[int], typing.Any]):
+        self._count = count
+        self._name_at = name_at
+        self._find = find
+        self._read = read
+
+    def __getitem__(self, name: str) -> typing.Any:
+        position = self._find(name)
+        if position is None:
+            raise KeyError(name)
+        return self._read(position)
+
+    def __contains__(self, name: typing.Any) -> bool:
+        return isinstance(name, str) and self._find(name) is not None
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return map(self._name_at, range(self._count))
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class SchemaSnapshot(_ReadOnlyMetadata):
+    """
+    This class reads a schema snapshot. The header is read when the snapshot is opened, a table or view is
+    read from its fixed size records when it is used, so looking at one table of a large snapshot does not
+    read the others. A snapshot file is read through a memory map.
+    """
+    _buffer: typing.Any
+    _file: typing.BinaryIO | None
+    _sections: dict[str, tuple[int, int]]
+    _strings: dict[int, str]
+    _data_types: list[StandardDataType]
+    _tables: _SnapshotEntries
+    _views: _SnapshotEntries
+
+    def __init__(self, buffer: typing.Any):
+        """
+        Initializes an instance of the class
+
+        :param buffer: The snapshot, as bytes or a memory map
+        """
+        if len(buffer) < _HEADER.size:
+            raise ValueError("The buffer is too short to hold a schema snapshot")
+
+        values = _HEADER.unpack_from(buffer, 0)
+        if values[0] != _MAGIC:
+            raise ValueError("The buffer does not hold a schema snapshot")
+        if values[1] != _VERSION:
+            raise ValueError(f"The schema snapshot version is not supported: {values[1]}")
+
+        self._buffer = buffer
+        self._file = None
+        self._sections = {name: (values[4 + 2 * position], values[5 + 2 * position])
+                          for position, name in enumerate(_SECTIONS)}
+        self._strings = dict()
+
+        self._name = self._string(values[2])
+        self._type = DatabaseType(self._string(values[3]))
+
+        offset, count = self._sections['data_types']
+        self._data_types = [StandardDataType(self._string(sid))
+                            for sid, in _DATA_TYPE.iter_unpack(buffer[offset:offset + count * _DATA_TYPE.size])]
+
+        self._tables = _SnapshotEntries(self._sections['tables'][1], self._table_name,
+                                        lambda name: self._find('table_slots', self._table_name, name), self._table)
+        self._views = _SnapshotEntries(self._sections['views'][1], self._view_name,
+                                       lambda name: self._find('view_slots', self._view_name, name), self._view)
+
+    @classmethod
+    def open(cls, file_name: Path) -> 'SchemaSnapshot':
+        """
+        This method opens a snapshot file, the file stays open until the snapshot is closed
+        """
+        file = open(file_name, 'rb')
+        try:
+            snapshot = cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        except Exception:
+            file.close()
+            raise
+        snapshot._file = file
+        return snapshot
+
+    def close(self) -> None:
+        """
+        This method closes the snapshot file, if the snapshot was opened from one
+        """
+        if self._file is not None:
+            self._buffer.close()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'SchemaSnapshot':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def type(self) -> DatabaseType:
+        return self._type
+
+    @property
+    def tables(self) -> Mapping[str, TableMetaData]:
+        return self._tables
+
+    @property
+    def views(self) -> Mapping[str, ViewMetaData]:
+        return self._views
+
+    def _string(self, sid: int) -> str:
+        """
+        This method returns a string held in the snapshot, it is decoded the first time it is read
+        """
+        value = self._strings.get(sid)
+        if value is None:
+            offset = self._sections['strings'][0] + sid * _STRING_OFFSET.size
+            start, end = _STRING_SPAN.unpack_from(self._buffer, offset)
+            data = self._sections['string_data'][0]
+            value = self._strings[sid] = str(self._buffer[data + start:data + end], 'UTF-8')
+        return value
+
+    def _records(self, section: str, record: struct.Struct, start: int, count: int) -> typing.Iterator[tuple]:
+        """
+        This method returns the values of a run of records in a section
+        """
+        offset = self._sections[section][0] + start * record.size
+        return record.iter_unpack(self._buffer[offset:offset + count * record.size])
+
+    def _table_name(self, position: int) -> str:
+        return self._string(_TABLE.unpack_from(self._buffer, self._sections['tables'][0] +
+                                               position * _TABLE.size)[0])
+
+    def _view_name(self, position: int) -> str:
+        return self._string(_VIEW.unpack_from(self._buffer, self._sections['views'][0] + position * _VIEW.size)[0])
+
+    def _find(self, section: str, name_at: typing.Callable[[int], str], name: str) -> int | None:
+        """
+        This method returns the position of the table or view with a name, or None when there is none
+        """
+        offset, size = self._sections[section]
+        mask = size - 1
+        slot = _name_hash(name) & mask
+        while True:
+            entry, = _SLOT.unpack_from(self._buffer, offset + slot * _SLOT.size)
+            if not entry:
+                return None
+            if name_at(entry - 1) == name:
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def _table(self, position: int) -> TableMetaData:
+        name_sid, column_start, column_count, index_start, index_count, key_start, key_count = \
+            _TABLE.unpack_from(self._buffer, self._sections['tables'][0] + position * _TABLE.size)
+        string, data_types = self._string, self._data_types
+
+        columns = dict()
+        for length, sid, code, flags in self._records('columns', _COLUMN, column_start, column_count):
+            name = string(sid)
+            columns[name] = ColumnMetadata(name, data_types[code], None if length == _NO_LENGTH else length,
+                                           bool(flags & _NULLABLE), bool(flags & _UNIQUE), bool(flags & _AUTO),
+                                           bool(flags & _PRIMARY))
+
+        indexes = list()
+        for sid, start, count, flags in self._records('indexes', _INDEX, index_start, index_count):
+            index_columns = [string(column) for column, in self._records('index_columns', _INDEX_COLUMN, start,
+                                                                          count)]
+            indexes.append(IndexMetadata(string(sid), index_columns, bool(flags & _UNIQUE), bool(flags & _PRIMARY)))
+
+        foreign_keys = [ForeignKeyMetadata(string(sid), string(column), string(foreign_table), string(foreign_column))
+                        for sid, column, foreign_table, foreign_column in
+                        self._records('foreign_keys', _FOREIGN_KEY, key_start, key_count)]
+
+        return TableMetaData(string(name_sid), columns, indexes, foreign_keys)
+
+    def _view(self, position: int) -> ViewMetaData:
+        name_sid, column_start, column_count = _VIEW.unpack_from(self._buffer, self._sections['views'][0] +
+                                                                 position * _VIEW.size)
+        string, data_types = self._string, self._data_types
+
+        columns = dict()
+        for length, sid, order, code in self._records('view_columns', _VIEW_COLUMN, column_start, column_count):
+            name = string(sid)
+            columns[name] = ViewColumnMetadata(name, data_types[code], order,
+                                               None if length == _NO_LENGTH else length)
+
+        return ViewMetaData(string(name_sid), columns)
+
@@ -18,9 +18,12 @@ __status__ = "Production"
 __all__ = ['DatabaseMetadata', 'TableMetaData', 'ColumnMetadata', 'IndexMetadata', 'ForeignKeyMetadata',
            'ViewMetaData', 'ViewColumnMetadata']
 
+import typing
 import attrs
 from ._model import DatabaseType
 from ._data_type_map import StandardDataType
+from ._graph import ForeignKeyGraph, foreign_key_graph
+from ._query import SchemaQuery, schema_query
 
 
 @attrs.frozen
@@ -101,3 +104,45 @@ class DatabaseMetadata:
     type: DatabaseType
     tables: dict[str, TableMetaData] = attrs.Factory(dict)
     views: dict[str, ViewMetaData] = attrs.Factory(dict)
+
+    def build_foreign_key_graph(self) -> ForeignKeyGraph:
+        """
+        This method builds the foreign key graph of the tables, which answers its lookups from the maps built
+        here. Building it reads the whole schema, so the caller keeps the graph while the schema is unchanged.
+        """
+        return foreign_key_graph(self)
+
+    def build_query(self) -> SchemaQuery:
+        """
+        This method returns a new query object for the schema, which builds its indexes on first use. The
+        caller keeps the query to reuse them while the schema is unchanged.
+        """
+        return schema_query(self)
+
+
+class _ReadOnlySchema:
+    """
+    This class gives the schemas read from a store or a database, which have the interface of DatabaseMetadata
+    or Database, the comparison of the models they stand in for
+    """
+    __slots__ = ()
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not all(hasattr(other, name) for name in ('name', 'type', 'tables', 'views')):
+            return NotImplemented
+        return self.name == other.name and self.type == other.type and \
+            dict(self.tables.items()) == dict(other.tables.items()) and \
+            dict(self.views.items()) == dict(other.views.items())
+
+
+class _ReadOnlyMetadata(_ReadOnlySchema):
+    """
+    This class gives the schemas with the interface of DatabaseMetadata their conversion to the standard metadata
+    """
+    __slots__ = ()
+
+    def to_metadata(self) -> DatabaseMetadata:
+        """
+        This method reads the whole schema into the standard metadata
+        """
+        return DatabaseMetadata(self.name, self.type, dict(self.tables.items()), dict(self.views.items()))
@@ -0,0 +1,227 @@
+# *******************************************************************************************
+#  File:  _store.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['SchemaStore']
+
+import copy
+import json
+import os
+import typing
+import weakref
+from pathlib import Path
+from urllib.parse import quote, unquote
+import attrs
+from ._model import DatabaseType
+from ._standard import DatabaseMetadata, TableMetaData, ViewMetaData
+from ._fingerprint import fingerprint
+from ._stream import _table_record, _view_record, _table, _view
+
+
+def _read_only(*args, **kwargs) -> typing.NoReturn:
+    raise TypeError("The definitions loaded from a schema store are shared between the schemas and can not be "
+                    "changed, replace the table or view instead")
+
+
+class _ReadOnlyList(list):
+    """
+    This class holds a list shared by the definitions loaded from a store, a copy of it is a plain list
+    """
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return copy.deepcopy(list(self), memo)
+
+    def __reduce__(self) -> tuple:
+        return list, (list(self),)
+
+
+class _ReadOnlyDict(dict):
+    """
+    This class holds a dict shared by the definitions loaded from a store, a copy of it is a plain dict
+    """
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    pop = popitem = setdefault = update = clear = _read_only
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self) -> tuple:
+        return dict, (dict(self),)
+
+
+def _shared_table(table: TableMetaData) -> TableMetaData:
+    """
+    This function returns a table whose columns, indexes and foreign keys can not be changed
+    """
+    indexes = [attrs.evolve(index, columns=_ReadOnlyList(index.columns)) for index in table.indexes]
+    return attrs.evolve(table, columns=_ReadOnlyDict(table.columns), indexes=_ReadOnlyList(indexes),
+                        foreign_keys=_ReadOnlyList(table.foreign_keys))
+
+
+def _shared_view(view: ViewMetaData) -> ViewMetaData:
+    """
+    This function returns a view whose columns can not be changed
+    """
+    return attrs.evolve(view, columns=_ReadOnlyDict(view.columns))
+
+
+def _write_file(file_name: Path, text: str) -> None:
+    """
+    This function writes a file by replacing it, so that a reader never sees a partly written file
+    """
+    temp_name = file_name.with_name(f"{file_name.name}.{os.getpid()}.tmp")
+    temp_name.write_text(text, encoding='utf-8')
+    os.replace(temp_name, file_name)
+
+
+class SchemaStore:
+    """
+    This class saves the standard metadata of projects in a folder where each table and view definition is
+    stored once, in a file named after its fingerprint. The schema of a project is saved as a manifest of
+    the fingerprints of its tables and views, so the projects that share tables share their files, and the
+    definitions loaded are shared between the schemas loaded from the same store. A shared definition can not
+    be changed in place, a schema loaded is changed by replacing its tables and views.
+    """
+    _objects: Path
+    _manifests: Path
+    _loaded: weakref.WeakValueDictionary
+
+    def __init__(self, folder: Path):
+        """
+        Initializes an instance of the class, creating the folders of the store
+
+        :param folder: The folder holding the store
+        """
+        self._objects = folder.joinpath('objects')
+        self._manifests = folder.joinpath('manifests')
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._manifests.mkdir(parents=True, exist_ok=True)
+        self._loaded = weakref.WeakValueDictionary()
+
+    def _object_file(self, key: str) -> Path:
+        return self._objects.joinpath(key[:2], key[2:])
+
+    def _manifest_file(self, project: str) -> Path:
+        return self._manifests.joinpath(f"{quote(project, safe='')}.json")
+
+    def _object_files(self) -> typing.Iterator[Path]:
+        """
+        This method returns the definition files, leaving out the files still being written by a process
+        """
+        return (file_name for file_name in self._objects.glob('*/*') if file_name.suffix != '.tmp')
+
+    def _put(self, value: typing.Any, record: typing.Callable[[typing.Any], dict[str, typing.Any]],
+             build: typing.Callable[[dict[str, typing.Any]], typing.Any]) -> str:
+        """
+        This method stores a table or view definition unless it is already stored and returns its key. A
+        definition that is not one of the standard models, such as a table of a columnar schema, is converted
+        to one first, so that it has the same key as the standard model.
+        """
+        data = None
+        if not attrs.has(type(value)):
+            data = record(value)
+            value = build(data)
+
+        key = fingerprint(value).hex()
+        file_name = self._object_file(key)
+        if not file_name.exists():
+            file_name.parent.mkdir(exist_ok=True)
+            _write_file(file_name, json.dumps(record(value) if data is None else data))
+        return key
+
+    def _get(self, key: str, build: typing.Callable[[dict[str, typing.Any]], typing.Any]) -> typing.Any:
+        """
+        This method returns a stored table or view definition, reading it only when it is not already loaded
+        """
+        value = self._loaded.get(key)
+        if value is None:
+            value = build(json.loads(self._object_file(key).read_text(encoding='utf-8')))
+            value = _shared_table(value) if isinstance(value, TableMetaData) else _shared_view(value)
+            self._loaded[key] = value
+        return value
+
+    def save(self, project: str, schema: DatabaseMetadata) -> None:
+        """
+        This method saves the schema of a project, replacing the one saved before, it accepts any object with
+        the interface of DatabaseMetadata, such as a ColumnarDatabaseMetadata or a SchemaSnapshot
+        """
+        manifest = {'database': schema.name, 'type': schema.type.value,
+                    'tables': {name: self._put(table, _table_record, _table) for name, table in schema.tables.items()},
+                    'views': {name: self._put(view, _view_record, _view) for name, view in schema.views.items()}}
+        _write_file(self._manifest_file(project), json.dumps(manifest))
+
+    def load(self, project: str) -> DatabaseMetadata | None:
+        """
+        This method returns the schema saved for a project, or None when there is none
+        """
+        file_name = self._manifest_file(project)
+        if not file_name.exists():
+            return None
+
+        manifest = json.loads(file_name.read_text(encoding='utf-8'))
+        return DatabaseMetadata(manifest['database'], DatabaseType(manifest['type']),
+                                {name: self._get(key, _table) for name, key in manifest['tables'].items()},
+                                {name: self._get(key, _view) for name, key in manifest['views'].items()})
+
+    def projects(self) -> list[str]:
+        """
+        This method returns the names of the projects with a saved schema
+        """
+        return sorted(unquote(file_name.name[:-len('.json')]) for file_name in self._manifests.glob('*.json'))
+
+    def delete(self, project: str) -> bool:
+        """
+        This method deletes the schema saved for a project, the definitions it used are kept until collect
+        is called
+        """
+        file_name = self._manifest_file(project)
+        if not file_name.exists():
+            return False
+        file_name.unlink()
+        return True
+
+    def collect(self) -> int:
+        """
+        This method deletes the definitions no longer used by a saved schema and returns the number deleted
+        """
+        used = set()
+        for file_name in self._manifests.glob('*.json'):
+            manifest = json.loads(file_name.read_text(encoding='utf-8'))
+            used.update(manifest['tables'].values())
+            used.update(manifest['views'].values())
+
+        deleted = 0
+        for file_name in self._object_files():
+            if f"{file_name.parent.name}{file_name.name}" not in used:
+                file_name.unlink()
+                deleted += 1
+        return deleted
+
+    def __len__(self) -> int:
+        """
+        This method returns the number of definitions stored
+        """
+        return sum(1 for _ in self._object_files())
@@ -0,0 +1,257 @@
+# *******************************************************************************************
+#  File:  _stream.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['SchemaJsonWriter', 'SchemaJsonReader', 'write_schema_json']
+
+import json
+import typing
+from collections.abc import Mapping
+from pathlib import Path
+from ._model import DatabaseType
+from ._data_type_map import StandardDataType
+from ._standard import _ReadOnlyMetadata, DatabaseMetadata, TableMetaData, ColumnMetadata, IndexMetadata, \
+    ForeignKeyMetadata, ViewMetaData, ViewColumnMetadata
+
+# A schema is written as one record for the database followed by one record for each table and view. In the
+# JSON Lines format each record is a line, in the JSON format the records are the items of an array, each on
+# its own line, so both are read a line at a time.
+_TABLE_PREFIX = b'{"table": '
+_VIEW_PREFIX = b'{"view": '
+
+
+def _table_record(table: typing.Any) -> dict[str, typing.Any]:
+    return {'table': table.name,
+            'columns': [{'name': col.name, 'data_type': col.data_type.value, 'length': col.length,
+                         'is_nullable': col.is_nullable, 'is_unique': col.is_unique, 'is_auto': col.is_auto,
+                         'is_primary': col.is_primary} for col in table.columns.values()],
+            'indexes': [{'name': index.name, 'columns': list(index.columns), 'is_unique': index.is_unique,
+                         'is_primary': index.is_primary} for index in table.indexes],
+            'foreign_keys': [{'name': key.name, 'column': key.column, 'foreign_table': key.foreign_table,
+                              'foreign_column': key.foreign_column} for key in table.foreign_keys]}
+
+
+def _view_record(view: typing.Any) -> dict[str, typing.Any]:
+    return {'view': view.name,
+            'columns': [{'name': col.name, 'data_type': col.data_type.value, 'order': col.order,
+                         'length': col.length} for col in view.columns.values()]}
+
+
+def _table(record: dict[str, typing.Any]) -> TableMetaData:
+    columns = {col['name']: ColumnMetadata(col['name'], StandardDataType(col['data_type']), col['length'],
+                                           col['is_nullable'], col['is_unique'], col['is_auto'], col['is_primary'])
+               for col in record['columns']}
+    indexes = [IndexMetadata(index['name'], index['columns'], index['is_unique'], index['is_primary'])
+               for index in record['indexes']]
+    foreign_keys = [ForeignKeyMetadata(key['name'], key['column'], key['foreign_table'], key['foreign_column'])
+                    for key in record['foreign_keys']]
+    return TableMetaData(record['table'], columns, indexes, foreign_keys)
+
+
+def _view(record: dict[str, typing.Any]) -> ViewMetaData:
+    columns = {col['name']: ViewColumnMetadata(col['name'], StandardDataType(col['data_type']), col['order'],
+                                               col['length'])
+               for col in record['columns']}
+    return ViewMetaData(record['view'], columns)
+
+
+class SchemaJsonWriter:
+    """
+    This class writes the standard metadata of a schema as JSON, a table or view at a time, so that a schema
+    can be written as it is produced without holding it all in memory
+    """
+    _file: typing.TextIO
+    _json_lines: bool
+    _records: int
+
+    def __init__(self, file_name: Path, name: str, database_type: DatabaseType, json_lines: bool = True):
+        """
+        Initializes an instance of the class, creating the file
+
+        :param file_name: The file to write
+        :param name: The name of the database
+        :param database_type: The type of the database
+        :param json_lines: Writes a record on each line when set, otherwise a JSON array of the records
+        """
+        self._file = open(file_name, 'w', encoding='utf-8')
+        self._json_lines = json_lines
+        self._records = 0
+
+        if not json_lines:
+            self._file.write('[\n')
+        self._write({'database': name, 'type': database_type.value})
+
+    def _write(self, record: dict[str, typing.Any]) -> None:
+        if self._records and not self._json_lines:
+            self._file.write(',\n')
+        self._file.write(json.dumps(record))
+        if self._json_lines:
+            self._file.write('\n')
+        self._records += 1
+
+    def write_table(self, table: typing.Any) -> None:
+        """
+        This method writes a table, it accepts any object with the interface of TableMetaData
+        """
+        self._write(_table_record(table))
+
+    def write_view(self, view: typing.Any) -> None:
+        """
+        This method writes a view, it accepts any object with the interface of ViewMetaData
+        """
+        self._write(_view_record(view))
+
+    def close(self) -> None:
+        """
+        This method completes and closes the file
+        """
+        if self._file.closed:
+            return
+        if not self._json_lines:
+            self._file.write('\n]\n')
+        self._file.close()
+
+    def __enter__(self) -> 'SchemaJsonWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def write_schema_json(schema: DatabaseMetadata, file_name: Path, json_lines: bool = True) -> None:
+    """
+    This function writes the standard metadata of a schema as JSON, it accepts any object with the interface
+    of DatabaseMetadata, such as a lazy or columnar schema, whose tables are then written as they are read
+    """
+    with SchemaJsonWriter(file_name, schema.name, schema.type, json_lines) as writer:
+        for table in schema.tables.values():
+            writer.write_table(table)
+        for view in schema.views.values():
+            writer.write_view(view)
+
+
+class _JsonEntries(Mapping):
+    """
+    This class maps the names of the tables or views in a file to their metadata, which is read from the
+    file each time an entry is used
+    """
+    __slots__ = ('_offsets', '_read')
+
+    def __init__(self, offsets: dict[str, int], read: typing.Callable[[int], typing.Any]):
+        self._offsets = offsets
+        self._read = read
+
+    def __getitem__(self, name: str) -> typing.Any:
+        return self._read(self._offsets[name])
+
+    def __contains__(self, name: typing.Any) -> bool:
+        return name in self._offsets
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+
+class SchemaJsonReader(_ReadOnlyMetadata):
+    """
+    This class reads a schema written by SchemaJsonWriter, in either format. Opening the file reads the
+    position and name of each record without decoding it, a table or view is decoded when it is used.
+    """
+    _file: typing.BinaryIO
+    _name: str
+    _type: DatabaseType
+    _tables: _JsonEntries
+    _views: _JsonEntries
+
+    def __init__(self, file_name: Path):
+        """
+        Initializes an instance of the class, the file stays open until the reader is closed
+
+        :param file_name: The file to read
+        """
+        self._file = open(file_name, 'rb')
+        try:
+            self._index()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _index(self) -> None:
+        """
+        This method reads the database record and the position of each table and view record
+        """
+        decoder = json.JSONDecoder()
+        header = None
+        tables: dict[str, int] = dict()
+        views: dict[str, int] = dict()
+
+        offset = 0
+        for line in self._file:
+            position = offset
+            offset += len(line)
+
+            if line.startswith(_TABLE_PREFIX):
+                entries, prefix = tables, _TABLE_PREFIX
+            elif line.startswith(_VIEW_PREFIX):
+                entries, prefix = views, _VIEW_PREFIX
+            elif line.startswith(b'{"database"'):
+                header = json.loads(line.rstrip().rstrip(b','))
+                continue
+            else:
+                continue
+
+            name, _ = decoder.raw_decode(line[len(prefix):].decode('utf-8'))
+            entries[name] = position
+
+        if header is None:
+            raise ValueError(f"The file does not hold a schema: {self._file.name}")
+
+        self._name = header['database']
+        self._type = DatabaseType(header['type'])
+        self._tables = _JsonEntries(tables, lambda position: _table(self._record(position)))
+        self._views = _JsonEntries(views, lambda position: _view(self._record(position)))
+
+    def _record(self, position: int) -> dict[str, typing.Any]:
+        self._file.seek(position)
+        return json.loads(self._file.readline().rstrip().rstrip(b','))
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def type(self) -> DatabaseType:
+        return self._type
+
+    @property
+    def tables(self) -> Mapping[str, TableMetaData]:
+        return self._tables
+
+    @property
+    def views(self) -> Mapping[str, ViewMetaData]:
+        return self._views
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> 'SchemaJsonReader':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
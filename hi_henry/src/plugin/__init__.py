@@ -16,9 +16,18 @@ __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 
-__all__ = ['SQLiteDatabaseExplorer', 'MySQLDatabaseExplorer', 'PostgreSqlDatabaseExplorer']
+__all__ = ['SQLiteDatabaseExplorer', 'MySQLDatabaseExplorer', 'PostgreSqlDatabaseExplorer', 'DdlDumpDatabaseExplorer',
+           'CatalogRecorder', 'CatalogReplayer', 'QueryStats', 'InstrumentedConnectionFactory', 'ISchemaBuilder',
+           'SchemaBuilder', 'StandardSchemaBuilder', 'ColumnarSchemaBuilder', 'normalize', 'resolve_data_types',
+           'InternStats', 'StringInterner', 'LazyDatabaseMetadata', 'LazyDatabase']
 
+from ._intern import *
+from ._normalizer import *
 from ._sqlite_plugin import *
 from ._mysql_plugin import *
 from ._postgresql_plugin import *
+from ._ddl_plugin import *
+from ._replay import *
+from ._instrument import *
+from ._lazy import *
 from ._sqlite_plugin import *
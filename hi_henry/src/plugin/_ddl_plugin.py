@@ -0,0 +1,1047 @@
+# *******************************************************************************************
+#  File:  _ddl_plugin.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['DdlDumpDatabaseExplorer']
+
+import re
+import typing
+from collections.abc import Collection
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import attrs
+from ..data_maps import TypeMap, TypeOverrides
+from ..model import ViewColumn, View, ForeignKey, Database, IConnection, DatabaseType, DatabaseMetadata, \
+    ColumnarDatabaseMetadata
+from ..errors import DatabaseNotFoundError
+from ._intern import StringInterner
+from ._normalizer import ISchemaBuilder, SchemaBuilder, StandardSchemaBuilder, ColumnarSchemaBuilder
+
+
+class _Token(typing.NamedTuple):
+    kind: str
+    text: str
+    start: int
+    end: int
+
+
+_STRING_PATTERN = {
+    DatabaseType.MySQL: r"(?P<string>[Nn]?'(?:[^'\\]|\\.|'')*')",
+    DatabaseType.PostgreSQL: r"(?P<string>(?:[Ee](?='))?'(?:[^']|'')*')",
+    DatabaseType.SQLite: r"(?P<string>'(?:[^']|'')*')",
+}
+
+_TOKEN_PATTERN = r"""
+    (?P<space>\s+)
+  | (?P<comment>--[^\n]*|/\*.*?\*/{hash_comment})
+  | (?P<dollar>\$(?P<tag>[A-Za-z_]*)\$.*?\$(?P=tag)\$)
+  | {string}
+  | (?P<quoted>"(?:[^"]|"")*"|`(?:[^`]|``)*`|\[[^\]]*\])
+  | (?P<number>\d+(?:\.\d*)?)
+  | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+  | (?P<op>::|<>|<=|>=|!=|\|\||.)
+"""
+
+_TOKENIZERS = {
+    dialect: re.compile(_TOKEN_PATTERN.format(string=string, hash_comment=r"|\#[^\n]*"
+                                              if dialect == DatabaseType.MySQL else ""), re.S | re.X)
+    for dialect, string in _STRING_PATTERN.items()
+}
+
+_MYSQL_CONDITIONAL = re.compile(r"/\*!\d*\s?(.*?)\*/", re.S)
+_MYSQL_DELIMITER = re.compile(r"^DELIMITER\s+(\S+)\s*$", re.M | re.I)
+
+# Words that end the data type part of a column definition
+_COLUMN_CONSTRAINTS = {'CONSTRAINT', 'NOT', 'NULL', 'DEFAULT', 'PRIMARY', 'UNIQUE', 'REFERENCES', 'CHECK', 'COLLATE',
+                       'AUTO_INCREMENT', 'AUTOINCREMENT', 'GENERATED', 'COMMENT', 'CHARACTER', 'CHARSET', 'ON',
+                       'AS', 'VISIBLE', 'INVISIBLE', 'STORAGE', 'COLUMN_FORMAT', 'SRID', 'KEY', 'IDENTITY'}
+
+# Words starting the items of a CREATE TABLE statement that are neither a column nor a constraint
+_UNSUPPORTED_CLAUSES = {'LIKE', 'PERIOD', 'INHERITS'}
+
+# Words that end the FROM clause of a view definition
+_FROM_TERMINATORS = {'WHERE', 'GROUP', 'ORDER', 'HAVING', 'LIMIT', 'UNION', 'WINDOW', 'EXCEPT', 'INTERSECT',
+                     'WITH'}
+
+# Words that can never be used as a table alias in a FROM clause
+_JOIN_WORDS = {'JOIN', 'INNER', 'LEFT', 'RIGHT', 'FULL', 'OUTER', 'CROSS', 'NATURAL', 'ON', 'USING', 'LATERAL',
+               'STRAIGHT_JOIN', 'ONLY'} | _FROM_TERMINATORS
+
+_MYSQL_TEXT_LENGTHS = {'tinytext': 255, 'text': 65535, 'mediumtext': 16777215, 'longtext': 4294967295}
+
+_MYSQL_CHAR_TYPES = {'char', 'varchar', 'binary', 'varbinary'}
+
+_POSTGRESQL_ALIASES = {'varchar': 'character varying', 'char': 'character', 'bpchar': 'character',
+                       'int': 'integer', 'int4': 'integer', 'int2': 'smallint', 'int8': 'bigint',
+                       'float8': 'double precision', 'float4': 'real', 'bool': 'boolean', 'decimal': 'numeric',
+                       'timestamp': 'timestamp without time zone', 'timestamptz': 'timestamp with time zone',
+                       'time': 'time without time zone', 'timetz': 'time with time zone', 'varbit': 'bit varying',
+                       'serial': 'integer', 'bigserial': 'bigint', 'smallserial': 'smallint'}
+
+_POSTGRESQL_CHAR_TYPES = {'character varying', 'character', 'bit', 'bit varying'}
+
+
+@attrs.define
+class _ColumnDefinition:
+    """
+    This class holds a column definition while the dump is being parsed
+    """
+    name: str
+    data_type: str
+    order: int
+    length: int | None = None
+    is_nullable: bool = True
+    is_unique: bool = False
+    is_auto: bool = False
+    is_primary: bool = False
+    default: str | None = None
+    comment: str | None = None
+
+
+@attrs.define
+class _IndexDefinition:
+    """
+    This class holds an index definition while the dump is being parsed
+    """
+    name: str
+    columns: list[str] = attrs.Factory(list)
+    is_unique: bool = False
+    is_primary: bool = False
+    is_implicit: bool = False
+
+
+@attrs.define
+class _TableDefinition:
+    """
+    This class holds a table definition while the dump is being parsed
+    """
+    name: str
+    columns: dict[str, _ColumnDefinition] = attrs.Factory(dict)
+    indexes: list[_IndexDefinition] = attrs.Factory(list)
+    foreign_keys: list[ForeignKey] = attrs.Factory(list)
+    parent: str | None = None
+    comment: str | None = None
+
+
+# region Tokenizer
+
+def _tokenize(text: str, dialect: DatabaseType) -> list[_Token]:
+    """
+    This function splits a SQL statement into tokens, dropping white space and comments
+    """
+    tokens = list()
+
+    for match in _TOKENIZERS[dialect].finditer(text):
+        kind = match.lastgroup
+        if kind == 'tag':
+            kind = 'dollar'
+        if kind in ('space', 'comment'):
+            continue
+        tokens.append(_Token(kind, match.group(), match.start(), match.end()))
+
+    return tokens
+
+
+def _split_statements(text: str, dialect: DatabaseType) -> list[str]:
+    """
+    This function splits the content of a dump file into individual statements
+    """
+    if dialect == DatabaseType.MySQL:
+        text = _MYSQL_CONDITIONAL.sub(r'\1', text)
+
+        # Blocks using a custom delimiter only hold triggers and routines, which are of no interest
+        parts = _MYSQL_DELIMITER.split(text)
+        text = parts[0] + ''.join(parts[index + 1] for index in range(1, len(parts), 2) if parts[index] == ';')
+
+    statements = list()
+    start = None
+
+    for token in _tokenize(text, dialect):
+        if token.kind == 'op' and token.text == ';':
+            if start is not None:
+                statements.append(text[start:token.start])
+            start = None
+        elif start is None:
+            start = token.start
+
+    if start is not None:
+        statements.append(text[start:])
+
+    return statements
+
+
+def _unquote(token: _Token) -> str:
+    """
+    This function returns the name held by an identifier token
+    """
+    if token.kind == 'quoted':
+        quote = token.text[0]
+        if quote == '[':
+            return token.text[1:-1]
+        return token.text[1:-1].replace(quote * 2, quote)
+    return token.text
+
+
+def _unquote_string(text: str) -> str:
+    """
+    This function returns the value held by a string literal
+    """
+    if text[0] in 'NnEe':
+        text = text[1:]
+    return text[1:-1].replace("''", "'").replace("\\'", "'")
+
+
+def _is_word(token: _Token, *words: str) -> bool:
+    """
+    This function checks if the token is one of the given key words
+    """
+    return token.kind == 'word' and token.text.upper() in words
+
+
+def _is_name(token: _Token) -> bool:
+    """
+    This function checks if the token can be used as a name
+    """
+    return token.kind in ('word', 'quoted')
+
+
+def _closing_bracket(tokens: list[_Token], index: int) -> int:
+    """
+    This function returns the position of the bracket closing the one at the given position
+    """
+    depth = 0
+    for position in range(index, len(tokens)):
+        text = tokens[position].text
+        if tokens[position].kind != 'op':
+            continue
+        if text == '(':
+            depth += 1
+        elif text == ')':
+            depth -= 1
+            if depth == 0:
+                return position
+    return len(tokens)
+
+
+def _split_items(tokens: list[_Token]) -> list[list[_Token]]:
+    """
+    This function splits a token list on the commas that are not nested in brackets
+    """
+    items = list()
+    current = list()
+    depth = 0
+
+    for token in tokens:
+        if token.kind == 'op':
+            if token.text == '(':
+                depth += 1
+            elif token.text == ')':
+                depth -= 1
+            elif token.text == ',' and depth == 0:
+                items.append(current)
+                current = list()
+                continue
+        current.append(token)
+
+    if current:
+        items.append(current)
+
+    return items
+
+
+def _read_name(tokens: list[_Token], index: int) -> tuple[str, int]:
+    """
+    This function reads a possibly qualified name, returning the last part and the next position, or an empty
+    name when there is no name at the position
+    """
+    if index >= len(tokens) or not _is_name(tokens[index]):
+        return '', index
+
+    name = _unquote(tokens[index])
+    index += 1
+    while index + 1 < len(tokens) and tokens[index].text == '.' and _is_name(tokens[index + 1]):
+        name = _unquote(tokens[index + 1])
+        index += 2
+    return name, index
+
+
+def _read_name_list(tokens: list[_Token], index: int) -> tuple[list[str], int]:
+    """
+    This function reads a bracketed list of column names, returning the names and the next position
+    """
+    if index >= len(tokens) or tokens[index].text != '(':
+        return [], index
+
+    end = _closing_bracket(tokens, index)
+    names = list()
+    for item in _split_items(tokens[index + 1:end]):
+        if item and _is_name(item[0]):
+            names.append(_unquote(item[0]))
+    return names, end + 1
+
+
+# endregion
+
+# region Statement Parsers
+
+def _normalize_type(dialect: DatabaseType, text: str, tokens: list[_Token]) -> tuple[str, int | None]:
+    """
+    This function converts a declared data type into the form reported by the DBMS catalog
+    """
+    if dialect == DatabaseType.SQLite:
+        return ' '.join(text.split()), 0
+
+    words = list()
+    parameters = list()
+    is_array = False
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        if token.text == '(':
+            end = _closing_bracket(tokens, index)
+            parameters.extend(item.text for item in tokens[index + 1:end] if item.kind == 'number')
+            index = end
+        elif token.text.startswith('['):
+            is_array = True
+        elif token.kind in ('word', 'quoted'):
+            words.append(_unquote(token).lower())
+        index += 1
+
+    length = int(parameters[0]) if parameters else None
+
+    if dialect == DatabaseType.MySQL:
+        data_type = words[0] if words else ''
+        if data_type in _MYSQL_TEXT_LENGTHS:
+            return data_type, _MYSQL_TEXT_LENGTHS[data_type]
+        return data_type, length if data_type in _MYSQL_CHAR_TYPES else None
+
+    if is_array:
+        return 'ARRAY', None
+    data_type = ' '.join(words)
+    data_type = _POSTGRESQL_ALIASES.get(data_type, data_type)
+    return data_type, length if data_type in _POSTGRESQL_CHAR_TYPES else None
+
+
+def _default_value(dialect: DatabaseType, text: str, tokens: list[_Token]) -> str | None:
+    """
+    This function converts a default expression into the form reported by the DBMS catalog
+    """
+    if len(tokens) == 1 and _is_word(tokens[0], 'NULL'):
+        return None
+    if dialect == DatabaseType.MySQL and len(tokens) == 1 and tokens[0].kind == 'string':
+        return _unquote_string(tokens[0].text)
+    return text
+
+
+def _parse_column(dialect: DatabaseType, text: str, tokens: list[_Token], order: int,
+                  table: _TableDefinition) -> _ColumnDefinition:
+    """
+    This function parses a column definition in a CREATE TABLE statement
+    """
+    name = _unquote(tokens[0])
+
+    # Data type
+    index = 1
+    while index < len(tokens):
+        token = tokens[index]
+        if _is_word(token, *_COLUMN_CONSTRAINTS) and not (index == 1 and _is_word(token, 'CHARACTER')):
+            break
+        if token.text == '(':
+            index = _closing_bracket(tokens, index)
+        index += 1
+    type_tokens = tokens[1:index]
+    type_text = text[type_tokens[0].start:type_tokens[-1].end] if type_tokens else ''
+    data_type, length = _normalize_type(dialect, type_text, type_tokens)
+
+    column = _ColumnDefinition(name, data_type, order, length)
+
+    # Constraints
+    while index < len(tokens):
+        token = tokens[index]
+        if _is_word(token, 'NOT') and index + 1 < len(tokens) and _is_word(tokens[index + 1], 'NULL'):
+            column.is_nullable = False
+            index += 2
+        elif _is_word(token, 'DEFAULT'):
+            start = index + 1
+            index = start
+            while index < len(tokens) and not _is_word(tokens[index], *_COLUMN_CONSTRAINTS - {'NULL'}):
+                if tokens[index].text == '(':
+                    index = _closing_bracket(tokens, index)
+                index += 1
+            if start < index:
+                value_text = text[tokens[start].start:tokens[index - 1].end]
+                column.default = _default_value(dialect, value_text, tokens[start:index])
+        elif _is_word(token, 'PRIMARY'):
+            column.is_primary = True
+            if dialect != DatabaseType.SQLite:
+                column.is_nullable = False
+            # An INTEGER PRIMARY KEY column is an alias of the rowid in SQLite and has no index
+            if dialect != DatabaseType.SQLite or data_type.upper() != 'INTEGER':
+                table.indexes.append(_IndexDefinition('', [name], True, True, True))
+            index += 2
+        elif _is_word(token, 'UNIQUE'):
+            table.indexes.append(_IndexDefinition('', [name], True, False, True))
+            index += 1
+        elif _is_word(token, 'AUTO_INCREMENT', 'AUTOINCREMENT', 'IDENTITY'):
+            column.is_auto = True
+            index += 1
+        elif _is_word(token, 'REFERENCES'):
+            foreign_table, index = _read_name(tokens, index + 1)
+            foreign_column = name
+            if index < len(tokens) and tokens[index].text == '(':
+                names, index = _read_name_list(tokens, index)
+                foreign_column = names[0] if names else name
+            if foreign_table:
+                table.foreign_keys.append(ForeignKey('Unknown', name, foreign_table, foreign_column))
+        elif _is_word(token, 'COMMENT') and index + 1 < len(tokens) and tokens[index + 1].kind == 'string':
+            column.comment = _unquote_string(tokens[index + 1].text)
+            index += 2
+        elif token.text == '(':
+            index = _closing_bracket(tokens, index) + 1
+        else:
+            index += 1
+
+    if column.default and 'nextval(' in column.default:
+        column.is_auto = True
+
+    return column
+
+
+def _parse_constraint(dialect: DatabaseType, tokens: list[_Token], table: _TableDefinition) -> bool:
+    """
+    This function parses a table level constraint or index, returning False if the item is not one
+    """
+    index = 0
+    name = ''
+
+    if _is_word(tokens[0], 'CONSTRAINT'):
+        if len(tokens) > 1 and _is_name(tokens[1]) and not _is_word(tokens[1], 'PRIMARY', 'UNIQUE', 'FOREIGN',
+                                                                    'CHECK'):
+            name = _unquote(tokens[1])
+            index = 2
+        else:
+            index = 1
+    elif _is_word(tokens[0], 'KEY', 'INDEX', 'FULLTEXT', 'SPATIAL'):
+        # Only MySQL declares indexes among the columns, elsewhere these words can be column names
+        if dialect != DatabaseType.MySQL or len(tokens) < 2 or not (_is_name(tokens[1]) or tokens[1].text == '('):
+            return False
+    elif not _is_word(tokens[0], 'PRIMARY', 'UNIQUE', 'FOREIGN', 'CHECK', 'EXCLUDE'):
+        return False
+
+    if index >= len(tokens):
+        return True
+
+    head = tokens[index].text.upper()
+    if head in ('CHECK', 'EXCLUDE'):
+        return True
+
+    if head == 'FOREIGN':
+        index += 2
+        if index < len(tokens) and tokens[index].text != '(':
+            index += 1
+        columns, index = _read_name_list(tokens, index)
+        # A foreign key without a REFERENCES clause is not valid, so it is skipped
+        if index >= len(tokens) or not _is_word(tokens[index], 'REFERENCES'):
+            return True
+        foreign_table, index = _read_name(tokens, index + 1)
+        if not foreign_table:
+            return True
+        foreign_columns, index = _read_name_list(tokens, index)
+        if not foreign_columns:
+            foreign_columns = columns
+        for column, foreign_column in zip(columns, foreign_columns):
+            table.foreign_keys.append(ForeignKey(name or 'Unknown', column, foreign_table, foreign_column))
+        return True
+
+    is_primary = head == 'PRIMARY'
+    is_unique = is_primary or head == 'UNIQUE'
+
+    # Skip over the key words and pick up an index name if one is given
+    index += 1
+    while index < len(tokens) and tokens[index].text != '(':
+        if _is_word(tokens[index], 'KEY', 'INDEX', 'USING', 'BTREE', 'HASH'):
+            index += 1
+            continue
+        if _is_name(tokens[index]):
+            name = _unquote(tokens[index])
+        index += 1
+
+    # SQLite names the indexes behind constraints itself, even when the constraint has a name
+    is_implicit = dialect == DatabaseType.SQLite or not name
+
+    columns, _ = _read_name_list(tokens, index)
+    # A constraint without columns is not valid, so it is skipped
+    if not columns:
+        return True
+    table.indexes.append(_IndexDefinition(name, columns, is_unique, is_primary, is_implicit))
+
+    return True
+
+
+def _read_table_name(tokens: list[_Token]) -> tuple[str, int]:
+    """
+    This function reads the name of the table created by a CREATE TABLE statement, the name is empty when
+    the statement has none
+    """
+    index = 0
+    while index < len(tokens) and not _is_word(tokens[index], 'TABLE'):
+        index += 1
+    index += 1
+    while index < len(tokens) and _is_word(tokens[index], 'IF', 'NOT', 'EXISTS'):
+        index += 1
+    return _read_name(tokens, index)
+
+
+def _parse_create_table(dialect: DatabaseType, text: str) -> _TableDefinition | None:
+    """
+    This function parses a CREATE TABLE statement
+    """
+    tokens = _tokenize(text, dialect)
+
+    name, index = _read_table_name(tokens)
+    if not name:
+        return None
+    table = _TableDefinition(name)
+
+    if index < len(tokens) and _is_word(tokens[index], 'PARTITION') and index + 2 < len(tokens):
+        table.parent, index = _read_name(tokens, index + 2)
+
+    if index >= len(tokens) or tokens[index].text != '(':
+        return table
+
+    end = _closing_bracket(tokens, index)
+    order = 0 if dialect == DatabaseType.SQLite else 1
+
+    for item in _split_items(tokens[index + 1:end]):
+        if not item or _parse_constraint(dialect, item, table):
+            continue
+        # Clauses copying the definition of another table, such as LIKE, are not supported and are skipped
+        if not _is_name(item[0]) or _is_word(item[0], *_UNSUPPORTED_CLAUSES):
+            continue
+        column = _parse_column(dialect, text, item, order, table)
+        table.columns[column.name] = column
+        order += 1
+
+    # MySQL table comment
+    for position in range(end + 1, len(tokens) - 1):
+        if _is_word(tokens[position], 'COMMENT'):
+            value_position = position + 2 if tokens[position + 1].text == '=' else position + 1
+            value = tokens[value_position] if value_position < len(tokens) else tokens[position]
+            if value.kind == 'string':
+                table.comment = _unquote_string(value.text)
+
+    return table
+
+
+def _parse_create_tables(dialect: DatabaseType, statements: list[str]) -> list[_TableDefinition]:
+    """
+    This function parses a batch of CREATE TABLE statements, it is the unit of work handed to the process pool
+    """
+    tables = list()
+    for text in statements:
+        table = _parse_create_table(dialect, text)
+        if table:
+            tables.append(table)
+    return tables
+
+
+def _parse_create_index(dialect: DatabaseType, text: str, tables: dict[str, _TableDefinition]) -> None:
+    """
+    This function parses a CREATE INDEX statement
+    """
+    tokens = _tokenize(text, dialect)
+    is_unique = any(_is_word(token, 'UNIQUE') for token in tokens[:3])
+
+    index = 0
+    while index < len(tokens) and not _is_word(tokens[index], 'INDEX'):
+        index += 1
+    index += 1
+    while index < len(tokens) and _is_word(tokens[index], 'CONCURRENTLY', 'IF', 'NOT', 'EXISTS'):
+        index += 1
+
+    name, index = _read_name(tokens, index)
+    while index < len(tokens) and not _is_word(tokens[index], 'ON'):
+        index += 1
+    index += 1
+    if index < len(tokens) and _is_word(tokens[index], 'ONLY'):
+        index += 1
+    if index >= len(tokens):
+        return
+
+    table_name, index = _read_name(tokens, index)
+    while index < len(tokens) and tokens[index].text != '(':
+        index += 1
+
+    columns, _ = _read_name_list(tokens, index)
+    if table_name in tables:
+        tables[table_name].indexes.append(_IndexDefinition(name, columns, is_unique))
+
+
+def _parse_alter_table(dialect: DatabaseType, text: str, tables: dict[str, _TableDefinition]) -> None:
+    """
+    This function parses the ALTER TABLE statements used by pg_dump to add keys and defaults
+    """
+    tokens = _tokenize(text, dialect)
+
+    index = 2
+    while index < len(tokens) and _is_word(tokens[index], 'ONLY', 'IF', 'EXISTS'):
+        index += 1
+    if index >= len(tokens):
+        return
+
+    name, index = _read_name(tokens, index)
+    table = tables.get(name)
+    if table is None:
+        return
+
+    for action in _split_items(tokens[index:]):
+        if not action:
+            continue
+
+        if _is_word(action[0], 'ADD') and len(action) > 1:
+            item = action[2:] if _is_word(action[1], 'COLUMN') else action[1:]
+            if not _parse_constraint(dialect, item, table) and item and _is_name(item[0]):
+                column = _parse_column(dialect, text, item, len(table.columns) + 1, table)
+                table.columns[column.name] = column
+
+        elif _is_word(action[0], 'ALTER') and len(action) > 2:
+            position = 2 if _is_word(action[1], 'COLUMN') else 1
+            column = table.columns.get(_unquote(action[position]))
+            if column is None:
+                continue
+            rest = action[position + 1:]
+            if len(rest) > 2 and _is_word(rest[0], 'SET') and _is_word(rest[1], 'DEFAULT'):
+                column.default = _default_value(dialect, text[rest[2].start:rest[-1].end], rest[2:])
+                column.is_auto = column.is_auto or 'nextval(' in (column.default or '')
+            elif len(rest) > 1 and _is_word(rest[0], 'SET') and _is_word(rest[1], 'NOT'):
+                column.is_nullable = False
+            elif any(_is_word(token, 'IDENTITY') for token in rest):
+                column.is_auto = True
+
+
+def _parse_comment(dialect: DatabaseType, text: str, tables: dict[str, _TableDefinition]) -> None:
+    """
+    This function parses the COMMENT ON statements used by pg_dump
+    """
+    tokens = _tokenize(text, dialect)
+    if len(tokens) < 5 or tokens[-1].kind != 'string':
+        return
+
+    names = [_unquote(token) for token in tokens[3:-2] if _is_name(token)]
+    comment = _unquote_string(tokens[-1].text)
+
+    if _is_word(tokens[2], 'TABLE') and names and names[-1] in tables:
+        tables[names[-1]].comment = comment
+    elif _is_word(tokens[2], 'COLUMN') and len(names) >= 2 and names[-2] in tables:
+        column = tables[names[-2]].columns.get(names[-1])
+        if column:
+            column.comment = comment
+
+
+def _parse_from_clause(tokens: list[_Token]) -> list[tuple[str, str]]:
+    """
+    This function returns the (alias, table) pairs referenced in the FROM clause of a view
+    """
+    references = list()
+    expect_table = True
+    index = 0
+
+    while index < len(tokens):
+        token = tokens[index]
+        if token.text in ('(', ')'):
+            index += 1
+            continue
+        if token.text == ',' or _is_word(token, 'JOIN', 'STRAIGHT_JOIN'):
+            expect_table = True
+            index += 1
+            continue
+        if expect_table and _is_name(token) and not _is_word(token, *_JOIN_WORDS, 'SELECT'):
+            table, index = _read_name(tokens, index)
+            alias = table
+            if index < len(tokens) and _is_word(tokens[index], 'AS'):
+                index += 1
+            if index < len(tokens) and _is_name(tokens[index]) and not _is_word(tokens[index], *_JOIN_WORDS):
+                alias = _unquote(tokens[index])
+                index += 1
+            references.append((alias, table))
+            expect_table = False
+            continue
+        if _is_word(token, 'ON', 'USING'):
+            expect_table = False
+        index += 1
+
+    return references
+
+
+def _parse_create_view(dialect: DatabaseType, text: str, tables: dict[str, _TableDefinition]) -> View | None:
+    """
+    This function parses a CREATE VIEW statement, resolving the column types from the referenced tables
+    """
+    tokens = _tokenize(text, dialect)
+
+    index = 0
+    while index < len(tokens) and not _is_word(tokens[index], 'VIEW'):
+        index += 1
+    index += 1
+    while index < len(tokens) and _is_word(tokens[index], 'IF', 'NOT', 'EXISTS'):
+        index += 1
+    if index >= len(tokens):
+        return None
+
+    name, index = _read_name(tokens, index)
+    if not name:
+        return None
+    view = View(name)
+
+    explicit_names = list()
+    if index < len(tokens) and tokens[index].text == '(':
+        explicit_names, index = _read_name_list(tokens, index)
+
+    while index < len(tokens) and not _is_word(tokens[index], 'SELECT'):
+        index += 1
+    index += 1
+    while index < len(tokens) and _is_word(tokens[index], 'DISTINCT', 'ALL'):
+        index += 1
+
+    # Locate the end of the select list and of the FROM clause
+    depth = 0
+    from_index = len(tokens)
+    end_index = len(tokens)
+    for position in range(index, len(tokens)):
+        token = tokens[position]
+        if token.text == '(':
+            depth += 1
+        elif token.text == ')':
+            depth -= 1
+        elif depth == 0 and from_index == len(tokens) and _is_word(token, 'FROM'):
+            from_index = position
+        elif depth == 0 and from_index < position and _is_word(token, *_FROM_TERMINATORS):
+            end_index = position
+            break
+
+    references = _parse_from_clause(tokens[from_index + 1:end_index])
+    aliases = {alias: tables[table] for alias, table in references if table in tables}
+
+    # Temporary structures written by mysqldump carry the column types of the view
+    placeholder = tables.pop(name, None)
+
+    order = 0 if dialect == DatabaseType.SQLite else 1
+    columns: list[tuple[str, _ColumnDefinition | None]] = list()
+
+    for item in _split_items(tokens[index:from_index]):
+        if not item:
+            continue
+
+        # Expand * and alias.*
+        if item[-1].text == '*':
+            sources = [aliases[_unquote(item[0])]] if len(item) == 3 and _unquote(item[0]) in aliases else \
+                [aliases[alias] for alias, _ in references if alias in aliases]
+            for source in sources:
+                for column in source.columns.values():
+                    columns.append((column.name, column))
+            continue
+
+        expression = item
+        if len(item) >= 3 and _is_word(item[-2], 'AS') and _is_name(item[-1]):
+            column_name = _unquote(item[-1])
+            expression = item[:-2]
+        elif len(item) >= 2 and _is_name(item[-1]) and item[-2].text != '.' and item[-2].text != '::':
+            column_name = _unquote(item[-1])
+            expression = item[:-1]
+        else:
+            column_name = _unquote(item[-1])
+
+        source = None
+        if len(expression) == 3 and expression[1].text == '.' and _unquote(expression[0]) in aliases:
+            source = aliases[_unquote(expression[0])].columns.get(_unquote(expression[2]))
+        elif len(expression) == 1 and _is_name(expression[0]):
+            for alias, _ in references:
+                if alias in aliases and _unquote(expression[0]) in aliases[alias].columns:
+                    source = aliases[alias].columns[_unquote(expression[0])]
+                    break
+        columns.append((column_name, source))
+
+    for position, (column_name, source) in enumerate(columns):
+        if position < len(explicit_names):
+            column_name = explicit_names[position]
+        if placeholder and column_name in placeholder.columns:
+            source = placeholder.columns[column_name]
+
+        data_type = source.data_type if source else ''
+        length = source.length if source else None
+        if dialect == DatabaseType.SQLite:
+            length = 0
+        view.columns[column_name] = ViewColumn(column_name, data_type, order + position, length)
+
+    return view
+
+
+# endregion
+
+def _build_table(dialect: DatabaseType, definition: _TableDefinition, builder: ISchemaBuilder) -> None:
+    """
+    This function streams a parsed table definition into a schema builder
+    """
+    builder.add_table(definition.name, definition.comment)
+
+    # Name the indexes created implicitly by constraints the way the DBMS does
+    auto_index = 0
+    for index in definition.indexes:
+        if not index.is_implicit:
+            continue
+        if dialect == DatabaseType.SQLite:
+            auto_index += 1
+            index.name = f"sqlite_autoindex_{definition.name}_{auto_index}"
+        elif dialect == DatabaseType.PostgreSQL:
+            index.name = f"{definition.name}_pkey" if index.is_primary else f"{definition.name}_{index.columns[0]}_key"
+        else:
+            index.name = 'PRIMARY' if index.is_primary else index.columns[0]
+
+    for index in definition.indexes:
+        if index.is_primary:
+            for name in index.columns:
+                if name in definition.columns:
+                    column = definition.columns[name]
+                    column.is_primary = True
+                    if dialect != DatabaseType.SQLite:
+                        column.is_unique = True
+                        column.is_nullable = False
+        elif index.is_unique and len(index.columns) == 1 and dialect != DatabaseType.SQLite:
+            if index.columns[0] in definition.columns:
+                definition.columns[index.columns[0]].is_unique = True
+
+    for column in definition.columns.values():
+        builder.add_column(definition.name, column.name, column.data_type, column.order, column.length,
+                           column.is_nullable, False, column.is_unique, column.is_auto, column.is_primary,
+                           column.default, column.comment)
+
+    indexes = definition.indexes
+    foreign_keys = definition.foreign_keys
+
+    if dialect == DatabaseType.SQLite:
+        # SQLite lists indexes and foreign keys in the reverse order of their creation
+        indexes = list(reversed(indexes))
+        foreign_keys = list(reversed(foreign_keys))
+    elif dialect == DatabaseType.MySQL:
+        foreign_keys = sorted(foreign_keys, key=lambda item: item.column)
+    else:
+        indexes = sorted(indexes, key=lambda item: not item.is_primary)
+
+    for index in indexes:
+        builder.add_index(definition.name, index.name, index.columns, is_unique=index.is_unique,
+                          is_primary=index.is_primary)
+    for key in foreign_keys:
+        builder.add_foreign_key(definition.name, key.name, key.column, key.foreign_table, key.foreign_column,
+                                key.comment)
+
+
+# noinspection SqlDialectInspection
+class DdlDumpDatabaseExplorer:
+    """
+    This class handles the extraction of a database schema from a schema only dump file, as written by
+    mysqldump --no-data, pg_dump --schema-only or the sqlite3 .schema command.
+
+    The location of the dump file is given by the host property of the connection. As the dump is a single
+    file, extracting some of the tables still reads and parses all of it.
+    """
+    _dialect: DatabaseType
+    _workers: int | None
+    _chunk_size: int
+    _parallel_threshold: int
+    _interner: StringInterner | None
+    _validate: bool
+
+    def __init__(self, dialect: DatabaseType, workers: int | None = None, chunk_size: int = 500,
+                 parallel_threshold: int = 2000, interner: StringInterner | None = None, validate: bool = True):
+        """
+        Initializes an instance of the class
+
+        :param dialect: The DBMS that wrote the dump file
+        :param workers: The number of worker processes used for large dumps, None uses one per CPU
+        :param chunk_size: The number of CREATE TABLE statements handed to a worker at a time
+        :param parallel_threshold: The number of CREATE TABLE statements above which the process pool is used
+        :param interner: Shares the names and data types read from the dump with the schemas extracted by other
+            explorers, a new interner is used for each extraction by default
+        :param validate: Validates the models built from the dump, it can be turned off for a trusted dump to
+            speed up the extraction of large schemas
+        """
+        self._dialect = dialect
+        self._workers = workers
+        self._chunk_size = chunk_size
+        self._parallel_threshold = parallel_threshold
+        self._interner = interner
+        self._validate = validate
+
+    @property
+    def dialect(self) -> DatabaseType:
+        return self._dialect
+
+    @property
+    def database_type(self) -> DatabaseType:
+        return self._dialect
+
+    def _parse_tables(self, statements: list[str]) -> list[_TableDefinition]:
+        """
+        This method parses the CREATE TABLE statements, using a process pool for large dumps
+        """
+        if len(statements) < self._parallel_threshold or self._workers == 1:
+            return _parse_create_tables(self._dialect, statements)
+
+        chunks = [statements[start:start + self._chunk_size]
+                  for start in range(0, len(statements), self._chunk_size)]
+
+        tables = list()
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            for result in executor.map(_parse_create_tables, [self._dialect] * len(chunks), chunks):
+                tables.extend(result)
+
+        return tables
+
+    def _read_dump(self, con: IConnection) -> str:
+        """
+        This method returns the content of the dump file
+        """
+        dump_file = Path(con.host)
+        if not dump_file.exists():
+            raise DatabaseNotFoundError(f"The following dump file could not be located: {con.host}")
+
+        return dump_file.read_text(encoding='utf-8', errors='replace')
+
+    def _sort_statements(self, text: str) -> tuple[list[str], list[tuple[str, str]]]:
+        """
+        This method returns the CREATE TABLE statements of a dump, and the other statements used with their kind,
+        the order within each kind is kept
+        """
+        table_statements = list()
+        other_statements = list()
+        for statement in _split_statements(text, self._dialect):
+            words = [token.text.upper() for token in _tokenize(statement[:200], self._dialect)
+                     if token.kind == 'word'][:12]
+            if not words:
+                continue
+
+            kind = None
+            if words[0] == 'CREATE':
+                kind = next((word for word in words[1:] if word in ('TABLE', 'INDEX', 'VIEW', 'MATERIALIZED',
+                                                                     'SEQUENCE', 'FUNCTION', 'TRIGGER', 'TYPE',
+                                                                     'PROCEDURE')), None)
+            elif words[0] == 'ALTER' and len(words) > 1 and words[1] == 'TABLE':
+                kind = 'ALTER'
+            elif words[0] == 'COMMENT' and len(words) > 1 and words[1] == 'ON':
+                kind = 'COMMENT'
+
+            if kind == 'TABLE':
+                table_statements.append(statement)
+            elif kind in ('INDEX', 'VIEW', 'ALTER', 'COMMENT'):
+                other_statements.append((kind, statement))
+
+        return table_statements, other_statements
+
+    def _populate(self, con: IConnection, builder: ISchemaBuilder, tables: Collection[str] | None = None,
+                  views: bool = True) -> None:
+        """
+        This method streams the database schema read from the dump file into a builder, limited to the tables
+        named when they are given
+        """
+        table_statements, other_statements = self._sort_statements(self._read_dump(con))
+
+        definitions: dict[str, _TableDefinition] = dict()
+        for definition in self._parse_tables(table_statements):
+            if self._dialect == DatabaseType.SQLite and definition.name.startswith('sqlite_'):
+                continue
+            definitions[definition.name] = definition
+
+        # Partitions created with PARTITION OF share the columns of the parent table
+        for definition in definitions.values():
+            if definition.parent in definitions and not definition.columns:
+                parent = definitions[definition.parent]
+                definition.columns = {name: attrs.evolve(column) for name, column in parent.columns.items()}
+
+        parsed_views: dict[str, View] = dict()
+        for kind, statement in other_statements:
+            if kind == 'VIEW' and not views:
+                continue
+            if kind == 'INDEX':
+                _parse_create_index(self._dialect, statement, definitions)
+            elif kind == 'ALTER':
+                _parse_alter_table(self._dialect, statement, definitions)
+            elif kind == 'COMMENT':
+                _parse_comment(self._dialect, statement, definitions)
+            else:
+                view = _parse_create_view(self._dialect, statement, definitions)
+                if view:
+                    parsed_views[view.name] = view
+
+        # Tables
+        for name in sorted(definitions if tables is None else set(tables) & definitions.keys()):
+            _build_table(self._dialect, definitions[name], builder)
+
+        # Views
+        for name in sorted(parsed_views):
+            view = parsed_views[name]
+            builder.add_view(view.name, view.comment)
+            for column in view.columns.values():
+                builder.add_view_column(view.name, column.name, column.data_type, column.order, column.length,
+                                        column.comment)
+
+    def table_names(self, con: IConnection) -> list[str]:
+        """
+        This method returns the names of the tables in the dump, reading only the names of the CREATE TABLE
+        statements
+        """
+        names = set()
+        for statement in self._sort_statements(self._read_dump(con))[0]:
+            name, _ = _read_table_name(_tokenize(statement, self._dialect))
+            if name and not (self._dialect == DatabaseType.SQLite and name.startswith('sqlite_')):
+                names.add(name)
+        return sorted(names)
+
+    def extract_tables(self, con: IConnection, names: Collection[str], views: bool = False) -> Database:
+        """
+        This method extracts the tables named, the names not found in the dump are ignored. The views are
+        extracted only when asked for.
+        """
+        builder = SchemaBuilder(con.database, self._dialect, self._validate, self._interner)
+        self._populate(con, builder, names, views)
+        return builder.build()
+
+    def to_standard_schema(self, con: IConnection, type_map: TypeMap,
+                           overrides: TypeOverrides | None = None) -> DatabaseMetadata:
+        """
+        This method returns the database schema in a standard format
+        """
+        builder = StandardSchemaBuilder(con.database, self._dialect, type_map, self._validate, self._interner,
+                                        overrides)
+        self._populate(con, builder)
+        return builder.build()
+
+    def to_columnar_schema(self, con: IConnection, type_map: TypeMap,
+                           overrides: TypeOverrides | None = None) -> ColumnarDatabaseMetadata:
+        """
+        This method returns the database schema in the standard format, stored in columns
+        """
+        builder = ColumnarSchemaBuilder(con.database, self._dialect, type_map, self._validate, self._interner,
+                                        overrides)
+        self._populate(con, builder)
+        return builder.build()
+
+    def extract(self, con: IConnection) -> Database:
+        """
+        This method extracts the database schema from the dump file
+        """
+        builder = SchemaBuilder(con.database, self._dialect, self._validate, self._interner)
+        self._populate(con, builder)
+        return builder.build()
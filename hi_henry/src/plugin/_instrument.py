@@ -0,0 +1,128 @@
+# *******************************************************************************************
+#  File:  _instrument.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['QueryStats', 'InstrumentedConnectionFactory']
+
+import typing
+import attrs
+from ..model import IConnection, ConnectionFactory
+
+
+@attrs.define
+class QueryStats:
+    """
+    This class holds the number of connections, queries and rows seen by an instrumented connection factory
+    """
+    connections: int = attrs.field(default=0)
+    queries: int = attrs.field(default=0)
+    rows: int = attrs.field(default=0)
+
+    def reset(self) -> None:
+        self.connections = 0
+        self.queries = 0
+        self.rows = 0
+
+
+class _InstrumentedCursor:
+    """
+    This class wraps a driver cursor and counts the queries executed and the rows fetched
+    """
+
+    def __init__(self, cursor: typing.Any, stats: QueryStats):
+        self._cursor = cursor
+        self._stats = stats
+
+    def execute(self, sql: str, params: typing.Any = None) -> '_InstrumentedCursor':
+        self._stats.queries += 1
+        if params is None:
+            self._cursor.execute(sql)
+        else:
+            self._cursor.execute(sql, params)
+        return self
+
+    def fetchone(self) -> typing.Any:
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._stats.rows += 1
+        return row
+
+    def fetchmany(self, *args, **kwargs) -> list[typing.Any]:
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._stats.rows += len(rows)
+        return rows
+
+    def fetchall(self) -> list[typing.Any]:
+        rows = self._cursor.fetchall()
+        self._stats.rows += len(rows)
+        return rows
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        for row in self._cursor:
+            self._stats.rows += 1
+            yield row
+
+    def __getattr__(self, item: str) -> typing.Any:
+        return getattr(self._cursor, item)
+
+
+class _InstrumentedConnection:
+    """
+    This class wraps a driver connection so that the cursors it creates are counted
+    """
+
+    def __init__(self, connection: typing.Any, stats: QueryStats):
+        self.__dict__['_connection'] = connection
+        self.__dict__['_stats'] = stats
+
+    def cursor(self, *args, **kwargs) -> _InstrumentedCursor:
+        return _InstrumentedCursor(self._connection.cursor(*args, **kwargs), self._stats)
+
+    def execute(self, sql: str, params: typing.Any = None) -> _InstrumentedCursor:
+        return self.cursor().execute(sql, params)
+
+    def __getattr__(self, item: str) -> typing.Any:
+        return getattr(self._connection, item)
+
+    def __setattr__(self, key: str, value: typing.Any) -> None:
+        setattr(self._connection, key, value)
+
+
+class InstrumentedConnectionFactory:
+    """
+    This class wraps the connection factory of an explorer and counts the connections it opens, along with the
+    catalog queries and rows that pass through them
+    """
+    _factory: ConnectionFactory
+    _stats: QueryStats
+
+    def __init__(self, factory: ConnectionFactory):
+        """
+        Initializes an instance of the class
+
+        :param factory: The function that opens the real database connections, such as the connect method
+            of an explorer
+        """
+        self._factory = factory
+        self._stats = QueryStats()
+
+    @property
+    def stats(self) -> QueryStats:
+        return self._stats
+
+    def __call__(self, con: IConnection) -> _InstrumentedConnection:
+        self._stats.connections += 1
+        return _InstrumentedConnection(self._factory(con), self._stats)
@@ -0,0 +1,93 @@
+# *******************************************************************************************
+#  File:  _intern.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['InternStats', 'StringInterner']
+
+import sys
+import attrs
+
+
+@attrs.define
+class InternStats:
+    """
+    This class holds the number of strings held by a string interner and the memory it saved, which is the
+    size of the duplicate strings it replaced with the copy it holds
+    """
+    strings: int = attrs.field(default=0)
+    lookups: int = attrs.field(default=0)
+    duplicates: int = attrs.field(default=0)
+    bytes_saved: int = attrs.field(default=0)
+
+    def reset(self) -> None:
+        self.strings = 0
+        self.lookups = 0
+        self.duplicates = 0
+        self.bytes_saved = 0
+
+
+class StringInterner:
+    """
+    This class replaces the strings read from the catalog with a single shared copy of each value, so that
+    the data type names and the table and column names repeated across columns, indexes and foreign keys
+    are held once. An interner can be shared by the extraction of many databases.
+
+    The interner holds every string it is given until it is cleared or dropped, so an interner shared by a
+    long running process grows with each new schema. The explorers use a new interner for each extraction
+    unless one is given, an interner passed to them should be scoped to a batch of extractions and cleared
+    or replaced after it.
+    """
+    _strings: dict[str, str]
+    _stats: InternStats
+
+    def __init__(self):
+        self._strings = dict()
+        self._stats = InternStats()
+
+    @property
+    def stats(self) -> InternStats:
+        return self._stats
+
+    def __call__(self, value: str | None) -> str | None:
+        """
+        This method returns the shared copy of a string, None is returned as it is
+        """
+        if value is None:
+            return None
+
+        stats = self._stats
+        stats.lookups += 1
+
+        held = self._strings.get(value)
+        if held is None:
+            self._strings[value] = value
+            stats.strings += 1
+            return value
+
+        if held is not value:
+            stats.duplicates += 1
+            stats.bytes_saved += sys.getsizeof(value)
+        return held
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def clear(self) -> None:
+        """
+        This method drops the strings held, the schemas already built keep their copies
+        """
+        self._strings.clear()
+        self._stats.reset()
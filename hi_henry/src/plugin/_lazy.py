@@ -0,0 +1,316 @@
+# *******************************************************************************************
+#  File:  _lazy.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['LazyDatabaseMetadata', 'LazyDatabase']
+
+import typing
+from collections import OrderedDict
+from collections.abc import Mapping, Collection, ItemsView, ValuesView
+from ..data_maps import TypeMap, TypeOverrides
+from ._normalizer import _override, _column_length
+from ..model._standard import _ReadOnlySchema, _ReadOnlyMetadata
+from ..model import IConnection, Database, DatabaseType, Table, View, TableMetaData, ColumnMetadata, \
+    IndexMetadata, ForeignKeyMetadata, ViewMetaData, ViewColumnMetadata, StandardDataType
+
+_T = typing.TypeVar('_T')
+
+
+class _MemoMapping(Mapping):
+    """
+    This class maps the names of the tables or views of a schema to their standard metadata, which is
+    computed the first time each one is read and kept for later reads
+    """
+    __slots__ = ('_source', '_convert', '_cache')
+
+    def __init__(self, source: dict[str, typing.Any], convert: typing.Callable[[typing.Any], _T]):
+        self._source = source
+        self._convert = convert
+        self._cache: dict[str, _T] = dict()
+
+    def __getitem__(self, name: str) -> _T:
+        item = self._cache.get(name)
+        if item is None:
+            item = self._cache[name] = self._convert(self._source[name])
+        return item
+
+    def __contains__(self, name: typing.Any) -> bool:
+        return name in self._source
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._source)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    @property
+    def loaded(self) -> int:
+        return len(self._cache)
+
+
+class LazyDatabaseMetadata(_ReadOnlyMetadata):
+    """
+    This class gives the standard metadata of an extracted database schema without converting it up front.
+    A table or view is converted the first time it is read and the result is kept, so reading a few tables
+    of a large schema costs only the conversion of those tables.
+    """
+    _database: Database
+    _type_map: TypeMap
+    _overrides: TypeOverrides | None
+    _data_types: dict[str, tuple[StandardDataType, int | None]]
+    _tables: _MemoMapping
+    _views: _MemoMapping
+
+    def __init__(self, database: Database, type_map: TypeMap, overrides: TypeOverrides | None = None):
+        """
+        Initializes an instance of the class
+
+        :param database: The schema returned by the extract method of an explorer
+        :param type_map: The map used to convert the DBMS data types into the standard types
+        :param overrides: The rules giving the type of some columns in place of the type map
+        """
+        self._database = database
+        self._type_map = type_map
+        self._overrides = overrides
+        self._data_types = dict()
+        self._tables = _MemoMapping(database.tables, self._table)
+        self._views = _MemoMapping(database.views, self._view)
+
+    @property
+    def name(self) -> str:
+        return self._database.name
+
+    @property
+    def type(self) -> DatabaseType:
+        return self._database.type
+
+    @property
+    def tables(self) -> Mapping[str, TableMetaData]:
+        return self._tables
+
+    @property
+    def views(self) -> Mapping[str, ViewMetaData]:
+        return self._views
+
+    @property
+    def loaded_tables(self) -> int:
+        return self._tables.loaded
+
+    def _resolve(self, data_type: str) -> tuple[StandardDataType, int | None]:
+        """
+        This method returns the standard data type for a DBMS data type, with the length given in the data type
+        """
+        resolved = self._data_types.get(data_type)
+        if resolved is None:
+            parsed = self._type_map.resolve(data_type)
+            resolved = self._data_types[data_type] = (StandardDataType(parsed.target), parsed.length)
+        return resolved
+
+    def _table(self, table: Table) -> TableMetaData:
+        resolve = self._resolve
+        columns = dict()
+        overrides = self._overrides
+        for col in table.columns.values():
+            standard, type_length = resolve(col.data_type)
+            if overrides is not None:
+                standard = _override(overrides, table.name, col.name, standard)
+            columns[col.name] = ColumnMetadata(col.name, standard, _column_length(col.length, type_length),
+                                               col.is_nullable, col.is_unique, col.is_auto, col.is_primary)
+        indexes = [IndexMetadata(index.name, list(index.columns), index.is_unique, index.is_primary)
+                   for index in table.indexes]
+        foreign_keys = [ForeignKeyMetadata(key.name, key.column, key.foreign_table, key.foreign_column)
+                        for key in table.foreign_keys]
+        return TableMetaData(table.name, columns, indexes, foreign_keys)
+
+    def _view(self, view: View) -> ViewMetaData:
+        resolve = self._resolve
+        columns = dict()
+        overrides = self._overrides
+        for col in view.columns.values():
+            standard, type_length = resolve(col.data_type)
+            if overrides is not None:
+                standard = _override(overrides, view.name, col.name, standard)
+            columns[col.name] = ViewColumnMetadata(col.name, standard, col.order,
+                                                   _column_length(col.length, type_length))
+        return ViewMetaData(view.name, columns)
+
+
+class _TableItems(ItemsView):
+    def __iter__(self) -> typing.Iterator[tuple[str, Table]]:
+        return self._mapping.iter_items()
+
+
+class _TableValues(ValuesView):
+    def __iter__(self) -> typing.Iterator[Table]:
+        return (table for _, table in self._mapping.iter_items())
+
+
+class _LiveTables(Mapping):
+    """
+    This class maps the names of the tables of a live database to their definitions, which are read from the
+    database the first time each one is needed. The tables read most recently are kept, up to a limit.
+    """
+    __slots__ = ('_names', '_load', '_cache', '_max_tables', '_loads')
+
+    def __init__(self, names: list[str], load: typing.Callable[[list[str]], dict[str, Table]], max_tables: int):
+        self._names = dict.fromkeys(names)
+        self._load = load
+        self._cache: OrderedDict[str, Table] = OrderedDict()
+        self._max_tables = max_tables
+        self._loads = 0
+
+    def _fetch(self, names: list[str]) -> dict[str, Table]:
+        """
+        This method reads the tables named with one batch of queries and keeps them, dropping the tables
+        least recently used when there are more than the limit
+        """
+        tables = self._load(names)
+        self._loads += 1
+
+        cache = self._cache
+        for name, table in tables.items():
+            cache[name] = table
+            cache.move_to_end(name)
+        while len(cache) > self._max_tables:
+            cache.popitem(last=False)
+        return tables
+
+    def __getitem__(self, name: str) -> Table:
+        table = self._cache.get(name)
+        if table is not None:
+            self._cache.move_to_end(name)
+            return table
+        if name not in self._names:
+            raise KeyError(name)
+        return self._fetch([name])[name]
+
+    def __contains__(self, name: typing.Any) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def items(self) -> ItemsView:
+        return _TableItems(self)
+
+    def values(self) -> ValuesView:
+        return _TableValues(self)
+
+    def iter_items(self) -> typing.Iterator[tuple[str, Table]]:
+        """
+        This method returns the tables in order, reading those not kept in batches the size of the limit
+        """
+        names = list(self._names)
+        for start in range(0, len(names), self._max_tables):
+            batch = names[start:start + self._max_tables]
+            tables = {name: self._cache[name] for name in batch if name in self._cache}
+            missing = [name for name in batch if name not in tables]
+            if missing:
+                tables.update(self._fetch(missing))
+            for name in batch:
+                if name in tables:
+                    yield name, tables[name]
+
+    def prefetch(self, names: Collection[str]) -> None:
+        missing = [name for name in dict.fromkeys(names) if name in self._names and name not in self._cache]
+        if missing:
+            self._fetch(missing)
+
+    @property
+    def loaded(self) -> int:
+        return len(self._cache)
+
+    @property
+    def loads(self) -> int:
+        return self._loads
+
+
+class LazyDatabase(_ReadOnlySchema):
+    """
+    This class gives the schema of a live database without extracting it up front. The table names are read
+    with one query, the columns, indexes and foreign keys of a table are read the first time the table is
+    used. At most max_tables tables are kept, the least recently used are dropped and read again if needed.
+    """
+    _explorer: typing.Any
+    _con: IConnection
+    _name: str
+    _type: DatabaseType
+    _tables: _LiveTables
+    _views: dict[str, View] | None
+
+    def __init__(self, explorer: typing.Any, con: IConnection, max_tables: int = 256):
+        """
+        Initializes an instance of the class
+
+        :param explorer: The explorer for the database, it must provide table_names and extract_tables
+        :param con: The connection details for the database
+        :param max_tables: The number of tables kept after being read
+        """
+        if max_tables < 1:
+            raise ValueError(f"The number of tables kept must be at least one: {max_tables}")
+
+        self._explorer = explorer
+        self._con = con
+        self._name = con.database
+        self._type = explorer.database_type
+        self._tables = _LiveTables(explorer.table_names(con), self._load, max_tables)
+        self._views = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def type(self) -> DatabaseType:
+        return self._type
+
+    @property
+    def tables(self) -> Mapping[str, Table]:
+        return self._tables
+
+    @property
+    def views(self) -> dict[str, View]:
+        if self._views is None:
+            self._views = self._explorer.extract_tables(self._con, [], views=True).views
+        return self._views
+
+    @property
+    def loaded_tables(self) -> int:
+        return self._tables.loaded
+
+    @property
+    def loads(self) -> int:
+        return self._tables.loads
+
+    def _load(self, names: list[str]) -> dict[str, Table]:
+        return self._explorer.extract_tables(self._con, names).tables
+
+    def prefetch(self, names: Collection[str]) -> None:
+        """
+        This method reads the tables named that are not kept with one batch of queries, ahead of their use.
+        When more tables are named than are kept, only the last of them are kept.
+        """
+        self._tables.prefetch(names)
+
+    def to_database(self) -> Database:
+        """
+        This method returns the whole schema, reading the tables not kept
+        """
+        return Database(self.name, self.type, dict(self._tables.items()), dict(self.views))
+
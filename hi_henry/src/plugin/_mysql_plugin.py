@@ -18,15 +18,19 @@ __status__ = "Production"
 
 __all__ = ['MySQLDatabaseExplorer']
 
+from collections.abc import Collection
 from contextlib import contextmanager
+from typing import Any
 from mysql.connector import connect, MySQLConnection
 from mysql.connector.cursor import MySQLCursorNamedTuple
 from mysql.connector.errors import ProgrammingError
-from ..data_maps import TypeMap
-from ..model import ViewColumn, View, Column, Index, ForeignKey, Table, Database, IConnection, DatabaseType, \
-    DatabaseMetadata, ViewMetaData, ViewColumnMetadata, TableMetaData, ColumnMetadata, IndexMetadata, \
-    ForeignKeyMetadata, StandardDataType
+from ..data_maps import TypeMap, TypeOverrides
+from ..model import Database, IConnection, DatabaseType, ConnectionFactory, DatabaseMetadata, \
+    ColumnarDatabaseMetadata
 from ..errors import DatabaseNotFoundError
+from ._intern import StringInterner
+from ._session import connection_session, session_connection
+from ._normalizer import ISchemaBuilder, SchemaBuilder, StandardSchemaBuilder, ColumnarSchemaBuilder
 
 
 # noinspection SqlDialectInspection
@@ -34,11 +38,38 @@ class MySQLDatabaseExplorer:
     """
     This class handles the extraction of the MySQL database schema
     """
-    @staticmethod
-    def _get_database_connection(con: IConnection) -> MySQLConnection:
+    _connection_factory: ConnectionFactory | None
+    _validate: bool
+    _interner: StringInterner | None
+
+    def __init__(self, connection_factory: ConnectionFactory | None = None, validate: bool = True,
+                 interner: StringInterner | None = None):
+        """
+        Initializes an instance of the class
+
+        :param connection_factory: Replaces the function used to open the database connections, used to record
+            and replay the catalog queries
+        :param validate: Validates the models built from the catalog rows, it can be turned off for a trusted
+            driver to speed up the extraction of large schemas
+        :param interner: Shares the names and data types read from the catalog with the schemas extracted by
+            other explorers, a new interner is used for each extraction by default
+        """
+        self._connection_factory = connection_factory
+        self._validate = validate
+        self._interner = interner
+
+    def _get_database_connection(self, con: IConnection) -> MySQLConnection:
         """
         Returns a connection to a MySQL database
         """
+        factory = self._connection_factory or self.connect
+        return session_connection(self, lambda: factory(con))
+
+    @staticmethod
+    def connect(con: IConnection) -> MySQLConnection:
+        """
+        This method opens a connection to a MySQL database, it is the default connection factory
+        """
         return connect(user=con.user, password=con.password, host=con.host, port=con.port, database=con.database,
                        use_pure=True, consume_results=True)
 
@@ -57,175 +88,130 @@ class MySQLDatabaseExplorer:
             if cursor:
                 cursor.close()
 
-    # region Views
-
-    def _get_view_names(self, con: IConnection) -> list[str]:
-        """
-        This method returns the names of the views in a database
-        """
-        names = list()
-
-        with self._database_cursor(con) as cursor:
-            cursor.execute(f"""SELECT TABLE_NAME AS name FROM information_schema.tables
-                                WHERE (TABLE_SCHEMA = %s) AND (TABLE_TYPE = 'VIEW')
-                                ORDER BY TABLE_NAME;""", (con.database,))
-
-            rows = cursor.fetchall()
-            if rows:
-                for row in rows:
-                    names.append(row.name)
-
-        return names
-
-    def _get_view_columns(self, view: str, con: IConnection) -> list[ViewColumn]:
+    @staticmethod
+    def _decode(value: Any) -> Any:
         """
-        This method extracts the column metadata for a view
+        This method converts the binary strings returned for some catalog columns into text
         """
-        columns = list()
-
-        with self._database_cursor(con) as cursor:
-            cursor.execute(f"""SELECT COLUMN_NAME AS name, ORDINAL_POSITION AS position, DATA_TYPE AS data_type,
-                                    CHARACTER_MAXIMUM_LENGTH AS length  FROM INFORMATION_SCHEMA.COLUMNS
-                                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s ORDER BY ORDINAL_POSITION;""",
-                           (con.database, view))
+        if isinstance(value, (bytes, bytearray)):
+            return value.decode('UTF-8')
+        return value
 
-            rows = cursor.fetchall()
-            if rows:
-                for row in rows:
-                    columns.append(ViewColumn(row.name, row.data_type.decode('UTF-8'), row.position, row.length))
-            return columns
+    # region Tables and Views
 
-    def _get_view(self, name: str, con: IConnection) -> View:
+    @staticmethod
+    def _table_filter(names: list[str] | None, views: bool = False) -> tuple[str, tuple]:
         """
-        This method extracts the table metadata from the database
+        Returns the condition that limits a catalog query to some of the tables, and to the views when asked
+        for, with its parameters
         """
-        view = View(name)
+        if names is None:
+            return '', ()
 
-        cols = self._get_view_columns(name, con)
-        for col in cols:
-            view.columns[col.name] = col
+        conditions = [f"TABLE_NAME IN ({', '.join(['%s'] * len(names))})"] if names else []
+        if views:
+            conditions.append("TABLE_TYPE = 'VIEW'")
+        return f" AND ({' OR '.join(conditions) or 'FALSE'})", tuple(names)
 
-        return view
-
-    # endregion
-
-    # region Tables
-
-    def _get_table_names(self, database_name: str, con: IConnection) -> list[str]:
+    def _get_object_names(self, con: IConnection, names: list[str] | None = None) -> tuple[list[str], list[str]]:
         """
-        This method extracts the list of table names
+        This method returns the names of the tables and of the views in a database, limited to the tables
+        named when they are given
         """
-        names = list()
+        tables = list()
+        views = list()
+        condition, params = self._table_filter(names, views=True)
 
         with self._database_cursor(con) as cursor:
-            cursor.execute(f"""SELECT TABLE_NAME AS name FROM information_schema.tables
-                                WHERE (TABLE_SCHEMA = %s) AND (TABLE_TYPE = 'BASE TABLE') 
-                                ORDER BY TABLE_NAME;""", (database_name,))
+            cursor.execute(f"""SELECT TABLE_NAME AS name, TABLE_TYPE AS table_type FROM information_schema.tables
+                                WHERE (TABLE_SCHEMA = %s) AND (TABLE_TYPE IN ('BASE TABLE', 'VIEW')){condition}
+                                ORDER BY TABLE_NAME;""", (con.database,) + params)
             rows = cursor.fetchall()
             if rows:
                 for row in rows:
-                    names.append(row.name)
+                    if self._decode(row.table_type) == 'VIEW':
+                        views.append(row.name)
+                    else:
+                        tables.append(row.name)
 
-        return names
+        return tables, views
 
-    def _get_columns(self, table: str, con: IConnection) -> list[Column]:
+    def _read_columns(self, con: IConnection, views: set[str], builder: ISchemaBuilder,
+                      names: list[str] | None = None) -> None:
         """
-        This method extracts the column metadata for a given table
+        This method reads the column metadata for all the tables and views, or for those named
         """
-        columns = list()
+        condition, params = self._table_filter(names)
 
         with self._database_cursor(con) as cursor:
-            cursor.execute(f"""SELECT COLUMN_NAME AS name, ORDINAL_POSITION AS position, COLUMN_DEFAULT AS default_value, 
-                                    IS_NULLABLE AS is_null, DATA_TYPE AS data_type, CHARACTER_MAXIMUM_LENGTH AS length, 
-                                    COLUMN_KEY AS col_key, EXTRA AS extra FROM INFORMATION_SCHEMA.COLUMNS
-                                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s ORDER BY ORDINAL_POSITION;""",
-                           (con.database, table))
+            cursor.execute(f"""SELECT TABLE_NAME AS table_name, COLUMN_NAME AS name, ORDINAL_POSITION AS position, 
+                                    COLUMN_DEFAULT AS default_value, IS_NULLABLE AS is_null, DATA_TYPE AS data_type, 
+                                    CHARACTER_MAXIMUM_LENGTH AS length, COLUMN_KEY AS col_key, EXTRA AS extra 
+                                FROM INFORMATION_SCHEMA.COLUMNS
+                                WHERE TABLE_SCHEMA = %s{condition} ORDER BY TABLE_NAME, ORDINAL_POSITION;""",
+                           (con.database,) + params)
 
             rows = cursor.fetchall()
             if rows:
                 for row in rows:
+                    data_type = self._decode(row.data_type)
+
+                    if row.table_name in views:
+                        builder.add_view_column(row.table_name, row.name, data_type, row.position, row.length)
+                        continue
+
                     is_pk = row.col_key == 'PRI'
                     is_uk = row.col_key == 'UNI'
                     is_auto = row.extra == 'auto_increment'
 
                     default_value = None
                     if row.default_value:
-                        default_value = row.default_value.decode('UTF-8')
+                        default_value = self._decode(row.default_value)
 
-                    columns.append(Column(row.name, row.data_type.decode('UTF-8'), row.position, row.length,
-                                          bool(row.is_null), False, is_uk, is_auto, is_pk, default_value))
-        return columns
+                    builder.add_column(row.table_name, row.name, data_type, row.position, row.length,
+                                       bool(row.is_null), False, is_uk, is_auto, is_pk, default_value)
 
-    def _get_indexes(self, table: str, con: IConnection) -> list[Index]:
+    def _read_indexes(self, con: IConnection, builder: ISchemaBuilder, names: list[str] | None = None) -> None:
         """
-        This method extracts the index metadata for a table
+        This method reads the index metadata, with the index columns, for all the tables, or for those named
         """
-        indexes = list()
+        indexes: dict[tuple[str, str], tuple[bool, list[tuple[int, str]]]] = dict()
+        condition, params = self._table_filter(names)
 
         with self._database_cursor(con) as cursor:
-            cursor.execute("""SELECT DISTINCT INDEX_NAME AS name, INDEX_COMMENT AS comment, !NON_UNIQUE AS is_unique
+            cursor.execute(f"""SELECT TABLE_NAME AS table_name, INDEX_NAME AS name, NON_UNIQUE AS non_unique, 
+                                    SEQ_IN_INDEX AS seq, COLUMN_NAME AS column_name
                                 FROM INFORMATION_SCHEMA.STATISTICS
-                                WHERE (TABLE_SCHEMA = %s) AND (TABLE_NAME = %s);""", (con.database, table))
+                                WHERE (TABLE_SCHEMA = %s){condition};""", (con.database,) + params)
             rows = cursor.fetchall()
             if rows:
                 for row in rows:
-                    is_pk = False
-                    if row.name == 'PRIMARY':
-                        is_pk = True
+                    key = (row.table_name, row.name)
+                    if key not in indexes:
+                        indexes[key] = (not bool(row.non_unique), list())
+                    indexes[key][1].append((row.seq, row.column_name))
 
-                    ndx = Index(row.name, is_unique=bool(row.is_unique), is_primary=is_pk)
-                    indexes.append(ndx)
+        for (table, name), (is_unique, columns) in indexes.items():
+            builder.add_index(table, name, [column for _, column in sorted(columns)], is_unique=is_unique,
+                              is_primary=name == 'PRIMARY')
 
-            for index in indexes:
-                cursor.execute("""SELECT COLUMN_NAME AS name FROM INFORMATION_SCHEMA.STATISTICS
-                                WHERE (TABLE_SCHEMA = %s) AND (TABLE_NAME = %s) AND (INDEX_NAME = %s);""",
-                               (con.database, table, index.name))
-                rows = cursor.fetchall()
-                if rows:
-                    for row in rows:
-                        index.columns.append(row.name)
-
-        return indexes
-
-    def _get_foreign_keys(self, table: str, con: IConnection) -> list[ForeignKey]:
+    def _read_foreign_keys(self, con: IConnection, builder: ISchemaBuilder, names: list[str] | None = None) -> None:
         """
-        This method extracts the foreign key metadata for a table
+        This method reads the foreign key metadata for all the tables, or for those named
         """
-        keys = list()
+        condition, params = self._table_filter(names)
 
         with self._database_cursor(con) as cursor:
-            cursor.execute("""SELECT CONSTRAINT_NAME AS name, COLUMN_NAME AS column_name,
+            cursor.execute(f"""SELECT TABLE_NAME AS table_name, CONSTRAINT_NAME AS name, COLUMN_NAME AS column_name,
                                 REFERENCED_TABLE_NAME AS foreign_table, REFERENCED_COLUMN_NAME foreign_column
                                 FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-                                WHERE (REFERENCED_TABLE_SCHEMA = %s) AND 
-                                    (TABLE_NAME = %s) ORDER BY COLUMN_NAME;""", (con.database, table))
+                                WHERE (TABLE_SCHEMA = %s) AND (REFERENCED_TABLE_SCHEMA = %s){condition} 
+                                ORDER BY TABLE_NAME, COLUMN_NAME;""", (con.database, con.database) + params)
             rows = cursor.fetchall()
             if rows:
                 for row in rows:
-                    keys.append(ForeignKey(row.name, row.column_name, row.foreign_table, row.foreign_column))
-
-        return keys
-
-    def _get_table(self, name: str, con: IConnection) -> Table:
-        """
-        This method extracts the table metadata from the database
-        """
-        tbl = Table(name)
-
-        # Columns
-        cols = self._get_columns(name, con)
-        for col in cols:
-            tbl.columns[col.name] = col
-
-        # Indexes
-        indexes = self._get_indexes(name, con)
-        tbl.indexes.extend(indexes)
-
-        # Foreign Keys
-        keys = self._get_foreign_keys(name, con)
-        tbl.foreign_keys.extend(keys)
-
-        return tbl
+                    builder.add_foreign_key(row.table_name, row.name, row.column_name, row.foreign_table,
+                                            row.foreign_column)
 
     # endregion
 
@@ -244,67 +230,96 @@ class MySQLDatabaseExplorer:
 
         return names
 
-    def to_standard_schema(self, con: IConnection, type_map: TypeMap) -> DatabaseMetadata:
+    def _check_database(self, con: IConnection) -> None:
         """
-        This method returns the database schema in a standard format
+        This method checks that the connection to the database works
         """
-        data = self.extract(con)
-
-        meta = DatabaseMetadata(data.name, data.type)
-
-        for _, view in data.views.items():
-            m_view = ViewMetaData(view.name)
-            for _, col in view.columns.items():
-                data_type = StandardDataType(type_map[col.data_type.upper()])
-                m_col = ViewColumnMetadata(col.name, data_type, col.order, col.length)
-                m_view.columns[m_col.name] = m_col
+        try:
+            self._get_database_names(con)
+        except ProgrammingError as ex:
+            if 'Unknown database' in str(ex):
+                raise DatabaseNotFoundError(f"The following database could not be found: {con.database}")
 
-            meta.views[m_view.name] = m_view
+    def _populate(self, con: IConnection, builder: ISchemaBuilder, tables: Collection[str] | None = None,
+                  views: bool = True) -> None:
+        """
+        This method streams the database schema into a builder, using one query for each kind of catalog object.
+        Only the tables named are read when they are given.
+        """
+        names = None if tables is None else list(tables)
 
-        for _, table in data.tables.items():
-            m_table = TableMetaData(table.name)
+        with connection_session(self):
+            self._check_database(con)
 
-            for _, col in table.columns.items():
-                data_type = StandardDataType(type_map[col.data_type.upper()])
-                m_col = ColumnMetadata(col.name, data_type, col.length, col.is_nullable, col.is_unique,
-                                       col.is_auto, col.is_primary)
-                m_table.columns[m_col.name] = m_col
+            table_names, view_names = self._get_object_names(con, names)
+            if not views:
+                view_names = list()
 
-            for index in table.indexes:
-                m_index = IndexMetadata(index.name, is_primary=index.is_primary, is_unique=index.is_unique)
-                m_index.columns.extend(index.columns)
+            # Views
+            for name in view_names:
+                builder.add_view(name)
 
-                m_table.indexes.append(m_index)
+            # Tables
+            for name in table_names:
+                builder.add_table(name)
 
-            for key in table.foreign_keys:
-                m_key = ForeignKeyMetadata(key.name, key.column, key.foreign_table, key.foreign_column)
-                m_table.foreign_keys.append(m_key)
+            if names is None:
+                self._read_columns(con, set(view_names), builder)
+                self._read_indexes(con, builder)
+                self._read_foreign_keys(con, builder)
+                return
 
-            meta.tables[m_table.name] = m_table
+            if table_names or view_names:
+                self._read_columns(con, set(view_names), builder, table_names + view_names)
+            if table_names:
+                self._read_indexes(con, builder, table_names)
+                self._read_foreign_keys(con, builder, table_names)
 
-        return meta
+    @property
+    def database_type(self) -> DatabaseType:
+        return DatabaseType.MySQL
 
-    def extract(self, con: IConnection) -> Database:
+    def table_names(self, con: IConnection) -> list[str]:
         """
-        This method extracts the database schema
+        This method returns the names of the tables in the database
         """
-        try:
-            # check that the connection to the database works
-            self._get_database_names(con)
-        except ProgrammingError as ex:
-            if 'Unknown database' in str(ex):
-                raise DatabaseNotFoundError(f"The following database could not be found: {con.database}")
+        with connection_session(self):
+            self._check_database(con)
+            return self._get_object_names(con)[0]
 
-        db = Database(con.database, DatabaseType.MySQL)
+    def extract_tables(self, con: IConnection, names: Collection[str], views: bool = False) -> Database:
+        """
+        This method extracts the tables named, the names not found in the database are ignored. The views
+        are extracted only when asked for.
+        """
+        builder = SchemaBuilder(con.database, DatabaseType.MySQL, self._validate, self._interner)
+        self._populate(con, builder, names, views)
+        return builder.build()
 
-        # Views
-        view_names = self._get_view_names(con)
-        for name in view_names:
-            db.views[name] = self._get_view(name, con)
+    def to_standard_schema(self, con: IConnection, type_map: TypeMap,
+                           overrides: TypeOverrides | None = None) -> DatabaseMetadata:
+        """
+        This method returns the database schema in a standard format
+        """
+        builder = StandardSchemaBuilder(con.database, DatabaseType.MySQL, type_map, self._validate, self._interner,
+                                        overrides)
+        self._populate(con, builder)
+        return builder.build()
 
-        # Tables
-        table_names = self._get_table_names(con.database, con)
-        for name in table_names:
-            db.tables[name] = self._get_table(name, con)
+    def to_columnar_schema(self, con: IConnection, type_map: TypeMap,
+                           overrides: TypeOverrides | None = None) -> ColumnarDatabaseMetadata:
+        """
+        This method returns the database schema in the standard format, stored in columns
+        """
+        builder = ColumnarSchemaBuilder(con.database, DatabaseType.MySQL, type_map, self._validate, self._interner,
+                                        overrides)
+        self._populate(con, builder)
+        return builder.build()
 
-        return db
+    def extract(self, con: IConnection) -> Database:
+        """
+        This method extracts the database schema
+        """
+        builder = SchemaBuilder(con.database, DatabaseType.MySQL, self._validate, self._interner)
+        self._populate(con, builder)
+        return builder.build()
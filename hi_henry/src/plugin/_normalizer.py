@@ -0,0 +1,448 @@
+# *******************************************************************************************
+#  File:  _normalizer.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['ISchemaBuilder', 'SchemaBuilder', 'StandardSchemaBuilder', 'ColumnarSchemaBuilder', 'normalize',
+           'resolve_data_types']
+
+import abc
+import functools
+import typing
+from array import array
+import attrs
+from ..data_maps import TypeMap, TypeOverrides
+from ._intern import StringInterner
+from ..model import ViewColumn, View, Column, Index, ForeignKey, Table, Database, DatabaseType, DatabaseMetadata, \
+    ViewMetaData, ViewColumnMetadata, TableMetaData, ColumnMetadata, IndexMetadata, ForeignKeyMetadata, \
+    StandardDataType, ColumnarDatabaseMetadata
+
+
+class ISchemaBuilder(typing.Protocol):
+    """
+    This class defines the interface used by the explorers to stream the catalog rows into a schema model.
+    Tables and views must be added before their columns, indexes and foreign keys.
+    """
+
+    def add_table(self, name: str, comment: str | None = None) -> None:
+        ...
+
+    def add_column(self, table: str, name: str, data_type: str, order: int, length: int | None = None,
+                   is_nullable: bool = False, is_key: bool = False, is_unique: bool = False, is_auto: bool = False,
+                   is_primary: bool = False, default: str | None = None, comment: str | None = None) -> None:
+        ...
+
+    def set_column_flags(self, table: str, name: str, **flags: bool) -> None:
+        ...
+
+    def add_index(self, table: str, name: str, columns: list[str], is_unique: bool = False,
+                  is_primary: bool = False, comment: str | None = None) -> None:
+        ...
+
+    def add_foreign_key(self, table: str, name: str, column: str, foreign_table: str, foreign_column: str,
+                        comment: str | None = None) -> None:
+        ...
+
+    def add_view(self, name: str, comment: str | None = None) -> None:
+        ...
+
+    def add_view_column(self, view: str, name: str, data_type: str, order: int, length: int | None = None,
+                        comment: str | None = None) -> None:
+        ...
+
+    def build(self) -> typing.Any:
+        ...
+
+
+# The position of each column flag in a column draft, which holds the arguments of the column model in order
+_COLUMN_FLAGS = {'is_nullable': 4, 'is_key': 5, 'is_unique': 6, 'is_auto': 7, 'is_primary': 8}
+
+
+class _TableDraft:
+    """
+    This class holds a table while the catalog rows stream in, its parts are kept as the arguments of
+    their models
+    """
+    __slots__ = ('name', 'comment', 'columns', 'indexes', 'foreign_keys')
+
+    def __init__(self, name: str, comment: str | None):
+        self.name = name
+        self.comment = comment
+        self.columns: dict[str, list] = dict()
+        self.indexes: list[tuple] = list()
+        self.foreign_keys: list[tuple] = list()
+
+
+class _ViewDraft:
+    """
+    This class holds a view while the catalog rows stream in
+    """
+    __slots__ = ('name', 'comment', 'columns')
+
+    def __init__(self, name: str, comment: str | None):
+        self.name = name
+        self.comment = comment
+        self.columns: list[tuple[str, str, int, int | None, str | None]] = list()
+
+
+def _field_value(cls: type, field: attrs.Attribute, kwargs: dict[str, typing.Any]) -> typing.Any:
+    """
+    This function returns the value of a field not passed by position, from the keyword arguments or its default
+    """
+    if field.name in kwargs:
+        return kwargs[field.name]
+    if isinstance(field.default, attrs.Factory):
+        return field.default.factory()
+    if field.default is attrs.NOTHING:
+        raise TypeError(f"{cls.__name__} is missing the argument: {field.name}")
+    return field.default
+
+
+@functools.cache
+def _unvalidated(cls: type) -> typing.Callable[..., typing.Any]:
+    """
+    This function returns a constructor for an attrs model that takes the same arguments as the model but skips
+    its validators, without touching the validators of the other instances built at the same time
+    """
+    fields = attrs.fields(cls)
+    names = tuple(field.name for field in fields)
+    converters = {field.name: field.converter for field in fields if field.converter is not None}
+    new = object.__new__
+    setattr_ = object.__setattr__
+
+    def build(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        instance = new(cls)
+        for name, value in zip(names, args):
+            setattr_(instance, name, value)
+        for field in fields[len(args):]:
+            setattr_(instance, field.name, _field_value(cls, field, kwargs))
+        for name, converter in converters.items():
+            setattr_(instance, name, converter(getattr(instance, name)))
+        return instance
+
+    return build
+
+
+class _DraftBuilder(abc.ABC):
+    """
+    This class collects the catalog rows into mutable drafts, which are frozen into the public models once,
+    when the schema is built. Validating the models can be skipped for trusted driver rows.
+
+    The names, data types and default values are passed through a string interner, so that each value
+    repeated across the schema is held once.
+    """
+    _name: str
+    _database_type: DatabaseType
+    _validate: bool
+    _interner: StringInterner
+    _tables: dict[str, _TableDraft]
+    _views: dict[str, _ViewDraft]
+
+    def __init__(self, name: str, database_type: DatabaseType, validate: bool = True,
+                 interner: StringInterner | None = None):
+        self._name = name
+        self._database_type = database_type
+        self._validate = validate
+        self._interner = interner if interner is not None else StringInterner()
+        self._tables = dict()
+        self._views = dict()
+
+    @property
+    def interner(self) -> StringInterner:
+        return self._interner
+
+    def add_table(self, name: str, comment: str | None = None) -> None:
+        name = self._interner(name)
+        self._tables[name] = _TableDraft(name, comment)
+
+    def add_column(self, table: str, name: str, data_type: str, order: int, length: int | None = None,
+                   is_nullable: bool = False, is_key: bool = False, is_unique: bool = False, is_auto: bool = False,
+                   is_primary: bool = False, default: str | None = None, comment: str | None = None) -> None:
+        intern = self._interner
+        name = intern(name)
+        self._tables[table].columns[name] = [name, intern(data_type), order, length, is_nullable, is_key, is_unique,
+                                             is_auto, is_primary, intern(default), comment]
+
+    def set_column_flags(self, table: str, name: str, **flags: bool) -> None:
+        column = self._tables[table].columns[name]
+        for flag, value in flags.items():
+            column[_COLUMN_FLAGS[flag]] = value
+
+    def add_index(self, table: str, name: str, columns: list[str], is_unique: bool = False,
+                  is_primary: bool = False, comment: str | None = None) -> None:
+        self._tables[table].indexes.append((name, [self._interner(column) for column in columns], is_unique,
+                                            is_primary, comment))
+
+    def add_foreign_key(self, table: str, name: str, column: str, foreign_table: str, foreign_column: str,
+                        comment: str | None = None) -> None:
+        intern = self._interner
+        self._tables[table].foreign_keys.append((name, intern(column), intern(foreign_table), intern(foreign_column),
+                                                 comment))
+
+    def add_view(self, name: str, comment: str | None = None) -> None:
+        name = self._interner(name)
+        self._views[name] = _ViewDraft(name, comment)
+
+    def add_view_column(self, view: str, name: str, data_type: str, order: int, length: int | None = None,
+                        comment: str | None = None) -> None:
+        intern = self._interner
+        self._views[view].columns.append((intern(name), intern(data_type), order, length, comment))
+
+    def _model(self, cls: type) -> typing.Callable[..., typing.Any]:
+        """
+        This method returns the constructor used for a model, which skips the validators when validation is off
+        """
+        return cls if self._validate else _unvalidated(cls)
+
+    @abc.abstractmethod
+    def _freeze(self) -> typing.Any:
+        ...
+
+    def build(self) -> typing.Any:
+        """
+        This method freezes the drafts into the public models
+        """
+        return self._freeze()
+
+
+class SchemaBuilder(_DraftBuilder):
+    """
+    This class builds the raw database schema, as reported by the DBMS
+    """
+
+    def _freeze(self) -> Database:
+        model = self._model
+        new_table, new_column, new_index, new_foreign_key = model(Table), model(Column), model(Index), \
+            model(ForeignKey)
+        new_view, new_view_column = model(View), model(ViewColumn)
+        database = model(Database)(self._name, self._database_type)
+
+        for draft in self._tables.values():
+            table = new_table(draft.name, comment=draft.comment)
+            columns = table.columns
+            for args in draft.columns.values():
+                columns[args[0]] = new_column(*args)
+            table.indexes.extend(new_index(*args) for args in draft.indexes)
+            table.foreign_keys.extend(new_foreign_key(*args) for args in draft.foreign_keys)
+            database.tables[table.name] = table
+
+        for draft in self._views.values():
+            view = new_view(draft.name, comment=draft.comment)
+            for args in draft.columns:
+                view.columns[args[0]] = new_view_column(*args)
+            database.views[view.name] = view
+
+        return database
+
+
+def _column_length(length: int | None, type_length: int | None) -> int | None:
+    """
+    This function returns the length of a column, taken from its data type when the catalog gives none
+    """
+    if length:
+        return length
+    return length if type_length is None else type_length
+
+
+def _override(overrides: TypeOverrides, table: str, column: str,
+              standard: StandardDataType | None) -> StandardDataType | None:
+    """
+    This function returns the standard data type given by the first override rule matching a column, or the
+    data type given when no rule matches it
+    """
+    rule = overrides.match(table, column)
+    return standard if rule is None else StandardDataType(rule.target)
+
+
+class StandardSchemaBuilder(_DraftBuilder):
+    """
+    This class builds the standard metadata straight from the catalog rows, without building the raw
+    schema first. Each distinct DBMS data type is resolved through the type map only once.
+    """
+    _type_map: TypeMap
+    _overrides: TypeOverrides | None
+    _data_types: dict[str, tuple[StandardDataType, int | None]]
+
+    def __init__(self, name: str, database_type: DatabaseType, type_map: TypeMap, validate: bool = True,
+                 interner: StringInterner | None = None, overrides: TypeOverrides | None = None):
+        super().__init__(name, database_type, validate, interner)
+        self._type_map = type_map
+        self._overrides = overrides
+        self._data_types = dict()
+
+    def _resolve(self, data_type: str) -> tuple[StandardDataType, int | None]:
+        """
+        This method returns the standard data type for a DBMS data type, with the length given in the data type
+        """
+        resolved = self._data_types.get(data_type)
+        if resolved is None:
+            parsed = self._type_map.resolve(data_type)
+            resolved = self._data_types[data_type] = (StandardDataType(parsed.target), parsed.length)
+        return resolved
+
+    def _freeze(self) -> DatabaseMetadata:
+        model = self._model
+        new_table, new_column, new_index, new_foreign_key = model(TableMetaData), model(ColumnMetadata), \
+            model(IndexMetadata), model(ForeignKeyMetadata)
+        new_view, new_view_column = model(ViewMetaData), model(ViewColumnMetadata)
+        database = model(DatabaseMetadata)(self._name, self._database_type)
+        resolve = self._resolve
+        overrides = self._overrides
+
+        for draft in self._views.values():
+            view = new_view(draft.name)
+            for name, data_type, order, length, _ in draft.columns:
+                standard, type_length = resolve(data_type)
+                if overrides is not None:
+                    standard = _override(overrides, draft.name, name, standard)
+                view.columns[name] = new_view_column(name, standard, order, _column_length(length, type_length))
+            database.views[view.name] = view
+
+        for draft in self._tables.values():
+            table = new_table(draft.name)
+            columns = table.columns
+            for name, data_type, _, length, is_nullable, _, is_unique, is_auto, is_primary, _, _ in \
+                    draft.columns.values():
+                standard, type_length = resolve(data_type)
+                if overrides is not None:
+                    standard = _override(overrides, draft.name, name, standard)
+                columns[name] = new_column(name, standard, _column_length(length, type_length), is_nullable,
+                                           is_unique, is_auto, is_primary)
+            table.indexes.extend(new_index(*args[:4]) for args in draft.indexes)
+            table.foreign_keys.extend(new_foreign_key(*args[:4]) for args in draft.foreign_keys)
+            database.tables[table.name] = table
+
+        return database
+
+
+class ColumnarSchemaBuilder(_DraftBuilder):
+    """
+    This class builds the standard metadata straight from the catalog rows into a columnar schema, which
+    holds the columns of all the tables in arrays rather than as one object each. The data types are
+    resolved in one batch before the columns are added, so the length of a column without one is taken from
+    the resolved data types.
+    """
+    _type_map: TypeMap
+    _overrides: TypeOverrides | None
+
+    def __init__(self, name: str, database_type: DatabaseType, type_map: TypeMap, validate: bool = True,
+                 interner: StringInterner | None = None, overrides: TypeOverrides | None = None):
+        super().__init__(name, database_type, validate, interner)
+        self._type_map = type_map
+        self._overrides = overrides
+
+    def _freeze(self) -> ColumnarDatabaseMetadata:
+        database = ColumnarDatabaseMetadata(self._name, self._database_type)
+        overrides = self._overrides
+
+        data_types = [column[1] for draft in self._tables.values() for column in draft.columns.values()]
+        distinct, inverse, type_lengths = resolve_data_types(data_types, self._type_map)
+        overridden: dict[int, StandardDataType] = dict()
+        row = 0
+        for draft in self._tables.values():
+            database.add_table(draft.name)
+            for name, _, _, length, is_nullable, _, is_unique, is_auto, is_primary, _, _ in draft.columns.values():
+                database.add_column(name, None, _column_length(length, type_lengths[inverse[row]]), is_nullable,
+                                    is_unique, is_auto, is_primary)
+                if overrides is not None:
+                    standard = _override(overrides, draft.name, name, None)
+                    if standard is not None:
+                        overridden[row] = standard
+                row += 1
+            for args in draft.indexes:
+                database.add_index(*args[:4])
+            for args in draft.foreign_keys:
+                database.add_foreign_key(*args[:4])
+
+        view_data_types = [column[1] for draft in self._views.values() for column in draft.columns]
+        view_distinct, view_inverse, view_type_lengths = resolve_data_types(view_data_types, self._type_map)
+        view_overridden: dict[int, StandardDataType] = dict()
+        row = 0
+        for draft in self._views.values():
+            database.add_view(draft.name)
+            for name, _, order, length, _ in draft.columns:
+                length = _column_length(length, view_type_lengths[view_inverse[row]])
+                database.add_view_column(name, None, order, length)
+                if overrides is not None:
+                    standard = _override(overrides, draft.name, name, None)
+                    if standard is not None:
+                        view_overridden[row] = standard
+                row += 1
+
+        database.set_column_types(*_set_types(distinct, inverse, overridden))
+        database.set_view_column_types(*_set_types(view_distinct, view_inverse, view_overridden))
+
+        return database
+
+
+def _set_types(distinct: list[StandardDataType], inverse: array,
+               overridden: dict[int, StandardDataType]) -> tuple[list[StandardDataType], array]:
+    """
+    This function sets the data types of the columns given by an override rule in a column of data types
+    """
+    positions = {standard: position for position, standard in enumerate(distinct)}
+    for column, standard in overridden.items():
+        position = positions.get(standard)
+        if position is None:
+            position = positions[standard] = len(distinct)
+            distinct.append(standard)
+            if position > 255 and inverse.typecode == 'B':
+                inverse = array('i', inverse)
+        inverse[column] = position
+    return distinct, inverse
+
+
+def resolve_data_types(data_types: typing.Sequence[str],
+                       type_map: TypeMap) -> tuple[list[StandardDataType], array, list[int | None]]:
+    """
+    This function maps a column of DBMS data types to the standard types. Each distinct data type goes
+    through the type map once, the result is returned as the distinct standard types along with the position
+    of the type of each column among them, and the length given in each distinct data type. The positions
+    take a byte each when there are no more than 256 distinct data types, as is usually the case.
+    """
+    distinct = list(dict.fromkeys(data_types))
+    positions = {data_type: position for position, data_type in enumerate(distinct)}
+    indices = map(positions.__getitem__, data_types)
+    inverse = array('B', bytes(indices)) if len(distinct) <= 256 else array('i', list(indices))
+
+    resolved = [type_map.resolve(data_type) for data_type in distinct]
+    return [StandardDataType(parsed.target) for parsed in resolved], inverse, [parsed.length for parsed in resolved]
+
+
+def normalize(database: Database, type_map: TypeMap, validate: bool = True,
+              interner: StringInterner | None = None, overrides: TypeOverrides | None = None) -> DatabaseMetadata:
+    """
+    This function converts an extracted database schema into the standard format
+    """
+    builder = StandardSchemaBuilder(database.name, database.type, type_map, validate, interner, overrides)
+
+    for view in database.views.values():
+        builder.add_view(view.name, view.comment)
+        for col in view.columns.values():
+            builder.add_view_column(view.name, col.name, col.data_type, col.order, col.length, col.comment)
+
+    for table in database.tables.values():
+        builder.add_table(table.name, table.comment)
+        for col in table.columns.values():
+            builder.add_column(table.name, col.name, col.data_type, col.order, col.length, col.is_nullable,
+                               col.is_key, col.is_unique, col.is_auto, col.is_primary, col.default, col.comment)
+        for index in table.indexes:
+            builder.add_index(table.name, index.name, index.columns, index.is_unique, index.is_primary,
+                              index.comment)
+        for key in table.foreign_keys:
+            builder.add_foreign_key(table.name, key.name, key.column, key.foreign_table, key.foreign_column,
+                                    key.comment)
+
+    return builder.build()
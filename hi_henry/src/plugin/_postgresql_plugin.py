@@ -18,17 +18,19 @@ __status__ = "Production"
 
 __all__ = ['PostgreSqlDatabaseExplorer']
 
+from collections.abc import Collection
 from contextlib import contextmanager
 from typing import Any
 
-import attrs
 import psycopg2
 
-from ..data_maps import TypeMap
-from ..model import ViewColumn, View, Column, Index, ForeignKey, Table, Database, IConnection, DatabaseType, \
-    DatabaseInfo, SchemaInfo, DatabaseMetadata, ViewMetaData, ViewColumnMetadata, TableMetaData, ColumnMetadata, \
-    IndexMetadata, ForeignKeyMetadata, StandardDataType
+from ..data_maps import TypeMap, TypeOverrides
+from ..model import Database, IConnection, DatabaseType, ConnectionFactory, DatabaseInfo, SchemaInfo, \
+    DatabaseMetadata, ColumnarDatabaseMetadata
 from ..errors import DatabaseNotFoundError, SchemaNotFoundError
+from ._intern import StringInterner
+from ._session import connection_session, session_connection
+from ._normalizer import ISchemaBuilder, SchemaBuilder, StandardSchemaBuilder, ColumnarSchemaBuilder
 
 
 # noinspection SqlDialectInspection
@@ -36,12 +38,38 @@ class PostgreSqlDatabaseExplorer:
     """
     This class handles the extraction of the MySQL database schema
     """
+    _connection_factory: ConnectionFactory | None
+    _validate: bool
+    _interner: StringInterner | None
 
-    @staticmethod
-    def _get_database_connection(con: IConnection) -> Any:
+    def __init__(self, connection_factory: ConnectionFactory | None = None, validate: bool = True,
+                 interner: StringInterner | None = None):
+        """
+        Initializes an instance of the class
+
+        :param connection_factory: Replaces the function used to open the database connections, used to record
+            and replay the catalog queries
+        :param validate: Validates the models built from the catalog rows, it can be turned off for a trusted
+            driver to speed up the extraction of large schemas
+        :param interner: Shares the names and data types read from the catalog with the schemas extracted by
+            other explorers, a new interner is used for each extraction by default
+        """
+        self._connection_factory = connection_factory
+        self._validate = validate
+        self._interner = interner
+
+    def _get_database_connection(self, con: IConnection) -> Any:
         """
         Returns a connection to a PostgreSQL database
         """
+        factory = self._connection_factory or self.connect
+        return session_connection(self, lambda: factory(con))
+
+    @staticmethod
+    def connect(con: IConnection) -> Any:
+        """
+        This method opens a connection to a PostgreSQL database, it is the default connection factory
+        """
         return psycopg2.connect(
             f"dbname='{con.database}' user='{con.user}' password='{con.password}' host='{con.host}' port='{con.port}'")
 
@@ -93,14 +121,26 @@ class PostgreSqlDatabaseExplorer:
 
         return schemas
 
-    def _get_table_names(self, schema: str, con: IConnection) -> list[str]:
+    @staticmethod
+    def _table_filter(column: str, tables: list[str] | None) -> tuple[str, tuple]:
         """
-        This method returns the table names
+        Returns the condition that limits a catalog query to some of the tables, with its parameters
+        """
+        if tables is None:
+            return '', ()
+        return f" AND ({column} = ANY(%s))", (tables,)
+
+    def _get_table_names(self, schema: str, con: IConnection, tables: list[str] | None = None) -> list[str]:
+        """
+        This method returns the table names, limited to the tables named when they are given
         """
         names = list()
+        condition, params = self._table_filter('tablename', tables)
+
         with self._database_cursor(con) as cursor:
-            cursor.execute("""SELECT tablename AS name, tableowner AS owner
-                                FROM pg_tables WHERE (schemaname = %s) ORDER BY tablename;""", (schema,))
+            cursor.execute(f"""SELECT tablename AS name, tableowner AS owner
+                                FROM pg_tables WHERE (schemaname = %s){condition} ORDER BY tablename;""",
+                           (schema,) + params)
             rows = cursor.fetchall()
             if rows:
                 for row in rows:
@@ -109,116 +149,108 @@ class PostgreSqlDatabaseExplorer:
 
             return names
 
-    def _get_columns(self, name: str, schema: str, con: IConnection) -> list[Column]:
+    def _get_view_names(self, schema: str, con: IConnection) -> list[str]:
         """
-        This method extracts the column details for a table
+        This method returns the view names
         """
-        columns = list()
+        names = list()
         with self._database_cursor(con) as cursor:
-            cursor.execute("""SELECT ordinal_position AS "order", column_name AS name, data_type, 
-                                character_maximum_length AS length, is_nullable, column_default AS default_value
-                            FROM information_schema.columns
-                                WHERE (table_catalog = %s) AND (table_schema = %s) AND (table_name = %s);""",
-                           (con.database, schema, name))
+            cursor.execute("""SELECT viewname AS name, viewowner AS owner FROM pg_views 
+                                WHERE (schemaname = %s) ORDER BY viewname;""", (schema,))
             rows = cursor.fetchall()
             if rows:
                 for row in rows:
-                    order = row[0]
-                    col_name = row[1]
-                    col_type = row[2]
-                    length = row[3]
-                    is_nullable = bool(row[4])
-                    default = row[5]
-
-                    is_auto = False
-                    if default and 'nextval' in default:
-                        is_auto = True
-
-                    columns.append(Column(col_name, col_type, order, length,
-                                          is_auto=is_auto, is_nullable=is_nullable, default=default))
-
-        return columns
-
-    def _get_table(self, name: str, schema: str, con: IConnection) -> Table:
-        """
-        This method extracts the table metadata
-        """
-        tbl = Table(name)
-
-        columns = self._get_columns(name, schema, con)
-        if columns:
-            for column in columns:
-                tbl.columns[column.name] = column
-
-        indexes = self._get_indexes(name, con)
-        if indexes:
-            tbl.indexes.extend(indexes)
-
-        # Fix up PK column flag
-        for index in indexes:
-            if index.is_primary:
-                for column_name in index.columns:
-                    col = tbl.columns[column_name]
-                    # noinspection PyDataclass
-                    tbl.columns[column_name] = attrs.evolve(col, is_primary=True, is_unique=True)
-            break
-
-        keys = self._get_foreign_keys(name, con)
-        if keys:
-            tbl.foreign_keys.extend(keys)
+                    name = row[0]
+                    names.append(name)
 
-        return tbl
+            return names
 
-    def _get_index_columns(self, name: str, con: IConnection) -> list[str]:
+    def _read_columns(self, schema: str, tables: set[str], views: set[str], con: IConnection,
+                      builder: ISchemaBuilder, names: list[str] | None = None) -> None:
         """
-        This method gets the index column names
+        This method reads the column details for all the tables and views in a schema, or for those named
         """
-        columns = list()
+        condition, params = self._table_filter('table_name', names)
 
         with self._database_cursor(con) as cursor:
-            cursor.execute("""SELECT attname AS name FROM pg_attribute pa JOIN pg_class pc on pc.oid = pa.attrelid
-                                WHERE (pc.relname = %s);""", (name,))
+            cursor.execute(f"""SELECT table_name, ordinal_position AS "order", column_name AS name, data_type, 
+                                character_maximum_length AS length, is_nullable, column_default AS default_value
+                            FROM information_schema.columns
+                                WHERE (table_catalog = %s) AND (table_schema = %s){condition}
+                                ORDER BY table_name, ordinal_position;""", (con.database, schema) + params)
             rows = cursor.fetchall()
             if rows:
                 for row in rows:
-                    columns.append(row[0])
+                    table_name = row[0]
+                    order = row[1]
+                    col_name = row[2]
+                    col_type = row[3]
+                    length = row[4]
+
+                    if table_name in views:
+                        builder.add_view_column(table_name, col_name, col_type, order, length)
+                        continue
+                    if table_name not in tables:
+                        continue
+
+                    is_nullable = bool(row[5])
+                    default = row[6]
+
+                    is_auto = False
+                    if default and 'nextval' in default:
+                        is_auto = True
 
-        return columns
+                    builder.add_column(table_name, col_name, col_type, order, length,
+                                       is_auto=is_auto, is_nullable=is_nullable, default=default)
 
-    def _get_indexes(self, name: str, con: IConnection) -> list[Index]:
+    def _read_indexes(self, schema: str, tables: set[str], con: IConnection, builder: ISchemaBuilder,
+                      names: list[str] | None = None) -> None:
         """
-        This method gets the indexes for a table
+        This method reads the indexes, with their columns, for all the tables in a schema, or for those named
         """
-        indexes = list()
+        indexes: dict[tuple[str, str], tuple[bool, bool, list[str]]] = dict()
+        condition, params = self._table_filter('pct.relname', names)
 
         with self._database_cursor(con) as cursor:
-            cursor.execute("""SELECT pci.relname, pi.indisunique AS is_unique, pi.indisprimary AS is_pk 
+            cursor.execute(f"""SELECT pct.relname AS table_name, pci.relname AS index_name, 
+                                    pi.indisunique AS is_unique, pi.indisprimary AS is_pk, pa.attname AS column_name
                                 FROM pg_index pi
                                 JOIN pg_class pct on pct.oid = pi.indrelid
+                                JOIN pg_namespace pn on pn.oid = pct.relnamespace
                                 JOIN pg_class pci on pci.oid = pi.indexrelid
-                                WHERE (pct.relname = %s);""", (name,))
+                                JOIN pg_attribute pa on pa.attrelid = pi.indexrelid
+                                WHERE (pn.nspname = %s){condition}
+                                ORDER BY pct.relname, pi.indexrelid, pa.attnum;""", (schema,) + params)
             rows = cursor.fetchall()
             if rows:
                 for row in rows:
-                    name = row[0]
-                    is_unique = row[1]
-                    is_pk = row[2]
-                    indexes.append(Index(name, is_unique=is_unique, is_primary=is_pk))
-
-        for index in indexes:
-            columns = self._get_index_columns(index.name, con)
-            index.columns.extend(columns)
-
-        return indexes
-
-    def _get_foreign_keys(self, name: str, con: IConnection) -> list[ForeignKey]:
+                    key = (row[0], row[1])
+                    if key not in indexes:
+                        indexes[key] = (row[2], row[3], list())
+                    indexes[key][2].append(row[4])
+
+        first_index = set()
+        for (table, name), (is_unique, is_pk, columns) in indexes.items():
+            if table not in tables:
+                continue
+            builder.add_index(table, name, columns, is_unique=is_unique, is_primary=is_pk)
+
+            # Fix up PK column flag
+            if table not in first_index:
+                first_index.add(table)
+                if is_pk:
+                    for column_name in columns:
+                        builder.set_column_flags(table, column_name, is_primary=True, is_unique=True)
+
+    def _read_foreign_keys(self, schema: str, tables: set[str], con: IConnection, builder: ISchemaBuilder,
+                           names: list[str] | None = None) -> None:
         """
-        This method gets the foreign keys for a table
+        This method reads the foreign keys for all the tables in a schema, or for those named
         """
-        keys = list()
+        condition, params = self._table_filter('tc.table_name', names)
 
         with self._database_cursor(con) as cursor:
-            cursor.execute("""SELECT tc.constraint_name AS name, kcu.column_name AS "column",
+            cursor.execute(f"""SELECT tc.table_name, tc.constraint_name AS name, kcu.column_name AS "column",
                                 ccu.table_name AS foreign_table, ccu.column_name AS foreign_column
                                 FROM information_schema.table_constraints AS tc
                                     JOIN information_schema.key_column_usage AS kcu 
@@ -226,116 +258,18 @@ class PostgreSqlDatabaseExplorer:
                                         kcu.table_schema
                                     JOIN information_schema.constraint_column_usage AS ccu
                                       ON ccu.constraint_name = tc.constraint_name AND ccu.table_schema = tc.table_schema
-                                WHERE tc.constraint_type = 'FOREIGN KEY' AND tc.table_name=%s;""", (name,))
-            rows = cursor.fetchall()
-            if rows:
-                for row in rows:
-                    fk_name = row[0]
-                    column = row[1]
-                    foreign_table = row[2]
-                    foreign_column = row[3]
-
-                    keys.append(ForeignKey(fk_name, column, foreign_table, foreign_column))
-
-        return keys
-
-    def _get_view_names(self, schema: str, con: IConnection) -> list[str]:
-        """
-        This method returns the table names
-        """
-        names = list()
-        with self._database_cursor(con) as cursor:
-            cursor.execute("""SELECT viewname AS name, viewowner AS owner FROM pg_views 
-                                WHERE (schemaname = %s) ORDER BY viewname;""", (schema,))
-            rows = cursor.fetchall()
-            if rows:
-                for row in rows:
-                    name = row[0]
-                    names.append(name)
-
-            return names
-
-    def _get_view(self, name: str, schema: str, con: IConnection) -> View | None:
-        """
-        This method extracts the table metadata from the database
-        """
-        view = View(name)
-
-        columns = self._get_view_columns(name, schema, con)
-        if columns:
-            for column in columns:
-                view.columns[column.name] = column
-
-        return view
-
-    def _get_view_columns(self, name: str, schema: str, con: IConnection) -> list[ViewColumn]:
-        """
-        This method extracts the column details for a table
-        """
-        columns = list()
-        with self._database_cursor(con) as cursor:
-            cursor.execute("""SELECT ordinal_position AS "order", column_name AS name, data_type,
-                                character_maximum_length AS length
-                                FROM information_schema.columns 
-                                WHERE (table_catalog = %s) AND (table_schema = %s) 
-                                AND (table_name = %s);""", (con.database, schema, name))
+                                WHERE tc.constraint_type = 'FOREIGN KEY' AND tc.table_schema = %s{condition}
+                                ORDER BY tc.table_name, tc.constraint_name;""", (schema,) + params)
             rows = cursor.fetchall()
             if rows:
                 for row in rows:
-                    order = row[0]
-                    col_name = row[1]
-                    col_type = row[2]
-                    length = row[3]
-
-                    columns.append(ViewColumn(col_name, col_type, order, length))
-
-        return columns
-
-    def to_standard_schema(self, con: IConnection, type_map: TypeMap) -> DatabaseMetadata:
-        """
-        This method returns the database schema in a standard format
-        """
-        data = self.extract(con)
-
-        meta = DatabaseMetadata(data.name, data.type)
-
-        for _, view in data.views.items():
-            m_view = ViewMetaData(view.name)
-            for _, col in view.columns.items():
-                data_type = StandardDataType(type_map[col.data_type.upper()])
-                m_col = ViewColumnMetadata(col.name, data_type, col.order, col.length)
-                m_view.columns[m_col.name] = m_col
+                    if row[0] in tables:
+                        builder.add_foreign_key(row[0], row[1], row[2], row[3], row[4])
 
-            meta.views[m_view.name] = m_view
-
-        for _, table in data.tables.items():
-            m_table = TableMetaData(table.name)
-
-            for _, col in table.columns.items():
-                data_type = StandardDataType(type_map[col.data_type.upper()])
-                m_col = ColumnMetadata(col.name, data_type, col.length, col.is_nullable, col.is_unique,
-                                       col.is_auto, col.is_primary)
-                m_table.columns[m_col.name] = m_col
-
-            for index in table.indexes:
-                m_index = IndexMetadata(index.name, is_primary=index.is_primary, is_unique=index.is_unique)
-                m_index.columns.extend(index.columns)
-
-                m_table.indexes.append(m_index)
-
-            for key in table.foreign_keys:
-                m_key = ForeignKeyMetadata(key.name, key.column, key.foreign_table, key.foreign_column)
-                m_table.foreign_keys.append(m_key)
-
-            meta.tables[m_table.name] = m_table
-
-        return meta
-
-    def extract(self, con: IConnection) -> Database | None:
+    def _get_schema(self, con: IConnection) -> str:
         """
-        This method extracts the database schema
+        This method checks that the database exists and returns the name of the schema to use
         """
-
         # Make sure the database exists
         try:
             # check that the connection to the database works
@@ -352,18 +286,86 @@ class PostgreSqlDatabaseExplorer:
         if schema_name not in schema_infos:
             raise SchemaNotFoundError(f"The following schema could not be found: {schema_name}")
 
-        db = Database(con.database, DatabaseType.PostgreSQL)
+        return schema_name
+
+    def _populate(self, con: IConnection, builder: ISchemaBuilder, tables: Collection[str] | None = None,
+                  views: bool = True) -> None:
+        """
+        This method streams the database schema into a builder, using one query for each kind of catalog object.
+        Only the tables named are read when they are given.
+        """
+        names = None if tables is None else list(tables)
+
+        with connection_session(self):
+            schema_name = self._get_schema(con)
+
+            # Tables
+            table_names = self._get_table_names(schema_name, con, names) if names != [] else list()
+            for table_name in table_names:
+                builder.add_table(table_name)
+
+            # Views
+            view_names = self._get_view_names(schema_name, con) if views else list()
+            for view_name in view_names:
+                builder.add_view(view_name)
+
+            tables = set(table_names)
+            if names is None:
+                self._read_columns(schema_name, tables, set(view_names), con, builder)
+                self._read_indexes(schema_name, tables, con, builder)
+                self._read_foreign_keys(schema_name, tables, con, builder)
+                return
+
+            if table_names or view_names:
+                self._read_columns(schema_name, tables, set(view_names), con, builder, table_names + view_names)
+            if table_names:
+                self._read_indexes(schema_name, tables, con, builder, table_names)
+                self._read_foreign_keys(schema_name, tables, con, builder, table_names)
+
+    @property
+    def database_type(self) -> DatabaseType:
+        return DatabaseType.PostgreSQL
+
+    def table_names(self, con: IConnection) -> list[str]:
+        """
+        This method returns the names of the tables in the database
+        """
+        with connection_session(self):
+            return self._get_table_names(self._get_schema(con), con)
+
+    def extract_tables(self, con: IConnection, names: Collection[str], views: bool = False) -> Database:
+        """
+        This method extracts the tables named, the names not found in the database are ignored. The views
+        are extracted only when asked for.
+        """
+        builder = SchemaBuilder(con.database, DatabaseType.PostgreSQL, self._validate, self._interner)
+        self._populate(con, builder, names, views)
+        return builder.build()
 
-        # Tables
-        table_names = self._get_table_names(schema_name, con)
-        for table_name in table_names:
-            table = self._get_table(table_name, schema_name, con)
-            db.tables[table.name] = table
+    def to_standard_schema(self, con: IConnection, type_map: TypeMap,
+                           overrides: TypeOverrides | None = None) -> DatabaseMetadata:
+        """
+        This method returns the database schema in a standard format
+        """
+        builder = StandardSchemaBuilder(con.database, DatabaseType.PostgreSQL, type_map, self._validate, self._interner,
+                                        overrides)
+        self._populate(con, builder)
+        return builder.build()
 
-        # Views
-        view_names = self._get_view_names(schema_name, con)
-        for view_name in view_names:
-            view = self._get_view(view_name, schema_name, con)
-            db.views[view.name] = view
+    def to_columnar_schema(self, con: IConnection, type_map: TypeMap,
+                           overrides: TypeOverrides | None = None) -> ColumnarDatabaseMetadata:
+        """
+        This method returns the database schema in the standard format, stored in columns
+        """
+        builder = ColumnarSchemaBuilder(con.database, DatabaseType.PostgreSQL, type_map, self._validate, self._interner,
+                                        overrides)
+        self._populate(con, builder)
+        return builder.build()
 
-        return db
+    def extract(self, con: IConnection) -> Database | None:
+        """
+        This method extracts the database schema
+        """
+        builder = SchemaBuilder(con.database, DatabaseType.PostgreSQL, self._validate, self._interner)
+        self._populate(con, builder)
+        return builder.build()
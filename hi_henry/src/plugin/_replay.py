@@ -0,0 +1,322 @@
+# *******************************************************************************************
+#  File:  _replay.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['CatalogRecorder', 'CatalogReplayer']
+
+import base64
+import collections
+import decimal
+import importlib
+import json
+import pathlib
+import time
+import typing
+from ..model import IConnection, ConnectionFactory
+from ..errors import CatalogReplayError
+
+
+def _normalize_sql(sql: str) -> str:
+    """
+    This function removes the layout from a SQL statement so that it can be used as a lookup key
+    """
+    return ' '.join(sql.split())
+
+
+def _encode_value(value: typing.Any) -> typing.Any:
+    """
+    This function converts a value returned by a driver into a value that can be stored as JSON
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return {'$bytes': base64.b64encode(value).decode('ascii')}
+    if isinstance(value, decimal.Decimal):
+        return {'$decimal': str(value)}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _decode_value(value: typing.Any) -> typing.Any:
+    """
+    This function converts a stored JSON value back into the value returned by the driver
+    """
+    if isinstance(value, dict):
+        if '$bytes' in value:
+            return base64.b64decode(value['$bytes'])
+        if '$decimal' in value:
+            return decimal.Decimal(value['$decimal'])
+    return value
+
+
+# The packages of the drivers whose exceptions can be raised by a recording
+_DRIVER_ERROR_PACKAGES = ('sqlite3', 'mysql.connector', 'psycopg2')
+
+
+def _error_class(name: str) -> type[Exception]:
+    """
+    This function returns the exception class recorded for a query, only exception classes of the drivers are
+    raised, any other name gives CatalogReplayError
+    """
+    module_name, _, class_name = name.rpartition('.')
+    if not any(module_name == package or module_name.startswith(f"{package}.") for package in _DRIVER_ERROR_PACKAGES):
+        return CatalogReplayError
+
+    try:
+        error_class = getattr(importlib.import_module(module_name), class_name, None)
+    except ImportError:
+        return CatalogReplayError
+
+    if isinstance(error_class, type) and issubclass(error_class, Exception):
+        return error_class
+    return CatalogReplayError
+
+
+def _lookup_key(sql: str, params: typing.Any) -> str:
+    """
+    This function returns the key used to find the recorded result of a query
+    """
+    if params is not None:
+        params = [_encode_value(value) for value in params]
+    return json.dumps([_normalize_sql(sql), params])
+
+
+# region Recording
+
+class _RecordingCursor:
+    """
+    This class wraps a driver cursor and captures each query and its result set
+    """
+
+    def __init__(self, cursor: typing.Any, recorder: 'CatalogRecorder'):
+        self._cursor = cursor
+        self._recorder = recorder
+        self._rows: collections.deque = collections.deque()
+
+    def execute(self, sql: str, params: typing.Any = None) -> '_RecordingCursor':
+        try:
+            if params is None:
+                self._cursor.execute(sql)
+            else:
+                self._cursor.execute(sql, params)
+        except Exception as ex:
+            self._recorder.write(sql, params, error=ex)
+            raise
+
+        columns = list()
+        rows = list()
+        if self._cursor.description:
+            columns = [item[0] for item in self._cursor.description]
+            rows = self._cursor.fetchall()
+
+        self._recorder.write(sql, params, columns, [tuple(row) for row in rows])
+        self._rows = collections.deque(rows)
+        return self
+
+    @property
+    def description(self) -> typing.Any:
+        return self._cursor.description
+
+    def fetchone(self) -> typing.Any:
+        return self._rows.popleft() if self._rows else None
+
+    def fetchall(self) -> list[typing.Any]:
+        rows = list(self._rows)
+        self._rows.clear()
+        return rows
+
+    def close(self) -> None:
+        self._cursor.close()
+
+
+class _RecordingConnection:
+    """
+    This class wraps a driver connection so that the cursors it creates are recorded
+    """
+
+    def __init__(self, connection: typing.Any, recorder: 'CatalogRecorder'):
+        self._connection = connection
+        self._recorder = recorder
+
+    def cursor(self, *args, **kwargs) -> _RecordingCursor:
+        return _RecordingCursor(self._connection.cursor(*args, **kwargs), self._recorder)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __getattr__(self, item: str) -> typing.Any:
+        return getattr(self._connection, item)
+
+
+class CatalogRecorder:
+    """
+    This class wraps the connection factory of an explorer and writes every catalog query, with its result set,
+    to a JSON lines file that can be served by CatalogReplayer
+    """
+    _factory: ConnectionFactory
+    _file: pathlib.Path
+
+    def __init__(self, factory: ConnectionFactory, file: pathlib.Path):
+        """
+        Initializes an instance of the class, truncating the recording file
+
+        :param factory: The function that opens the real database connections
+        :param file: The file to write the recording to
+        """
+        self._factory = factory
+        self._file = file
+
+        file.write_text('', encoding='utf-8')
+
+    @property
+    def file(self) -> pathlib.Path:
+        return self._file
+
+    def write(self, sql: str, params: typing.Any, columns: list[str] | None = None, rows: list[tuple] | None = None,
+              error: Exception | None = None) -> None:
+        """
+        This method appends a query and its outcome to the recording
+        """
+        entry = {'sql': _normalize_sql(sql),
+                 'params': None if params is None else [_encode_value(value) for value in params]}
+        if error is not None:
+            entry['error'] = f"{type(error).__module__}.{type(error).__qualname__}"
+            entry['message'] = str(error)
+        else:
+            entry['columns'] = columns
+            entry['rows'] = [[_encode_value(value) for value in row] for row in rows]
+
+        with self._file.open('a', encoding='utf-8') as f:
+            f.write(json.dumps(entry))
+            f.write('\n')
+
+    def __call__(self, con: IConnection) -> _RecordingConnection:
+        return _RecordingConnection(self._factory(con), self)
+
+
+# endregion
+
+# region Replay
+
+class _ReplayCursor:
+    """
+    This class serves recorded result sets in place of a driver cursor
+    """
+
+    def __init__(self, replayer: 'CatalogReplayer', named_tuple: bool):
+        self._replayer = replayer
+        self._named_tuple = named_tuple
+        self._rows: collections.deque = collections.deque()
+        self.description = None
+
+    def execute(self, sql: str, params: typing.Any = None) -> '_ReplayCursor':
+        columns, rows = self._replayer.result(sql, params)
+
+        self.description = [(name, None, None, None, None, None, None) for name in columns] if columns else None
+        if self._named_tuple and columns:
+            row_type = collections.namedtuple('Row', columns, rename=True)
+            rows = [row_type(*row) for row in rows]
+        self._rows = collections.deque(rows)
+        return self
+
+    def fetchone(self) -> typing.Any:
+        return self._rows.popleft() if self._rows else None
+
+    def fetchall(self) -> list[typing.Any]:
+        rows = list(self._rows)
+        self._rows.clear()
+        return rows
+
+    def close(self) -> None:
+        pass
+
+
+class _ReplayConnection:
+    """
+    This class stands in for a driver connection during a replay
+    """
+
+    def __init__(self, replayer: 'CatalogReplayer'):
+        self._replayer = replayer
+
+    def cursor(self, *args, named_tuple: bool = False, **kwargs) -> _ReplayCursor:
+        return _ReplayCursor(self._replayer, named_tuple)
+
+    def commit(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class CatalogReplayer:
+    """
+    This class is a connection factory that serves the catalog queries captured by CatalogRecorder, so that
+    the explorers can be run and benchmarked without a database server
+    """
+    _results: dict[str, list[dict[str, typing.Any]]]
+    _positions: dict[str, int]
+    _latency: float
+    _row_latency: float
+
+    def __init__(self, file: pathlib.Path, latency: float = 0.0, row_latency: float = 0.0):
+        """
+        Initializes an instance of the class
+
+        :param file: The recording to serve
+        :param latency: The delay in seconds added to each query, to simulate the network round trip
+        :param row_latency: The delay in seconds added for each row returned by a query
+        """
+        self._latency = latency
+        self._row_latency = row_latency
+        self._results = dict()
+        self._positions = dict()
+
+        with file.open('r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = json.dumps([entry['sql'], entry['params']])
+                self._results.setdefault(key, list()).append(entry)
+
+    def result(self, sql: str, params: typing.Any) -> tuple[list[str], list[tuple]]:
+        """
+        This method returns the recorded result of a query, repeated queries are answered in recording order
+        """
+        key = _lookup_key(sql, params)
+        entries = self._results.get(key)
+        if not entries:
+            raise CatalogReplayError(f"The following query was not recorded: {_normalize_sql(sql)} {params}")
+
+        position = self._positions.get(key, 0)
+        entry = entries[min(position, len(entries) - 1)]
+        self._positions[key] = position + 1
+
+        rows = [tuple(_decode_value(value) for value in row) for row in entry.get('rows', list())]
+
+        delay = self._latency + self._row_latency * len(rows)
+        if delay > 0:
+            time.sleep(delay)
+
+        if 'error' in entry:
+            raise _error_class(entry['error'])(entry['message'])
+
+        return entry['columns'], rows
+
+    def __call__(self, con: IConnection) -> _ReplayConnection:
+        return _ReplayConnection(self)
+
+# endregion
@@ -0,0 +1,73 @@
+# *******************************************************************************************
+#  File:  _session.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import typing
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class _Session:
+    """
+    This class holds the connection shared by the catalog queries of an explorer inside a session
+    """
+    __slots__ = ('owner', 'connection')
+
+    def __init__(self, owner: object):
+        self.owner = owner
+        self.connection = None
+
+
+# The session is kept in a context variable, so each thread and task has its own
+_current_session: ContextVar[_Session | None] = ContextVar('hi_henry_connection_session', default=None)
+
+
+@contextmanager
+def connection_session(owner: object) -> typing.Iterator[None]:
+    """
+    This function shares one database connection between the catalog queries the owner makes inside the block,
+    the connection is closed when the block ends. A session already open for the owner is reused.
+    """
+    session = _current_session.get()
+    if session is not None and session.owner is owner:
+        yield
+        return
+
+    session = _Session(owner)
+    token = _current_session.set(session)
+    try:
+        yield
+    finally:
+        _current_session.reset(token)
+        if session.connection is not None:
+            session.connection.close()
+
+
+def session_connection(owner: object, connect: typing.Callable[[], typing.Any]) -> typing.Any:
+    """
+    This function returns the connection of the session open for the owner, opening it on first use. Outside a
+    session a new connection is returned.
+    """
+    session = _current_session.get()
+    if session is None or session.owner is not owner:
+        return connect()
+
+    if session.connection is None:
+        session.connection = connect()
+    return session.connection
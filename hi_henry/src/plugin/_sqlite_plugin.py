@@ -17,15 +17,17 @@ __maintainer__ = "James Dooley"
 __status__ = "Production"
 __all__ = ['SQLiteDatabaseExplorer']
 
+import json
 import re
 import sqlite3
+from collections.abc import Collection
 from pathlib import Path
-import attrs
-from ..data_maps import TypeMap
-from ..model import ViewColumn, View, Column, Index, ForeignKey, Table, Database, IConnection, DatabaseType, \
-    DatabaseMetadata, ViewMetaData, ViewColumnMetadata, TableMetaData, ColumnMetadata, IndexMetadata, \
-    ForeignKeyMetadata, StandardDataType
+from ..data_maps import TypeMap, TypeOverrides
+from ..model import Database, IConnection, DatabaseType, ConnectionFactory, DatabaseMetadata, \
+    ColumnarDatabaseMetadata
 from ..errors import DatabaseNotFoundError
+from ._intern import StringInterner
+from ._normalizer import ISchemaBuilder, SchemaBuilder, StandardSchemaBuilder, ColumnarSchemaBuilder
 
 
 # noinspection SqlDialectInspection
@@ -33,247 +35,266 @@ class SQLiteDatabaseExplorer:
     """
     This class handles the extraction of the SQLite database schema
     """
+    _connection_factory: ConnectionFactory | None
+    _validate: bool
+    _interner: StringInterner | None
 
-    # region Views
+    def __init__(self, connection_factory: ConnectionFactory | None = None, validate: bool = True,
+                 interner: StringInterner | None = None):
+        """
+        Initializes an instance of the class
+
+        :param connection_factory: Replaces the function used to open the database connection, used to
+            instrument the catalog queries
+        :param validate: Validates the models built from the catalog rows, it can be turned off for a trusted
+            driver to speed up the extraction of large schemas
+        :param interner: Shares the names and data types read from the catalog with the schemas extracted by
+            other explorers, a new interner is used for each extraction by default
+        """
+        self._connection_factory = connection_factory
+        self._validate = validate
+        self._interner = interner
 
     @staticmethod
-    def _get_view_names(con: sqlite3.Connection) -> list[str]:
+    def connect(con: IConnection) -> sqlite3.Connection:
         """
-        Returns the names of the tables in the database
+        This method opens a connection to a SQLite database, it is the default connection factory
         """
-        table_names = list()
+        db_con = sqlite3.connect(con.host)
+        db_con.row_factory = sqlite3.Row
+        return db_con
 
-        cursor = con.cursor()
-        rows = cursor.execute("""SELECT name FROM sqlite_schema 
-                                    WHERE type ='view' AND name NOT LIKE 'sqlite_%' ORDER BY name;""").fetchall()
-        if rows:
-            for row in rows:
-                table_names.append(row['name'])
+    def _get_database_connection(self, con: IConnection) -> sqlite3.Connection:
+        """
+        Returns a connection to the SQLite database
+        """
+        if self._connection_factory:
+            return self._connection_factory(con)
 
-        return table_names
+        return self.connect(con)
+
+    # region Views
 
     @staticmethod
-    def _get_view(con: sqlite3.Connection, name: str) -> View:
+    def _read_views(con: sqlite3.Connection, builder: ISchemaBuilder) -> None:
         """
-        This method extracts the view definition
+        This method reads the view definitions, with their columns, in a single query
         """
         cursor = con.cursor()
-        view = View(name)
-
-        # Columns
-        rows = cursor.execute(f"pragma table_info('{name}');").fetchall()
-        if rows:
-            for row in rows:
-                name = row['name']
-                data_type = row['type']
-                order = row['cid']
-
-                view.columns[name] = ViewColumn(name, data_type, order, 0)
+        rows = cursor.execute("""SELECT m.name AS view_name, p.name, p.type, p.cid FROM sqlite_schema AS m
+                                    JOIN pragma_table_info(m.name) AS p
+                                    WHERE m.type = 'view' AND m.name NOT LIKE 'sqlite_%' 
+                                    ORDER BY m.name, p.cid;""").fetchall()
+        view_name = None
+        for row in rows:
+            if row['view_name'] != view_name:
+                view_name = row['view_name']
+                builder.add_view(view_name)
 
-        return view
+            builder.add_view_column(view_name, row['name'], row['type'], row['cid'], 0)
 
     # endregion
 
     # region Tables
 
     @staticmethod
-    def _get_table_names(con: sqlite3.Connection) -> list[str]:
+    def _table_filter(column: str, names: list[str] | None) -> tuple[str, tuple]:
         """
-        Returns the names of the tables in the database
+        Returns the condition that limits a catalog query to some of the tables, with its parameters
         """
-        table_names = list()
-
-        cursor = con.cursor()
-        rows = cursor.execute("""SELECT name FROM sqlite_schema 
-                                    WHERE type ='table' AND name NOT LIKE 'sqlite_%' ORDER BY name;""").fetchall()
-        if rows:
-            for row in rows:
-                table_names.append(row['name'])
-
-        return table_names
+        if names is None:
+            return '', ()
+        return f" AND {column} IN (SELECT value FROM json_each(?))", (json.dumps(names),)
 
-    @staticmethod
-    def _get_table_columns(con: sqlite3.Connection, name: str) -> list[Column]:
+    def _get_table_sql(self, con: sqlite3.Connection, names: list[str] | None = None) -> dict[str, str]:
         """
-        This method extracts the column definitions for a table
+        Returns the names of the tables in the database, with the SQL used to create them
         """
-        cursor = con.cursor()
-        columns = list()
-
-        rows = cursor.execute(f"pragma table_info('{name}');").fetchall()
-        if rows:
-            for row in rows:
-                col_name = row['name']
-                data_type = row['type']
-                order = row['cid']
-                is_null = not bool(row['notnull'])
-                default_value = row['dflt_value']
-                is_pk = bool(row['pk'])
+        tables = dict()
+        condition, params = self._table_filter('name', names)
 
-                columns.append(Column(col_name, data_type, order, 0,
-                                      is_nullable=is_null, is_primary=is_pk, default=default_value))
+        cursor = con.cursor()
+        rows = cursor.execute(f"""SELECT name, sql FROM sqlite_schema 
+                                    WHERE type ='table' AND name NOT LIKE 'sqlite_%'{condition} ORDER BY name;""",
+                              params).fetchall()
+        for row in rows:
+            tables[row['name']] = row['sql']
 
-        return columns
+        return tables
 
     @staticmethod
-    def _get_auto_column_name(con: sqlite3.Connection, name: str) -> str | None:
+    def _get_auto_column_name(sql: str | None) -> str | None:
         """
         This function attempts to parse the SQL used to create the table in order to
         find the auto inc field, if one exists
         """
-        cursor = con.cursor()
-        row = cursor.execute(f"SELECT sql FROM sqlite_master where name = '{name}';").fetchone()
-        if row:
-            sql = row['sql']
+        if sql:
             lines = [item.strip() for item in sql[sql.find("(") + 1:sql.find(")")].split(',')]
             for line in lines:
                 upper_line = line.upper()
                 if 'AUTOINCREMENT' in upper_line:
                     return re.split("\s", line)[0].strip('"')
 
-    @staticmethod
-    def _get_index_columns(con: sqlite3.Connection, name: str) -> list[str]:
+    def _read_table_columns(self, con: sqlite3.Connection, auto_columns: dict[str, str | None],
+                            builder: ISchemaBuilder, names: list[str] | None = None) -> None:
         """
-        This method extracts the column names for an index
+        This method reads the column definitions for all the tables, or for the tables named
         """
-        cursor = con.cursor()
-        names = list()
+        condition, params = self._table_filter('m.name', names)
 
-        rows = cursor.execute(f"PRAGMA index_info('{name}');").fetchall()
-        if rows:
-            for row in rows:
-                names.append(row['name'])
+        cursor = con.cursor()
+        rows = cursor.execute(f"""SELECT m.name AS table_name, p.* FROM sqlite_schema AS m 
+                                    JOIN pragma_table_info(m.name) AS p
+                                    WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'{condition} 
+                                    ORDER BY m.name, p.cid;""", params).fetchall()
+        for row in rows:
+            table_name = row['table_name']
+            col_name = row['name']
+            is_null = not bool(row['notnull'])
+            is_pk = bool(row['pk'])
+            is_auto = col_name == auto_columns.get(table_name)
 
-        return names
+            builder.add_column(table_name, col_name, row['type'], row['cid'], 0, is_nullable=is_null,
+                               is_auto=is_auto, is_primary=is_pk, default=row['dflt_value'])
 
-    def _get_indexes(self, con: sqlite3.Connection, name: str) -> list[Index]:
+    def _read_indexes(self, con: sqlite3.Connection, builder: ISchemaBuilder, names: list[str] | None = None) -> None:
         """
-        This method extracts the indexes for a table
+        This method reads the indexes, with their columns, for all the tables, or for the tables named
         """
-        cursor = con.cursor()
-        indexes = list()
+        condition, params = self._table_filter('m.name', names)
 
-        rows = cursor.execute(f"PRAGMA index_list('{name}');").fetchall()
+        cursor = con.cursor()
+        rows = cursor.execute(f"""SELECT m.name AS table_name, il.name AS index_name, il."unique" AS is_unique, 
+                                        ii.name AS column_name 
+                                    FROM sqlite_schema AS m 
+                                    JOIN pragma_index_list(m.name) AS il
+                                    JOIN pragma_index_info(il.name) AS ii
+                                    WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'{condition} 
+                                    ORDER BY m.name, il.seq, ii.seqno;""", params).fetchall()
+        index = None
+        columns = list()
         for row in rows:
-            index_name = row['name']
-            unique = bool(row['unique'])
+            key = (row['table_name'], row['index_name'], bool(row['is_unique']))
+            if key != index:
+                if index:
+                    builder.add_index(index[0], index[1], columns, is_unique=index[2])
+                index = key
+                columns = list()
 
-            index = Index(index_name, is_unique=unique)
-            columns = self._get_index_columns(con, index_name)
-            index.columns.extend(columns)
+            columns.append(row['column_name'])
 
-            indexes.append(index)
+        if index:
+            builder.add_index(index[0], index[1], columns, is_unique=index[2])
 
-        return indexes
-
-    @staticmethod
-    def _get_foreign_keys(con: sqlite3.Connection, name: str) -> list[ForeignKey]:
+    def _read_foreign_keys(self, con: sqlite3.Connection, builder: ISchemaBuilder,
+                           names: list[str] | None = None) -> None:
         """
-        This method extracts the foreign keys for a table
+        This method reads the foreign keys for all the tables, or for the tables named
         """
-        cursor = con.cursor()
-        keys = list()
+        condition, params = self._table_filter('m.name', names)
 
-        rows = cursor.execute(f"PRAGMA foreign_key_list('{name}');").fetchall()
+        cursor = con.cursor()
+        rows = cursor.execute(f"""SELECT m.name AS table_name, fk."table" AS foreign_table, fk."from" AS column_name, 
+                                        fk."to" AS foreign_column 
+                                    FROM sqlite_schema AS m 
+                                    JOIN pragma_foreign_key_list(m.name) AS fk
+                                    WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'{condition} 
+                                    ORDER BY m.name, fk.id, fk.seq;""", params).fetchall()
         for row in rows:
-            foreign_table = row['table']
-            foreign_column = row['to']
-            column = row['from']
-            keys.append(ForeignKey('Unknown', column, foreign_table, foreign_column))
+            builder.add_foreign_key(row['table_name'], 'Unknown', row['column_name'], row['foreign_table'],
+                                    row['foreign_column'])
 
-        return keys
-
-    def _get_table(self, con: sqlite3.Connection, name: str) -> Table:
+    def _read_tables(self, con: sqlite3.Connection, builder: ISchemaBuilder, names: list[str] | None = None) -> None:
         """
-        This method gets the table definition
+        This method reads the table definitions, using one query for each kind of catalog object
         """
-        tbl = Table(name)
-
-        # Columns
-        columns = self._get_table_columns(con, name)
-        for column in columns:
-            tbl.columns[column.name] = column
+        table_sql = self._get_table_sql(con, names)
 
-        # Check for auto inc column
-        auto_col_name: str = self._get_auto_column_name(con, name)
-        if auto_col_name and auto_col_name in tbl.columns:
-            col = tbl.columns[auto_col_name]
-            # noinspection PyDataclass
-            tbl.columns[auto_col_name] = attrs.evolve(col, is_auto=True)
+        auto_columns = dict()
+        for name, sql in table_sql.items():
+            builder.add_table(name)
+            auto_columns[name] = self._get_auto_column_name(sql)
 
-        # Indexes
-        indexes = self._get_indexes(con, name)
-        tbl.indexes.extend(indexes)
-
-        # Foreign Keys
-        fkeys = self._get_foreign_keys(con, name)
-        tbl.foreign_keys.extend(fkeys)
-
-        return tbl
+        self._read_table_columns(con, auto_columns, builder, names)
+        self._read_indexes(con, builder, names)
+        self._read_foreign_keys(con, builder, names)
 
     # endregion
 
-    def to_standard_schema(self, con: IConnection, type_map: TypeMap) -> DatabaseMetadata:
+    def _populate(self, con: IConnection, builder: ISchemaBuilder, tables: Collection[str] | None = None,
+                  views: bool = True) -> None:
         """
-        This method returns the database schema in a standard format
+        This method streams the database schema into a builder, limited to the tables named when they are given
         """
-        data = self.extract(con)
-
-        meta = DatabaseMetadata(data.name, data.type)
-
-        for _, view in data.views.items():
-            m_view = ViewMetaData(view.name)
-            for _, col in view.columns.items():
-                data_type = StandardDataType(type_map[col.data_type.upper()])
-                m_col = ViewColumnMetadata(col.name, data_type, col.order, col.length)
-                m_view.columns[m_col.name] = m_col
-
-            meta.views[m_view.name] = m_view
-
-        for _, table in data.tables.items():
-            m_table = TableMetaData(table.name)
-
-            for _, col in table.columns.items():
-                data_type = StandardDataType(type_map[col.data_type.upper()])
-                m_col = ColumnMetadata(col.name, data_type, col.length, col.is_nullable, col.is_unique,
-                                       col.is_auto, col.is_primary)
-                m_table.columns[m_col.name] = m_col
-
-            for index in table.indexes:
-                m_index = IndexMetadata(index.name, is_primary=index.is_primary, is_unique=index.is_unique)
-                m_index.columns.extend(index.columns)
-
-                m_table.indexes.append(m_index)
+        db_file = Path(con.host)
+        if not db_file.exists():
+            raise DatabaseNotFoundError(f"The following database could not be located: {con.host}")
 
-            for key in table.foreign_keys:
-                m_key = ForeignKeyMetadata(key.name, key.column, key.foreign_table, key.foreign_column)
-                m_table.foreign_keys.append(m_key)
+        db_con = self._get_database_connection(con)
+        try:
+            # Tables
+            self._read_tables(db_con, builder, None if tables is None else list(tables))
 
-            meta.tables[m_table.name] = m_table
+            # Views
+            if views:
+                self._read_views(db_con, builder)
+        finally:
+            db_con.close()
 
-        return meta
+    @property
+    def database_type(self) -> DatabaseType:
+        return DatabaseType.SQLite
 
-    def extract(self, con: IConnection) -> Database:
+    def table_names(self, con: IConnection) -> list[str]:
         """
-        This method extracts the database metadata
+        This method returns the names of the tables in the database, using a single catalog query
         """
         db_file = Path(con.host)
         if not db_file.exists():
             raise DatabaseNotFoundError(f"The following database could not be located: {con.host}")
 
-        db_con = sqlite3.connect(con.host)
-        db_con.row_factory = sqlite3.Row
+        db_con = self._get_database_connection(con)
+        try:
+            cursor = db_con.cursor()
+            rows = cursor.execute("""SELECT name FROM sqlite_schema 
+                                        WHERE type ='table' AND name NOT LIKE 'sqlite_%' ORDER BY name;""").fetchall()
+            return [row['name'] for row in rows]
+        finally:
+            db_con.close()
 
-        db = Database(con.database, DatabaseType.SQLite)
+    def extract_tables(self, con: IConnection, names: Collection[str], views: bool = False) -> Database:
+        """
+        This method extracts the tables named, the names not found in the database are ignored. The views
+        are extracted only when asked for.
+        """
+        builder = SchemaBuilder(con.database, DatabaseType.SQLite, self._validate, self._interner)
+        self._populate(con, builder, names, views)
+        return builder.build()
 
-        # Tables
-        table_names = self._get_table_names(db_con)
-        for name in table_names:
-            db.tables[name] = self._get_table(db_con, name)
+    def to_standard_schema(self, con: IConnection, type_map: TypeMap,
+                           overrides: TypeOverrides | None = None) -> DatabaseMetadata:
+        """
+        This method returns the database schema in a standard format
+        """
+        builder = StandardSchemaBuilder(con.database, DatabaseType.SQLite, type_map, self._validate, self._interner,
+                                        overrides)
+        self._populate(con, builder)
+        return builder.build()
 
-        # Views
-        view_names = self._get_view_names(db_con)
-        for name in view_names:
-            db.views[name] = self._get_view(db_con, name)
+    def to_columnar_schema(self, con: IConnection, type_map: TypeMap,
+                           overrides: TypeOverrides | None = None) -> ColumnarDatabaseMetadata:
+        """
+        This method returns the database schema in the standard format, stored in columns
+        """
+        builder = ColumnarSchemaBuilder(con.database, DatabaseType.SQLite, type_map, self._validate, self._interner,
+                                        overrides)
+        self._populate(con, builder)
+        return builder.build()
 
-        return db
+    def extract(self, con: IConnection) -> Database:
+        """
+        This method extracts the database metadata
+        """
+        builder = SchemaBuilder(con.database, DatabaseType.SQLite, self._validate, self._interner)
+        self._populate(con, builder)
+        return builder.build()
@@ -0,0 +1,263 @@
+# *******************************************************************************************
+#  File:  synthetic.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = ['MAP_NAMES', 'SchemaSpec', 'generate_ddl', 'write_ddl_script', 'create_sqlite_database']
+
+import pathlib
+import random
+import sqlite3
+import typing
+import attrs
+from .model import DatabaseType
+from .data_maps import load_config
+
+_DATA_TYPE_MAP_FILE = pathlib.Path(__file__).parent.parent.joinpath('data', 'data_type_map.toml')
+
+# The names of the maps from the data types of each DBMS to the standard types
+MAP_NAMES = {
+    DatabaseType.SQLite: 'SQLite_To_Standard',
+    DatabaseType.MySQL: 'MySQL_To_Standard',
+    DatabaseType.PostgreSQL: 'PostgreSql_To_Standard',
+}
+
+# The share of the columns, in a typical OLTP schema, that hold each of the standard types
+_STANDARD_TYPE_WEIGHTS = {
+    'String': 35,
+    'Integer': 25,
+    'DateTime': 9,
+    'TimeStamp': 5,
+    'Decimal': 6,
+    'Boolean': 5,
+    'Date': 5,
+    'Float': 4,
+    'Double': 2,
+    'Binary': 2,
+    'Bit': 2,
+}
+
+# Types that need arguments, or that create objects of their own, when used in a column definition
+_EXCLUDED_TYPES = {'SERIAL', 'SMALLSERIAL', 'BIGSERIAL', 'SET'}
+_LENGTH_TYPES = {'CHAR', 'VARCHAR', 'BINARY', 'VARBINARY', 'CHARACTER', 'CHARACTER VARYING', 'BIT VARYING'}
+_PRECISION_TYPES = {'DECIMAL', 'DEC', 'NUMERIC'}
+
+# Types that can not be indexed without a key length in MySQL, or have no btree operator class in PostgreSQL
+_UNINDEXED_TYPES = {
+    DatabaseType.MySQL: {'TINYTEXT', 'TEXT', 'MEDIUMTEXT', 'LONGTEXT', 'TINYBLOB', 'BLOB', 'MEDIUMBLOB', 'LONGBLOB',
+                         'JSON'},
+    DatabaseType.PostgreSQL: {'JSON'},
+}
+
+
+@attrs.frozen
+class SchemaSpec:
+    """
+    This class holds the dimensions of a synthetic schema
+    """
+    tables: int = attrs.field(default=100, validator=[attrs.validators.instance_of(int), attrs.validators.ge(1)])
+    columns_per_table: int = attrs.field(default=10, validator=[attrs.validators.instance_of(int),
+                                                                attrs.validators.ge(1)])
+    indexes_per_table: int = attrs.field(default=2, validator=[attrs.validators.instance_of(int),
+                                                               attrs.validators.ge(0)])
+    foreign_keys_per_table: int = attrs.field(default=1, validator=[attrs.validators.instance_of(int),
+                                                                    attrs.validators.ge(0)])
+    views: int = attrs.field(default=10, validator=[attrs.validators.instance_of(int), attrs.validators.ge(0)])
+    partitions: int = attrs.field(default=0, validator=[attrs.validators.instance_of(int), attrs.validators.ge(0)])
+    partitioned_tables: int = attrs.field(default=0, validator=[attrs.validators.instance_of(int),
+                                                                attrs.validators.ge(0)])
+    seed: int = attrs.field(default=1, validator=[attrs.validators.instance_of(int)])
+
+
+class _TypePicker:
+    """
+    This class picks column data types with the distribution found in real schemas, using the types
+    listed for the DBMS in the data type map file
+    """
+
+    def __init__(self, dbms: DatabaseType, rnd: random.Random, map_file: pathlib.Path):
+        maps = {item.name: item for item in load_config(map_file)}
+        type_map = maps[MAP_NAMES[dbms]]
+
+        by_standard: dict[str, list[str]] = dict()
+        for name, standard in type_map.map.items():
+            if name not in _EXCLUDED_TYPES:
+                by_standard.setdefault(standard, list()).append(name)
+
+        self._rnd = rnd
+        self._standard = [name for name in _STANDARD_TYPE_WEIGHTS if name in by_standard]
+        self._weights = [_STANDARD_TYPE_WEIGHTS[name] for name in self._standard]
+        self._by_standard = by_standard
+
+    def pick(self) -> str:
+        """
+        This method returns the declaration of a randomly chosen data type
+        """
+        standard = self._rnd.choices(self._standard, self._weights)[0]
+        name = self._rnd.choice(self._by_standard[standard])
+
+        if name in _LENGTH_TYPES:
+            return f"{name}({self._rnd.choice((1, 10, 32, 50, 100, 255))})"
+        if name in _PRECISION_TYPES:
+            return f"{name}(10,2)"
+        if name == 'ENUM':
+            return "ENUM('new','active','closed')"
+        return name
+
+
+def _table_name(index: int) -> str:
+    return f"t_{index:05d}"
+
+
+def _create_table(dbms: DatabaseType, spec: SchemaSpec, index: int, types: _TypePicker,
+                  rnd: random.Random) -> tuple[list[str], list[str]]:
+    """
+    This function returns the statements that create a table, along with its column names
+    """
+    name = _table_name(index)
+    is_partitioned = index < spec.partitioned_tables and spec.partitions > 0 and dbms != DatabaseType.SQLite
+
+    lines = list()
+    columns = list()
+    candidates = list()
+
+    if dbms == DatabaseType.SQLite:
+        lines.append("id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL")
+    elif dbms == DatabaseType.MySQL:
+        lines.append("id INT NOT NULL AUTO_INCREMENT")
+    else:
+        lines.append("id INTEGER GENERATED BY DEFAULT AS IDENTITY NOT NULL")
+
+    # Foreign keys reference earlier tables, so that the schema can be created in one pass
+    references = sorted({rnd.randrange(index) for _ in range(spec.foreign_keys_per_table)}) if index else []
+    for reference in references:
+        column = f"{_table_name(reference)}_id"
+        columns.append(column)
+        lines.append(f"{column} {'INTEGER' if dbms != DatabaseType.MySQL else 'INT'} NOT NULL")
+
+    for position in range(1, spec.columns_per_table - len(columns)):
+        column = f"c_{position:03d}"
+        columns.append(column)
+        nullable = '' if rnd.random() < 0.3 else ' NOT NULL'
+        data_type = types.pick()
+        lines.append(f"{column} {data_type}{nullable}")
+        if data_type.partition('(')[0] not in _UNINDEXED_TYPES.get(dbms, ()):
+            candidates.append(column)
+
+    if dbms == DatabaseType.SQLite:
+        for reference, column in zip(references, columns):
+            lines.append(f"CONSTRAINT fk_{name}_{column} FOREIGN KEY ({column}) "
+                         f"REFERENCES {_table_name(reference)} (id)")
+    else:
+        lines.append("PRIMARY KEY (id)")
+
+    body = ',\n  '.join(lines)
+    statement = f"CREATE TABLE {name} (\n  {body}\n)"
+    if is_partitioned and dbms == DatabaseType.MySQL:
+        statement += f" PARTITION BY HASH (id) PARTITIONS {spec.partitions}"
+    elif is_partitioned:
+        statement += " PARTITION BY HASH (id)"
+
+    statements = [statement]
+
+    if is_partitioned and dbms == DatabaseType.PostgreSQL:
+        for remainder in range(spec.partitions):
+            statements.append(f"CREATE TABLE {name}_p{remainder} PARTITION OF {name} "
+                              f"FOR VALUES WITH (MODULUS {spec.partitions}, REMAINDER {remainder})")
+
+    # MySQL does not support foreign keys on partitioned tables
+    if dbms != DatabaseType.SQLite and not (is_partitioned and dbms == DatabaseType.MySQL):
+        for reference, column in zip(references, columns):
+            statements.append(f"ALTER TABLE {name} ADD CONSTRAINT fk_{name}_{column} FOREIGN KEY ({column}) "
+                              f"REFERENCES {_table_name(reference)} (id)")
+
+    candidates = candidates or [column for column in columns if not column.startswith('c_')]
+    for position in range(spec.indexes_per_table):
+        if not candidates:
+            break
+        column = candidates[position % len(candidates)]
+        # Unique indexes on partitioned tables must hold the partition key
+        unique = 'UNIQUE ' if not is_partitioned and rnd.random() < 0.1 else ''
+        statements.append(f"CREATE {unique}INDEX ix_{name}_{position + 1} ON {name} ({column})")
+
+    return statements, ['id'] + columns
+
+
+def _create_view(spec: SchemaSpec, index: int, table_columns: list[list[str]], rnd: random.Random) -> str:
+    """
+    This function returns the statement that creates a view joining a table to one it references
+    """
+    table = rnd.randrange(spec.tables)
+    columns = table_columns[table]
+    select = [f"a.{column}" for column in columns[:4]]
+    source = f"{_table_name(table)} a"
+
+    references = [column for column in columns if column.startswith('t_')]
+    if references:
+        reference = references[0]
+        select.append(f"b.id AS {reference[:-3]}_ref")
+        source += f" JOIN {reference[:-3]} b ON b.id = a.{reference}"
+
+    return f"CREATE VIEW v_{index:05d} AS SELECT {', '.join(select)} FROM {source}"
+
+
+def generate_ddl(spec: SchemaSpec, dbms: DatabaseType,
+                 map_file: pathlib.Path = _DATA_TYPE_MAP_FILE) -> typing.Iterator[str]:
+    """
+    This function yields the statements that create a synthetic schema for the given DBMS. The same
+    spec always produces the same schema.
+
+    Partitions are not supported by SQLite and are left out for it.
+    """
+    rnd = random.Random(spec.seed)
+    types = _TypePicker(dbms, rnd, map_file)
+
+    table_columns = list()
+    for index in range(spec.tables):
+        statements, columns = _create_table(dbms, spec, index, types, rnd)
+        table_columns.append(columns)
+        yield from statements
+
+    for index in range(spec.views):
+        yield _create_view(spec, index, table_columns, rnd)
+
+
+def write_ddl_script(spec: SchemaSpec, dbms: DatabaseType, file: pathlib.Path,
+                     map_file: pathlib.Path = _DATA_TYPE_MAP_FILE) -> None:
+    """
+    This function writes the DDL script of a synthetic schema to a file
+    """
+    with file.open('w', encoding='utf-8') as f:
+        for statement in generate_ddl(spec, dbms, map_file):
+            f.write(statement)
+            f.write(';\n\n')
+
+
+def create_sqlite_database(spec: SchemaSpec, file: pathlib.Path,
+                           map_file: pathlib.Path = _DATA_TYPE_MAP_FILE) -> None:
+    """
+    This function creates a SQLite database holding a synthetic schema, replacing the file if it exists
+    """
+    if file.exists():
+        file.unlink()
+
+    con = sqlite3.connect(file)
+    try:
+        with con:
+            for statement in generate_ddl(spec, DatabaseType.SQLite, map_file):
+                con.execute(statement)
+    finally:
+        con.close()
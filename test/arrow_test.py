@@ -0,0 +1,69 @@
+# *******************************************************************************************
+#  File:  arrow_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import sys
+from pathlib import Path
+import pytest
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+
+
+@pytest.fixture()
+def catalog(sqlite_connection: model.IConnection, sample_sqlite_type_map) -> dict[str, model.DatabaseMetadata]:
+    schema = plugin.SQLiteDatabaseExplorer().to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+    return {'first': schema, 'second': schema}
+
+
+class TestCatalogArrow:
+    def test_tables(self, catalog: dict[str, model.DatabaseMetadata]) -> None:
+        pytest.importorskip('pyarrow')
+        schema = catalog['first']
+        tables = model.catalog_to_arrow(catalog)
+
+        assert set(tables) == set(model.CATALOG_DATASETS)
+        assert tables['databases'].column('project').to_pylist() == ['first', 'second']
+        assert tables['tables'].num_rows == 2 * len(schema.tables)
+        assert tables['columns'].num_rows == 2 * sum(len(table.columns) for table in schema.tables.values())
+        assert tables['foreign_keys'].num_rows == 2 * sum(len(table.foreign_keys) for table in schema.tables.values())
+        assert tables['view_columns'].num_rows == 2 * sum(len(view.columns) for view in schema.views.values())
+
+        album = [row for row in tables['columns'].to_pylist() if row['project'] == 'first' and row['table'] == 'album']
+        assert [row['column'] for row in album] == list(schema.tables['album'].columns)
+        assert [row['data_type'] for row in album] == \
+               [col.data_type.value for col in schema.tables['album'].columns.values()]
+
+    def test_empty(self) -> None:
+        pytest.importorskip('pyarrow')
+        tables = model.catalog_to_arrow({})
+        assert all(table.num_rows == 0 for table in tables.values())
+
+    def test_parquet(self, catalog: dict[str, model.DatabaseMetadata], tmp_path: Path) -> None:
+        pytest.importorskip('pyarrow')
+        parquet = pytest.importorskip('pyarrow.parquet')
+        files = model.write_catalog_parquet(catalog.items(), tmp_path)
+
+        expected = model.catalog_to_arrow(catalog)
+        for dataset, file_name in files.items():
+            assert parquet.read_table(file_name).equals(expected[dataset])
+
+    def test_no_pyarrow(self, catalog: dict[str, model.DatabaseMetadata], monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, 'pyarrow', None)
+        with pytest.raises(ImportError):
+            model.catalog_to_arrow(catalog)
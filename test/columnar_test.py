@@ -0,0 +1,149 @@
+# *******************************************************************************************
+#  File:  columnar_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+from array import array
+import pytest
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+from hi_henry.src.data_maps import TypeMap
+
+
+class _CountingTypeMap(TypeMap):
+    lookups: int = 0
+
+    def __getitem__(self, item) -> str:
+        self.lookups += 1
+        return super().__getitem__(item)
+
+
+class TestColumnarDatabaseMetadata:
+    def test_sqlite(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        explorer = plugin.SQLiteDatabaseExplorer()
+
+        expected = explorer.to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+        schema = explorer.to_columnar_schema(sqlite_connection, sample_sqlite_type_map)
+
+        assert isinstance(schema, model.ColumnarDatabaseMetadata)
+        assert schema == expected
+        assert schema.to_metadata() == expected
+        assert schema.column_count == sum(len(table.columns) for table in expected.tables.values())
+
+    @pytest.mark.parametrize('dialect', ['mysql', 'postgresql'])
+    def test_replay(self, dialect: str, request: pytest.FixtureRequest) -> None:
+        explorer_type = plugin.MySQLDatabaseExplorer if dialect == 'mysql' else plugin.PostgreSqlDatabaseExplorer
+        con = request.getfixturevalue(f"{dialect}_connection")
+        catalog_file = request.getfixturevalue(f"{dialect}_catalog_file")
+        type_map = request.getfixturevalue(f"sample_{dialect}_type_map")
+
+        expected = explorer_type(plugin.CatalogReplayer(catalog_file)).to_standard_schema(con, type_map)
+        schema = explorer_type(plugin.CatalogReplayer(catalog_file)).to_columnar_schema(con, type_map)
+
+        assert schema == expected
+        assert model.ColumnarDatabaseMetadata.from_metadata(expected).to_metadata() == expected
+
+    def test_read_interface(self, sqlite_dump_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.SQLite)
+
+        expected = explorer.to_standard_schema(sqlite_dump_connection, sample_sqlite_type_map)
+        schema = explorer.to_columnar_schema(sqlite_dump_connection, sample_sqlite_type_map)
+
+        assert list(schema.tables) == list(expected.tables)
+        assert list(schema.views) == list(expected.views)
+
+        for name, table in expected.tables.items():
+            columnar = schema.tables[name]
+            assert columnar.name == table.name
+            assert list(columnar.columns) == list(table.columns)
+            for col in table.columns.values():
+                assert col.name in columnar.columns
+                view = columnar.columns[col.name]
+                assert (view.name, view.data_type, view.length, view.is_nullable, view.is_unique, view.is_auto,
+                        view.is_primary) == (col.name, col.data_type, col.length, col.is_nullable, col.is_unique,
+                                             col.is_auto, col.is_primary)
+            assert [index.columns for index in columnar.indexes] == [index.columns for index in table.indexes]
+            assert columnar.foreign_keys == table.foreign_keys
+
+        assert 'missing' not in schema.tables
+        with pytest.raises(KeyError):
+            _ = next(iter(schema.tables.values())).columns['missing']
+
+    def test_strings_stored_once(self) -> None:
+        schema = model.ColumnarDatabaseMetadata('sample', model.DatabaseType.SQLite)
+        for name in ('album', 'track'):
+            schema.add_table(name)
+            schema.add_column('id', model.StandardDataType.Integer, is_primary=True)
+            schema.add_column('name', model.StandardDataType.String, 100, is_nullable=True)
+
+        assert len(schema.strings) == 4
+        assert schema.tables['track'].columns['name'].length == 100
+        assert schema.tables['track'].columns['name'].is_nullable
+        assert schema.tables['album'].columns['id'].length is None
+        assert schema.tables['album'].columns['id'].is_primary
+
+
+class TestResolveDataTypes:
+    def test_distinct_types(self) -> None:
+        type_map = _CountingTypeMap("SQLite_To_Standard", "SQLite", "Standard", "String")
+        type_map.update({'INTEGER': 'Integer', 'REAL': 'Double'})
+
+        data_types = ['integer', 'text', 'INTEGER', 'real', 'text'] * 1000
+        distinct, inverse, lengths = plugin.resolve_data_types(data_types, type_map)
+
+        assert type_map.lookups == 4
+        assert len(inverse) == len(data_types)
+        assert [distinct[position] for position in inverse[:5]] == [
+            model.StandardDataType.Integer, model.StandardDataType.String, model.StandardDataType.Integer,
+            model.StandardDataType.Double, model.StandardDataType.String]
+        assert lengths == [None] * len(distinct)
+
+        distinct, inverse, lengths = plugin.resolve_data_types(['varchar(40)', 'integer', 'varchar(40)'], type_map)
+        assert [lengths[position] for position in inverse] == [40, None, 40]
+
+    def test_columnar_schema(self, sqlite_connection: model.IConnection) -> None:
+        type_map = _CountingTypeMap("SQLite_To_Standard", "SQLite", "Standard", "String")
+        type_map['INTEGER'] = 'Integer'
+
+        explorer = plugin.SQLiteDatabaseExplorer()
+        schema = explorer.to_columnar_schema(sqlite_connection, type_map)
+
+        raw = explorer.extract(sqlite_connection)
+        table_types = {col.data_type for table in raw.tables.values() for col in table.columns.values()}
+        view_types = {col.data_type for view in raw.views.values() for col in view.columns.values()}
+        assert type_map.lookups == len(table_types | view_types)
+        assert schema == explorer.to_standard_schema(sqlite_connection, type_map)
+
+    def test_wrong_length(self) -> None:
+        schema = model.ColumnarDatabaseMetadata('sample', model.DatabaseType.SQLite)
+        schema.add_table('album')
+        schema.add_column('id', None)
+
+        with pytest.raises(ValueError):
+            schema.set_column_types([model.StandardDataType.Integer], array('i'))
+
+    def test_add_after_batch(self) -> None:
+        schema = model.ColumnarDatabaseMetadata('sample', model.DatabaseType.SQLite)
+        schema.add_table('album')
+        schema.add_column('id', None)
+        schema.add_column('name', None)
+        schema.set_column_types([model.StandardDataType.String, model.StandardDataType.Integer], array('B', [1, 0]))
+        schema.add_column('rating', model.StandardDataType.Double)
+
+        assert [col.data_type for col in schema.tables['album'].columns.values()] == [
+            model.StandardDataType.Integer, model.StandardDataType.String, model.StandardDataType.Double]
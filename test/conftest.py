@@ -17,10 +17,12 @@ __maintainer__ = "James Dooley"
 __status__ = "Production"
 
 from pathlib import Path
+from typing import Any, Callable
 import attrs
 import pytest
-from hi_henry.src.model import DataTypeMap
+from hi_henry.src.model import DataTypeMap, ConnectionFactory, IConnection
 from hi_henry.src.data_maps import TypeMap
+from hi_henry.src.plugin import InstrumentedConnectionFactory, QueryStats
 
 
 @pytest.fixture(scope="session")
@@ -66,6 +68,11 @@ class Connection:
     port: int | None = attrs.field(default=None)
 
 
+@pytest.fixture(scope="session")
+def connection_type() -> type[Connection]:
+    return Connection
+
+
 @pytest.fixture(scope="session")
 def sqlite_connection() -> Connection:
     database_file = Path(__file__).parent.joinpath('data', 'mistral.sqlite')
@@ -198,4 +205,57 @@ def sample_postgresql_type_map():
     map['DATE'] = 'Date'
     map['BOOLEAN'] = 'Boolean'
 
-    return map
\ No newline at end of file
+    return map
+
+
+@pytest.fixture(scope="session")
+def sqlite_dump_connection() -> Connection:
+    dump_file = Path(__file__).parent.joinpath('data', 'mistral_sqlite.sql')
+    return Connection(database="mistral", host=str(dump_file.resolve()))
+
+
+@pytest.fixture(scope="session")
+def mysql_dump_connection() -> Connection:
+    dump_file = Path(__file__).parent.joinpath('data', 'mistral_mysql.sql')
+    return Connection(database="mistral", host=str(dump_file.resolve()))
+
+
+@pytest.fixture(scope="session")
+def postgresql_dump_connection() -> Connection:
+    dump_file = Path(__file__).parent.joinpath('data', 'mistral_postgresql.sql')
+    return Connection(database="mistral", host=str(dump_file.resolve()))
+
+
+@pytest.fixture(scope="session")
+def mysql_catalog_file() -> Path:
+    return Path(__file__).parent.joinpath('data', 'mistral_mysql_catalog.jsonl')
+
+
+@pytest.fixture(scope="session")
+def postgresql_catalog_file() -> Path:
+    return Path(__file__).parent.joinpath('data', 'mistral_postgresql_catalog.jsonl')
+
+
+@pytest.fixture(scope="session")
+def assert_query_budget() -> Callable[..., QueryStats]:
+    """
+    Returns a function that extracts a schema through an instrumented connection factory and fails when the
+    catalog queries or connections exceed a budget, given as a function of the number of tables
+    """
+    def check(explorer_type: type, factory: ConnectionFactory, con: IConnection, queries: Callable[[int], int],
+              connections: Callable[[int], int] = lambda tables: 1) -> QueryStats:
+        instrumented = InstrumentedConnectionFactory(factory)
+        schema: Any = explorer_type(instrumented).extract(con)
+
+        tables = len(schema.tables)
+        stats = instrumented.stats
+        assert stats.queries <= queries(tables), \
+            f"{explorer_type.__name__} ran {stats.queries} catalog queries for {tables} tables, " \
+            f"the budget is {queries(tables)}"
+        assert stats.connections <= connections(tables), \
+            f"{explorer_type.__name__} opened {stats.connections} connections for {tables} tables, " \
+            f"the budget is {connections(tables)}"
+
+        return stats
+
+    return check
@@ -0,0 +1,189 @@
+--
+-- PostgreSQL database dump
+--
+
+-- Dumped from database version 14.4
+-- Dumped by pg_dump version 14.4
+
+SET statement_timeout = 0;
+SET lock_timeout = 0;
+SET client_encoding = 'UTF8';
+SET standard_conforming_strings = on;
+SELECT pg_catalog.set_config('search_path', '', false);
+SET check_function_bodies = false;
+
+--
+-- Name: update_lock_version(); Type: FUNCTION; Schema: public; Owner: jdooley
+--
+
+CREATE FUNCTION public.update_lock_version() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+BEGIN
+    NEW.lock_version = OLD.lock_version + 1;
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$;
+
+
+ALTER FUNCTION public.update_lock_version() OWNER TO jdooley;
+
+SET default_tablespace = '';
+
+SET default_table_access_method = heap;
+
+--
+-- Name: album; Type: TABLE; Schema: public; Owner: jdooley
+--
+
+CREATE TABLE public.album (
+    id integer NOT NULL,
+    title character varying(160) NOT NULL,
+    title_lower character varying(160) NOT NULL,
+    artist_id integer NOT NULL,
+    lock_version integer DEFAULT 1 NOT NULL,
+    created_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    updated_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+
+ALTER TABLE public.album OWNER TO jdooley;
+
+--
+-- Name: COLUMN album.title; Type: COMMENT; Schema: public; Owner: jdooley
+--
+
+COMMENT ON COLUMN public.album.title IS 'The title of the album';
+
+
+--
+-- Name: album_id_seq; Type: SEQUENCE; Schema: public; Owner: jdooley
+--
+
+CREATE SEQUENCE public.album_id_seq
+    AS integer
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1;
+
+
+ALTER TABLE public.album_id_seq OWNER TO jdooley;
+
+ALTER SEQUENCE public.album_id_seq OWNED BY public.album.id;
+
+
+--
+-- Name: artist; Type: TABLE; Schema: public; Owner: jdooley
+--
+
+CREATE TABLE public.artist (
+    id integer NOT NULL,
+    name character varying(120) NOT NULL,
+    name_lower character varying(120) NOT NULL,
+    tags text[],
+    lock_version integer DEFAULT 1 NOT NULL,
+    created_at timestamp with time zone DEFAULT now() NOT NULL
+);
+
+
+ALTER TABLE public.artist OWNER TO jdooley;
+
+--
+-- Name: albums; Type: VIEW; Schema: public; Owner: jdooley
+--
+
+CREATE VIEW public.albums AS
+ SELECT a.id,
+    a.title,
+    aa.name AS artist
+   FROM (public.album a
+     JOIN public.artist aa ON ((aa.id = a.artist_id)));
+
+
+ALTER TABLE public.albums OWNER TO jdooley;
+
+--
+-- Name: artist_id_seq; Type: SEQUENCE; Schema: public; Owner: jdooley
+--
+
+CREATE SEQUENCE public.artist_id_seq
+    AS integer
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1;
+
+
+ALTER TABLE public.artist_id_seq OWNER TO jdooley;
+
+ALTER SEQUENCE public.artist_id_seq OWNED BY public.artist.id;
+
+
+--
+-- Name: album id; Type: DEFAULT; Schema: public; Owner: jdooley
+--
+
+ALTER TABLE ONLY public.album ALTER COLUMN id SET DEFAULT nextval('public.album_id_seq'::regclass);
+
+
+--
+-- Name: artist id; Type: DEFAULT; Schema: public; Owner: jdooley
+--
+
+ALTER TABLE ONLY public.artist ALTER COLUMN id SET DEFAULT nextval('public.artist_id_seq'::regclass);
+
+
+--
+-- Name: album album_ak_name; Type: CONSTRAINT; Schema: public; Owner: jdooley
+--
+
+ALTER TABLE ONLY public.album
+    ADD CONSTRAINT album_ak_name UNIQUE (title_lower);
+
+
+--
+-- Name: album album_pkey; Type: CONSTRAINT; Schema: public; Owner: jdooley
+--
+
+ALTER TABLE ONLY public.album
+    ADD CONSTRAINT album_pkey PRIMARY KEY (id);
+
+
+--
+-- Name: artist artist_pkey; Type: CONSTRAINT; Schema: public; Owner: jdooley
+--
+
+ALTER TABLE ONLY public.artist
+    ADD CONSTRAINT artist_pkey PRIMARY KEY (id);
+
+
+--
+-- Name: album_ix_artist; Type: INDEX; Schema: public; Owner: jdooley
+--
+
+CREATE INDEX album_ix_artist ON public.album USING btree (artist_id);
+
+
+--
+-- Name: album update_album_lock_version; Type: TRIGGER; Schema: public; Owner: jdooley
+--
+
+CREATE TRIGGER update_album_lock_version BEFORE UPDATE ON public.album FOR EACH ROW EXECUTE FUNCTION public.update_lock_version();
+
+
+--
+-- Name: album artist_album; Type: FK CONSTRAINT; Schema: public; Owner: jdooley
+--
+
+ALTER TABLE ONLY public.album
+    ADD CONSTRAINT artist_album FOREIGN KEY (artist_id) REFERENCES public.artist(id);
+
+
+--
+-- PostgreSQL database dump complete
+--
+
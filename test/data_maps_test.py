@@ -18,6 +18,7 @@ __status__ = "Production"
 
 __all__ = []
 
+import pytest
 import hi_henry.src.data_maps as dm
 
 
@@ -49,3 +50,150 @@ def test_type_map() -> None:
     assert map['BLOB'] == "Binary"
 
     assert map['NULL'] == "String"
+
+
+def test_load_type_maps(data_maps_config_file) -> None:
+    type_maps = dm.load_type_maps(data_maps_config_file)
+
+    assert type_maps['MySQL_To_Standard']['VARCHAR'] == "String"
+    assert type_maps['PostgreSql_To_Standard'].default == "String"
+
+
+def test_resolve(data_maps_config_file) -> None:
+    type_maps = dm.load_type_maps(data_maps_config_file)
+    mysql = type_maps['MySQL_To_Standard']
+    postgresql = type_maps['PostgreSql_To_Standard']
+
+    assert mysql.resolve('varchar(255)') == dm.ResolvedType('varchar(255)', 'VARCHAR', "String", length=255)
+    assert mysql.resolve('decimal(10, 2)') == dm.ResolvedType('decimal(10, 2)', 'DECIMAL', "Decimal", precision=10,
+                                                              scale=2)
+    assert mysql.resolve('int(11) unsigned') == dm.ResolvedType('int(11) unsigned', 'INT', "Integer",
+                                                                modifiers=('UNSIGNED',))
+    assert mysql.resolve("enum('a','b')").target == "String"
+
+    assert postgresql.resolve('timestamp(6) without time zone') == dm.ResolvedType(
+        'timestamp(6) without time zone', 'TIMESTAMP WITHOUT TIME ZONE', "DateTime", precision=6)
+    assert postgresql.resolve('character  varying(40)').length == 40
+    assert postgresql.resolve('int8').target == "Integer"
+    assert postgresql.resolve('timestamptz').target == "TimeStamp"
+    assert postgresql.resolve('integer[]') == dm.ResolvedType('integer[]', 'INTEGER', "String", modifiers=('ARRAY',),
+                                                              is_default=True)
+    assert postgresql.resolve('tsvector').is_default
+
+    assert mysql.resolve('time(3)') == dm.ResolvedType('time(3)', 'TIME', "String", precision=3)
+    assert postgresql.resolve('time(6) with time zone').target == "String"
+    assert postgresql.resolve('time(6) with time zone').length is None
+
+
+def test_resolve_sqlite_affinity(sample_sqlite_type_map) -> None:
+    assert sample_sqlite_type_map.resolve('NVARCHAR(120)') == dm.ResolvedType('NVARCHAR(120)', 'NVARCHAR', "String",
+                                                                              length=120)
+    assert sample_sqlite_type_map.resolve('UNSIGNED BIG INT').target == "Integer"
+    assert sample_sqlite_type_map.resolve('DOUBLE').target == "Float"
+    assert sample_sqlite_type_map.resolve('').is_default
+
+    decimal = dm.TypeMap("SQLite_To_Standard", "SQLite", "Standard", "String").resolve('DECIMAL(10,2)')
+    assert decimal.target == "String" and decimal.length is None and decimal.precision is None
+
+
+def test_resolve_cache() -> None:
+    map = dm.TypeMap("SQLite_To_Standard", "SQLite", "Standard", "String")
+    assert map.resolve('INTEGER').is_default
+    assert map.resolve('INTEGER') is map.resolve('INTEGER')
+
+    map['INTEGER'] = "Integer"
+    assert map.resolve('INTEGER').target == "Integer"
+
+
+def test_compose_type_maps(data_maps_config_file) -> None:
+    type_maps = dm.load_type_maps(data_maps_config_file)
+    sqlite, python = type_maps['SQLite_To_Standard'], type_maps['Standard_To_Python']
+    composed = dm.compose_type_maps(sqlite, python)
+
+    assert composed.name == "SQLite_To_Python"
+    assert composed['INTEGER'] == "int"
+    assert composed['BLOB'] == "bytes"
+    assert composed['NULL'] == "str"
+    assert composed.resolve('NVARCHAR(120)').target == "str"
+    assert dm.compose_type_maps(sqlite, python) is composed
+
+    python['Binary'] = "bytearray"
+    changed = dm.compose_type_maps(sqlite, python)
+    assert changed is not composed
+    assert changed['BLOB'] == "bytearray"
+
+
+def test_compose_type_maps_shared(data_maps_config_file) -> None:
+    type_maps = dm.load_type_maps(data_maps_config_file)
+    sqlite, python = type_maps['SQLite_To_Standard'], type_maps['Standard_To_Python']
+    composed = dm.compose_type_maps(sqlite, python)
+
+    with pytest.raises(TypeError):
+        composed['INTEGER'] = "float"
+    with pytest.raises(TypeError):
+        composed.update({'INTEGER': "float"})
+    copied = composed.copy()
+    copied['INTEGER'] = "float"
+    assert composed['INTEGER'] == "int"
+
+    for _ in range(40):
+        dm.compose_type_maps(dm.load_type_maps(data_maps_config_file)['SQLite_To_Standard'], python)
+    assert len(dm._chains) <= 32
+
+
+def test_compose_type_maps_order(data_maps_config_file) -> None:
+    type_maps = dm.load_type_maps(data_maps_config_file)
+
+    with pytest.raises(ValueError):
+        dm.compose_type_maps(type_maps['Standard_To_Python'], type_maps['SQLite_To_Standard'])
+    with pytest.raises(ValueError):
+        dm.compose_type_maps()
+
+
+def test_type_overrides() -> None:
+    overrides = dm.TypeOverrides([dm.OverrideRule('audit_*.*_at', "DateTime"),
+                                  dm.OverrideRule('*.tenant_id', "String"),
+                                  dm.OverrideRule('album.id', "Decimal"),
+                                  dm.OverrideRule('id', "Integer"),
+                                  dm.OverrideRule(r'.*\.(amount|total)_\d+', "Decimal", is_regex=True),
+                                  dm.OverrideRule('audit_log.created_at', "String")])
+
+    assert overrides.match('audit_log', 'created_at').target == "DateTime"
+    assert overrides.match('audit_log', 'tenant_id').target == "String"
+    assert overrides.match('album', 'id').target == "Decimal"
+    assert overrides.match('track', 'id').target == "Integer"
+    assert overrides.match('invoice', 'total_2').target == "Decimal"
+    assert overrides.match('audit.log', 'created_at') is None
+    assert overrides.match('album', 'name') is None
+    assert overrides.match('Album', 'ID') is None
+
+    assert [hits for _, hits in overrides.hits()] == [1, 1, 1, 1, 1, 0]
+    overrides.reset_hits()
+    assert [hits for _, hits in overrides.hits()] == [0] * 6
+
+
+def test_type_overrides_first_match() -> None:
+    overrides = dm.TypeOverrides([dm.OverrideRule('*.*_id', "Integer"),
+                                  dm.OverrideRule('*.tenant_id', "String"),
+                                  dm.OverrideRule('invoice.tenant_id', "Binary")], ignore_case=True)
+
+    assert overrides.match('Invoice', 'TENANT_ID').target == "Integer"
+
+
+def test_type_overrides_groups() -> None:
+    overrides = dm.TypeOverrides([dm.OverrideRule(r'(\w+)\.\1_id', "Integer", is_regex=True),
+                                  dm.OverrideRule(r'(?P<table>\w+)\.(?P=table)_code', "String", is_regex=True),
+                                  dm.OverrideRule(r'.*\.(\w+)_\1', "Binary", is_regex=True),
+                                  dm.OverrideRule('*.*_id', "Decimal")])
+
+    assert overrides.match('album', 'album_id').target == "Integer"
+    assert overrides.match('album', 'artist_id').target == "Decimal"
+    assert overrides.match('album', 'album_code').target == "String"
+    assert overrides.match('album', 'data_data').target == "Binary"
+    assert overrides.match('album', 'name') is None
+
+
+def test_override_rule_target() -> None:
+    assert dm.OverrideRule('*.id', "Integer").target == "Integer"
+    with pytest.raises(ValueError):
+        dm.OverrideRule('*.id', "Integr")
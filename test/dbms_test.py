@@ -20,7 +20,9 @@ __all__ = []
 
 import attrs
 import pytest
+import tinydb
 import hi_henry.src.dbms as dbms
+import hi_henry.src.data_maps as data_maps
 import hi_henry.src.model as model
 import hi_henry.src.errors as errors
 
@@ -60,6 +62,79 @@ class TestMapsTable:
         record = db.get('SQLite', 'Standard')
         assert record is None
 
+    def test_cache(self, database_file_name, sample_data_map_1, sample_data_map_2) -> None:
+        db = dbms.MapStore(database_file_name)
+        db.insert(sample_data_map_1)
+
+        record = db.get('SQLite', 'Standard')
+        assert db.get('SQLite', 'Standard') == record
+        assert dbms.MapStore(database_file_name).get('SQLite', 'Standard') == record
+        assert db.get('SQLite', 'Standard').map is not record.map
+        assert db.get('MySQL', 'Standard') is None
+
+        db.insert(sample_data_map_2)
+        assert db.get('MySQL', 'Standard').name == 'MySQL_To_Standard'
+
+    def test_cache_file_changed(self, database_file_name, sample_data_map_1) -> None:
+        db = dbms.MapStore(database_file_name)
+        db.insert(sample_data_map_1)
+        assert db.get('SQLite', 'Standard').default_type == 'String'
+
+        tinydb.TinyDB(database_file_name).table('maps').update({'default_type': 'Integer'})
+        assert db.get('SQLite', 'Standard').default_type == 'Integer'
+
+    def test_update(self, database_file_name, sample_data_map_1) -> None:
+        db = dbms.MapStore(database_file_name)
+        db.insert(sample_data_map_1)
+
+        record = db.get('SQLite', 'Standard')
+        db.update(attrs.evolve(record, default_type='Binary'))
+
+        record = db.get('SQLite', 'Standard')
+        assert record.default_type == 'Binary'
+        assert record.lock_version == 2
+
+    def test_update_none(self, database_file_name, sample_data_map_1) -> None:
+        db = dbms.MapStore(database_file_name)
+
+        with pytest.raises(errors.RecordNotFoundError):
+            db.update(sample_data_map_1)
+
+    def test_type_map(self, database_file_name, sample_data_map_1) -> None:
+        db = dbms.MapStore(database_file_name)
+        db.insert(sample_data_map_1)
+
+        type_map = db.type_map('SQLite', 'Standard')
+        assert type_map.name == 'SQLite_To_Standard'
+        assert type_map['INTEGER'] == 'Integer'
+        assert type_map.default == 'String'
+        assert db.type_map('SQLite', 'Standard') is type_map
+        assert db.type_map('MySQL', 'Standard') is None
+
+        with pytest.raises(TypeError):
+            type_map['INTEGER'] = 'Decimal'
+        copied = type_map.copy()
+        copied['INTEGER'] = 'Decimal'
+        assert db.type_map('SQLite', 'Standard')['INTEGER'] == 'Integer'
+
+        record = db.get('SQLite', 'Standard')
+        record.map['INTEGER'] = 'Decimal'
+        assert db.get('SQLite', 'Standard').map['INTEGER'] == 'Integer'
+
+    def test_type_map_chain(self, database_file_name, data_maps_config_file) -> None:
+        db = dbms.MapStore(database_file_name)
+        for record in data_maps.load_config(data_maps_config_file):
+            db.insert(record)
+
+        type_map = db.type_map_chain('SQLite', 'Standard', 'Python')
+        assert type_map['INTEGER'] == 'int'
+        assert db.type_map_chain('SQLite', 'Standard', 'Python') is type_map
+        with pytest.raises(TypeError):
+            type_map['INTEGER'] = 'float'
+
+        with pytest.raises(errors.RecordNotFoundError):
+            db.type_map_chain('SQLite', 'Python')
+
 
 class TestProjectsTable:
     def test_insert(self, database_file_name) -> None:
@@ -0,0 +1,249 @@
+# *******************************************************************************************
+#  File:  ddl_explorer_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+from pathlib import Path
+import pytest
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+import hi_henry.src.errors as errors
+
+
+class TestSQLiteDumpExplorer:
+    def test_database(self, sqlite_dump_connection: model.IConnection) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.SQLite)
+        schema = explorer.extract(sqlite_dump_connection)
+
+        assert schema
+        assert schema.name == "mistral"
+        assert schema.type == model.DatabaseType.SQLite
+        assert len(schema.views) == 2
+        assert len(schema.tables) == 26
+
+    def test_invalid_database(self, invalid_sqlite_connection: model.IConnection) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.SQLite)
+
+        with pytest.raises(errors.DatabaseNotFoundError) as e:
+            explorer.extract(invalid_sqlite_connection)
+
+        assert 'The following dump file could not be located' in str(e)
+
+    def test_matches_live_database(self, sqlite_connection: model.IConnection,
+                                   sqlite_dump_connection: model.IConnection) -> None:
+        live = plugin.SQLiteDatabaseExplorer().extract(sqlite_connection)
+        schema = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.SQLite).extract(sqlite_dump_connection)
+
+        assert list(schema.tables) == list(live.tables)
+        assert schema.views == live.views
+
+        for name, table in live.tables.items():
+            assert schema.tables[name].columns == table.columns
+            assert schema.tables[name].indexes == table.indexes
+            assert [(key.column, key.foreign_table, key.foreign_column) for key in schema.tables[name].foreign_keys] \
+                   == [(key.column, key.foreign_table, key.foreign_column) for key in table.foreign_keys]
+
+    def test_process_pool(self, sqlite_dump_connection: model.IConnection) -> None:
+        serial = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.SQLite).extract(sqlite_dump_connection)
+
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.SQLite, workers=2, chunk_size=4,
+                                                  parallel_threshold=1)
+        schema = explorer.extract(sqlite_dump_connection)
+
+        assert schema == serial
+
+    def test_standard_schema(self, sqlite_dump_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.SQLite)
+        schema = explorer.to_standard_schema(sqlite_dump_connection, sample_sqlite_type_map)
+
+        assert schema
+        assert schema.name == "mistral"
+        assert len(schema.views) == 2
+        assert len(schema.tables) == 26
+        assert schema.tables['album'].columns['ID'].data_type == model.StandardDataType.Integer
+
+
+class TestMySQLDumpExplorer:
+    def test_tables(self, mysql_dump_connection: model.IConnection) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.MySQL)
+        schema = explorer.extract(mysql_dump_connection)
+
+        assert schema.type == model.DatabaseType.MySQL
+        assert list(schema.tables) == ['album', 'artist', 'track']
+        assert schema.tables['album'].comment == 'Music albums'
+
+    def test_columns(self, mysql_dump_connection: model.IConnection) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.MySQL)
+        schema = explorer.extract(mysql_dump_connection)
+
+        album = schema.tables['album']
+        assert len(album.columns) == 7
+
+        col = album.columns['id']
+        assert col.is_primary
+        assert col.is_auto
+        assert not col.is_nullable
+        assert col.data_type == 'int'
+
+        col = album.columns['title']
+        assert col.data_type == 'varchar'
+        assert col.length == 160
+
+        col = album.columns['lock_version']
+        assert col.default == '1'
+
+        col = schema.tables['artist'].columns['name']
+        assert col.comment == "The artist's name"
+
+        col = schema.tables['artist'].columns['rating']
+        assert col.data_type == 'decimal'
+        assert col.is_nullable
+        assert col.default is None
+
+    def test_indexes_and_keys(self, mysql_dump_connection: model.IConnection) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.MySQL)
+        schema = explorer.extract(mysql_dump_connection)
+
+        album = schema.tables['album']
+        assert [index.name for index in album.indexes] == ['PRIMARY', 'album_ak_name', 'artist_album']
+        assert album.indexes[0].is_primary
+        assert album.indexes[1].is_unique
+
+        assert len(album.foreign_keys) == 1
+        fk = album.foreign_keys[0]
+        assert fk.name == 'artist_album'
+        assert fk.column == 'artist_id'
+        assert fk.foreign_table == 'artist'
+        assert fk.foreign_column == 'id'
+
+    def test_views(self, mysql_dump_connection: model.IConnection) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.MySQL)
+        schema = explorer.extract(mysql_dump_connection)
+
+        assert list(schema.views) == ['albums']
+        view = schema.views['albums']
+        assert list(view.columns) == ['id', 'title', 'artist']
+        assert view.columns['artist'].data_type == 'varchar'
+
+
+class TestPostgreSqlDumpExplorer:
+    def test_tables(self, postgresql_dump_connection: model.IConnection) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.PostgreSQL)
+        schema = explorer.extract(postgresql_dump_connection)
+
+        assert schema.type == model.DatabaseType.PostgreSQL
+        assert list(schema.tables) == ['album', 'artist']
+
+    def test_columns(self, postgresql_dump_connection: model.IConnection) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.PostgreSQL)
+        schema = explorer.extract(postgresql_dump_connection)
+
+        album = schema.tables['album']
+        col = album.columns['id']
+        assert col.is_primary
+        assert col.is_auto
+        assert col.data_type == 'integer'
+
+        col = album.columns['title']
+        assert col.data_type == 'character varying'
+        assert col.length == 160
+        assert col.comment == 'The title of the album'
+
+        col = album.columns['created_at']
+        assert col.data_type == 'timestamp without time zone'
+        assert col.default == 'CURRENT_TIMESTAMP'
+
+        assert schema.tables['artist'].columns['tags'].data_type == 'ARRAY'
+
+    def test_indexes_and_keys(self, postgresql_dump_connection: model.IConnection) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.PostgreSQL)
+        schema = explorer.extract(postgresql_dump_connection)
+
+        album = schema.tables['album']
+        assert [index.name for index in album.indexes] == ['album_pkey', 'album_ak_name', 'album_ix_artist']
+
+        assert len(album.foreign_keys) == 1
+        fk = album.foreign_keys[0]
+        assert fk.column == 'artist_id'
+        assert fk.foreign_table == 'artist'
+        assert fk.foreign_column == 'id'
+
+    def test_views(self, postgresql_dump_connection: model.IConnection) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.PostgreSQL)
+        schema = explorer.extract(postgresql_dump_connection)
+
+        view = schema.views['albums']
+        assert list(view.columns) == ['id', 'title', 'artist']
+        assert view.columns['title'].data_type == 'character varying'
+
+
+class TestMalformedDump:
+    def test_unsupported_clauses(self, tmp_path: Path, connection_type) -> None:
+        dump_file = tmp_path.joinpath('broken.sql')
+        dump_file.write_text("CREATE TABLE t (a integer, b integer REFERENCES, FOREIGN KEY (a));\n"
+                             "CREATE TABLE u (LIKE t INCLUDING ALL, c integer,\n"
+                             "    CONSTRAINT fk FOREIGN KEY (c) REFERENCES);\n"
+                             "CREATE TABLE (a integer);\n", encoding='utf-8')
+
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.PostgreSQL)
+        schema = explorer.extract(connection_type(database='broken', host=str(dump_file)))
+
+        assert list(schema.tables) == ['t', 'u']
+        assert list(schema.tables['t'].columns) == ['a', 'b']
+        assert not schema.tables['t'].foreign_keys
+        assert list(schema.tables['u'].columns) == ['c']
+        assert not schema.tables['u'].foreign_keys
+
+    def test_keyword_columns(self, tmp_path: Path, connection_type) -> None:
+        dump_file = tmp_path.joinpath('keywords.sql')
+        dump_file.write_text("CREATE TABLE public.t (id integer NOT NULL, key text, index integer);\n",
+                             encoding='utf-8')
+
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.PostgreSQL)
+        schema = explorer.extract(connection_type(database='keywords', host=str(dump_file)))
+
+        assert list(schema.tables['t'].columns) == ['id', 'key', 'index']
+        assert schema.tables['t'].indexes == []
+
+    @pytest.mark.parametrize('dialect, constraints', [(model.DatabaseType.MySQL, 'UNIQUE, PRIMARY KEY, KEY ()'),
+                                                      (model.DatabaseType.PostgreSQL, 'UNIQUE, PRIMARY KEY')])
+    def test_constraint_without_columns(self, tmp_path: Path, connection_type, dialect: model.DatabaseType,
+                                        constraints: str) -> None:
+        dump_file = tmp_path.joinpath('empty.sql')
+        dump_file.write_text(f"CREATE TABLE t (a int, {constraints});\n", encoding='utf-8')
+
+        schema = plugin.DdlDumpDatabaseExplorer(dialect).extract(connection_type(database='empty',
+                                                                                 host=str(dump_file)))
+
+        assert list(schema.tables['t'].columns) == ['a']
+        assert schema.tables['t'].indexes == []
+
+
+class TestExplorerInterface:
+    def test_extract_tables(self, sqlite_dump_connection: model.IConnection) -> None:
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.SQLite, validate=False)
+        schema = explorer.extract(sqlite_dump_connection)
+
+        assert explorer.database_type == model.DatabaseType.SQLite
+        assert explorer.table_names(sqlite_dump_connection) == sorted(schema.tables)
+
+        tables = explorer.extract_tables(sqlite_dump_connection, ['album', 'missing'])
+        assert list(tables.tables) == ['album']
+        assert tables.tables['album'] == schema.tables['album']
+        assert not tables.views
+        assert explorer.extract_tables(sqlite_dump_connection, ['album'], views=True).views == schema.views
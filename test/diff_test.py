@@ -0,0 +1,90 @@
+# *******************************************************************************************
+#  File:  diff_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import attrs
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+
+
+class TestDiffSchemas:
+    def test_no_changes(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        explorer = plugin.SQLiteDatabaseExplorer()
+
+        assert not model.diff_schemas(explorer.extract(sqlite_connection), explorer.extract(sqlite_connection))
+        schema = explorer.to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+        assert model.diff_schemas(schema, schema) == model.SchemaDiff()
+
+    def test_tables_and_views(self, sqlite_connection: model.IConnection) -> None:
+        old = plugin.SQLiteDatabaseExplorer().extract(sqlite_connection)
+        tables = dict(old.tables)
+        del tables['genre']
+        tables['genre_v2'] = attrs.evolve(old.tables['genre'], name='genre_v2')
+        tables['album'] = attrs.evolve(old.tables['album'], comment='Albums')
+        views = dict(old.views)
+        del views['albums']
+        new = attrs.evolve(old, tables=tables, views=views)
+
+        diff = model.diff_schemas(old, new)
+
+        assert diff.added_tables == ['genre_v2']
+        assert diff.removed_tables == ['genre']
+        assert list(diff.altered_tables) == ['album']
+        assert diff.altered_tables['album'].attributes == {'comment': (None, 'Albums')}
+        assert diff.removed_views == ['albums']
+        assert not diff.added_views and not diff.altered_views
+
+    def test_columns(self, sqlite_connection: model.IConnection) -> None:
+        old = plugin.SQLiteDatabaseExplorer().extract(sqlite_connection)
+        album = old.tables['album']
+        columns = dict(album.columns)
+        del columns['lock_version']
+        columns['title'] = attrs.evolve(columns['title'], length=200)
+        columns['rating'] = model.Column('rating', 'INTEGER', 8, is_nullable=True)
+        new = attrs.evolve(old, tables={**old.tables, 'album': attrs.evolve(album, columns=columns)})
+
+        changes = model.diff_schemas(old, new).altered_tables['album'].columns
+
+        assert changes.added == [columns['rating']]
+        assert changes.removed == [album.columns['lock_version']]
+        assert changes.altered == [(album.columns['title'], columns['title'])]
+
+    def test_indexes_and_foreign_keys(self, sqlite_connection: model.IConnection) -> None:
+        old = plugin.SQLiteDatabaseExplorer().extract(sqlite_connection)
+        track = old.tables['track']
+        indexes = [attrs.evolve(track.indexes[0], is_unique=not track.indexes[0].is_unique)] + track.indexes[2:]
+        foreign_keys = track.foreign_keys[1:]
+        new = attrs.evolve(old, tables={**old.tables, 'track': attrs.evolve(track, indexes=indexes,
+                                                                              foreign_keys=foreign_keys)})
+
+        diff = model.diff_schemas(old, new).altered_tables['track']
+
+        assert diff.indexes.altered == [(track.indexes[0], indexes[0])]
+        assert diff.indexes.removed == [track.indexes[1]]
+        assert not diff.indexes.added
+        assert diff.foreign_keys.removed == [track.foreign_keys[0]]
+        assert not diff.foreign_keys.added and not diff.foreign_keys.altered
+        assert not diff.columns
+
+    def test_fingerprint(self, sqlite_connection: model.IConnection) -> None:
+        old = plugin.SQLiteDatabaseExplorer().extract(sqlite_connection)
+        new = attrs.evolve(old, tables={**old.tables, 'album': attrs.evolve(old.tables['album'], comment='Albums')})
+
+        assert list(model.diff_schemas(old, new, fingerprint=lambda table: table.comment).altered_tables) == ['album']
+        assert not model.diff_schemas(old, new, fingerprint=lambda table: table.name)
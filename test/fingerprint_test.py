@@ -0,0 +1,114 @@
+# *******************************************************************************************
+#  File:  fingerprint_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import os
+import subprocess
+import sys
+import attrs
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+
+_SCRIPT = """
+import sys
+from hi_henry.src.model import DatabaseMetadata, DatabaseType, TableMetaData, ColumnMetadata, StandardDataType, \\
+    fingerprint
+columns = {'id': ColumnMetadata('id', StandardDataType.Integer, is_primary=True)}
+print(fingerprint(DatabaseMetadata('sample', DatabaseType.SQLite, {'album': TableMetaData('album', columns)})).hex())
+"""
+
+
+class TestFingerprint:
+    def test_equal_objects(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        explorer = plugin.SQLiteDatabaseExplorer()
+
+        first = explorer.extract(sqlite_connection)
+        second = explorer.extract(sqlite_connection)
+        assert model.fingerprint(first) == model.fingerprint(second)
+        assert len(model.fingerprint(first)) == 16
+
+        schema = explorer.to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+        assert model.fingerprint(schema) == model.fingerprint(explorer.to_standard_schema(sqlite_connection,
+                                                                                          sample_sqlite_type_map))
+        assert model.fingerprint(schema) != model.fingerprint(first)
+
+    def test_changes(self, sqlite_connection: model.IConnection) -> None:
+        schema = plugin.SQLiteDatabaseExplorer().extract(sqlite_connection)
+        album = schema.tables['album']
+        title = attrs.evolve(album.columns['title'], length=None if album.columns['title'].length else 100)
+        changed = attrs.evolve(album, columns={**album.columns, 'title': title})
+
+        assert model.fingerprint(changed) != model.fingerprint(album)
+        assert model.fingerprint(attrs.evolve(schema, tables={**schema.tables, 'album': changed})) != \
+               model.fingerprint(schema)
+        assert model.fingerprint(attrs.evolve(album, comment='Albums')) != model.fingerprint(album)
+
+        index = album.indexes[0]
+        assert model.fingerprint(attrs.evolve(index, columns=index.columns + ['title'])) != model.fingerprint(index)
+
+    def test_none_and_text(self) -> None:
+        column = model.Column('status', 'TEXT', 1)
+        assert model.fingerprint(attrs.evolve(column, default='None')) != model.fingerprint(column)
+
+    def test_changed_in_place(self, sqlite_connection: model.IConnection) -> None:
+        old = plugin.SQLiteDatabaseExplorer().extract(sqlite_connection)
+        new = plugin.SQLiteDatabaseExplorer().extract(sqlite_connection)
+        before = model.fingerprint(new.tables['album'])
+        new.tables['album'].columns['b'] = model.Column('b', 'TEXT', 9)
+
+        assert model.fingerprint(new.tables['album']) != before
+        assert model.diff_schemas(old, new, fingerprint=model.fingerprint) == model.diff_schemas(old, new)
+        diff = model.diff_schemas(old, new, fingerprint=model.fingerprint)
+        assert [col.name for col in diff.altered_tables['album'].columns.added] == ['b']
+
+    def test_stable_across_processes(self) -> None:
+        digests = set()
+        for seed in ('1', '2'):
+            result = subprocess.run([sys.executable, '-c', _SCRIPT], capture_output=True, text=True, check=True,
+                                    env={**os.environ, 'PYTHONHASHSEED': seed})
+            digests.add(result.stdout.strip())
+
+        columns = {'id': model.ColumnMetadata('id', model.StandardDataType.Integer, is_primary=True)}
+        schema = model.DatabaseMetadata('sample', model.DatabaseType.SQLite, {'album': model.TableMetaData('album',
+                                                                                                        columns)})
+        assert digests == {model.fingerprint(schema).hex()}
+
+    def test_diff(self, sqlite_connection: model.IConnection) -> None:
+        old = plugin.SQLiteDatabaseExplorer().extract(sqlite_connection)
+        new = attrs.evolve(old, tables={**old.tables, 'album': attrs.evolve(old.tables['album'], comment='Albums')})
+
+        assert list(model.diff_schemas(old, new, fingerprint=model.fingerprint).altered_tables) == ['album']
+        assert model.diff_schemas(old, new, model.fingerprint) == model.diff_schemas(old, new)
+
+    def test_cache(self, sqlite_connection: model.IConnection) -> None:
+        old = plugin.SQLiteDatabaseExplorer().extract(sqlite_connection)
+        new = attrs.evolve(old, tables={**old.tables, 'album': attrs.evolve(old.tables['album'], comment='Albums')})
+        cache = model.FingerprintCache()
+
+        diff = model.diff_schemas(old, new, fingerprint=cache)
+        assert diff == model.diff_schemas(old, new)
+        # Only the table changed is hashed, the others are the same objects in both versions
+        assert len(cache) == 2
+        assert cache(old.tables['track']) is cache(old.tables['track'])
+        assert cache(old.tables['track']) == model.fingerprint(old.tables['track'])
+        assert len(cache) == 3
+
+        del new
+        assert len(cache) == 2
+
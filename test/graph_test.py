@@ -0,0 +1,74 @@
+# *******************************************************************************************
+#  File:  graph_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+
+
+def _schema(references: dict[str, list[str]]) -> model.DatabaseMetadata:
+    tables = dict()
+    for name, targets in references.items():
+        foreign_keys = [model.ForeignKeyMetadata(f"{name}_{target}", f"{target}_id", target, 'id')
+                        for target in targets]
+        tables[name] = model.TableMetaData(name, foreign_keys=foreign_keys)
+    return model.DatabaseMetadata('sample', model.DatabaseType.SQLite, tables)
+
+
+class TestForeignKeyGraph:
+    def test_sqlite(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        schema = plugin.SQLiteDatabaseExplorer().to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+        graph = schema.build_foreign_key_graph()
+
+        assert graph.referenced_by('album') == ('track',)
+        assert graph.references('track') == ('media_type', 'genre', 'album')
+        assert graph.cycles == [('employee',)]
+
+        order = graph.topological_order
+        assert sorted(order) == sorted(schema.tables)
+        for name, table in schema.tables.items():
+            for key in table.foreign_keys:
+                assert order.index(key.foreign_table) <= order.index(name)
+
+    def test_cycles(self) -> None:
+        schema = _schema({'c': ['a'], 'a': ['b'], 'b': ['a'], 'd': ['c', 'missing'], 'e': []})
+        graph = schema.build_foreign_key_graph()
+
+        assert graph.components == [('a', 'b'), ('c',), ('d',), ('e',)]
+        assert graph.cycles == [('a', 'b')]
+        assert graph.component('b') == ('a', 'b')
+        assert graph.topological_order == ['a', 'b', 'c', 'd', 'e']
+        assert graph.references('d') == ('c',)
+        assert graph.referenced_by('a') == ('c', 'b')
+
+    def test_long_chain(self) -> None:
+        count = 5000
+        graph = _schema({f"t{position}": [f"t{position + 1}"] if position + 1 < count else []
+                         for position in range(count)}).build_foreign_key_graph()
+
+        assert graph.topological_order == [f"t{position}" for position in reversed(range(count))]
+        assert not graph.cycles
+
+    def test_changed_schema(self) -> None:
+        schema = _schema({'t': []})
+        assert schema.build_foreign_key_graph().topological_order == ['t']
+
+        schema.tables['u'] = model.TableMetaData('u', foreign_keys=[model.ForeignKeyMetadata('fk', 'id', 't', 'id')])
+        assert schema.build_foreign_key_graph().topological_order == ['t', 'u']
+        assert model.foreign_key_graph(schema).referenced_by('t') == ('u',)
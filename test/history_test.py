@@ -0,0 +1,105 @@
+# *******************************************************************************************
+#  File:  history_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+from pathlib import Path
+import attrs
+import pendulum
+import pytest
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+
+
+@pytest.fixture()
+def versions(sqlite_connection: model.IConnection, sample_sqlite_type_map) -> list[model.DatabaseMetadata]:
+    schema = plugin.SQLiteDatabaseExplorer().to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+    album = schema.tables['album']
+    notes = model.ColumnMetadata('Notes', model.StandardDataType.String, 100, True)
+    with_notes = attrs.evolve(schema, tables={**schema.tables, 'album': attrs.evolve(
+        album, columns={**album.columns, 'Notes': notes})})
+    without_track = attrs.evolve(with_notes, tables={name: table for name, table in with_notes.tables.items()
+                                                     if name != 'track'})
+    reordered = attrs.evolve(without_track, tables=dict(reversed(without_track.tables.items())))
+    return [schema, with_notes, without_track, reordered, schema]
+
+
+class TestSchemaHistory:
+    @pytest.mark.parametrize('checkpoint_interval', [1, 2, 16])
+    def test_versions(self, versions: list[model.DatabaseMetadata], tmp_path: Path,
+                      checkpoint_interval: int) -> None:
+        file_name = tmp_path.joinpath('mistral.log')
+        history = model.SchemaHistory(file_name, checkpoint_interval)
+        for schema in versions:
+            history.record(schema)
+
+        reader = model.SchemaHistory(file_name, checkpoint_interval)
+        assert len(reader) == len(versions)
+        for number, schema in enumerate(versions, 1):
+            rebuilt = reader.version(number)
+            assert rebuilt == schema
+            assert list(rebuilt.tables) == list(schema.tables)
+        assert reader.latest() == versions[-1]
+        with pytest.raises(ValueError):
+            reader.version(len(versions) + 1)
+
+    def test_entries(self, versions: list[model.DatabaseMetadata], tmp_path: Path) -> None:
+        history = model.SchemaHistory(tmp_path.joinpath('mistral.log'), 3)
+        entries = [history.record(schema) for schema in versions]
+
+        assert entries[0].checkpoint and entries[0].tables == list(versions[0].tables)
+        assert entries[1].tables == ['album'] and not entries[1].checkpoint
+        assert entries[2].removed_tables == ['track']
+        assert entries[3].tables == [] and entries[3].removed_tables == [] and entries[3].checkpoint
+        assert entries[4].tables == ['album', 'track']
+        assert [entry.version for entry in history.table_changes('album')] == [1, 2, 5]
+
+    def test_since(self, versions: list[model.DatabaseMetadata], tmp_path: Path) -> None:
+        start = pendulum.datetime(2026, 10, 1)
+        history = model.SchemaHistory(tmp_path.joinpath('mistral.log'))
+        for day, schema in enumerate(versions):
+            history.record(schema, start.add(days=day))
+
+        assert [entry.version for entry in history.since(start.add(days=2))] == [4, 5]
+        assert history.since(start.add(days=10)) == []
+        assert history.at(start.subtract(days=1)) is None
+        assert history.at(start.add(days=2, hours=1)) == versions[2]
+
+        with pytest.raises(ValueError):
+            history.record(versions[0], pendulum.datetime(2000, 1, 1))
+        assert len(history) == len(versions)
+        assert [entry.version for entry in history.since(pendulum.datetime(2001, 1, 1))] == [1, 2, 3, 4, 5]
+
+    def test_changed_in_place(self, versions: list[model.DatabaseMetadata], tmp_path: Path) -> None:
+        history = model.SchemaHistory(tmp_path.joinpath('mistral.log'))
+        schema = versions[0]
+        history.record(schema)
+        schema.tables['album'].columns['Notes'] = model.ColumnMetadata('Notes', model.StandardDataType.String)
+        entry = history.record(schema)
+
+        assert entry.tables == ['album']
+        assert 'Notes' in history.version(2).tables['album'].columns
+        assert 'Notes' not in history.version(1).tables['album'].columns
+        assert history.latest() == schema
+
+    def test_empty(self, tmp_path: Path) -> None:
+        history = model.SchemaHistory(tmp_path.joinpath('mistral.log'))
+        assert history.latest() is None
+        assert history.since(pendulum.now()) == []
+        with pytest.raises(ValueError):
+            model.SchemaHistory(tmp_path.joinpath('mistral.log'), 0)
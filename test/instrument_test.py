@@ -0,0 +1,50 @@
+# *******************************************************************************************
+#  File:  instrument_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+from pathlib import Path
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+
+
+class TestInstrumentedConnectionFactory:
+    def test_sqlite_explorer(self, sqlite_connection: model.IConnection) -> None:
+        factory = plugin.InstrumentedConnectionFactory(plugin.SQLiteDatabaseExplorer.connect)
+        schema = plugin.SQLiteDatabaseExplorer(factory).extract(sqlite_connection)
+
+        assert len(schema.tables) == 26
+        assert factory.stats.connections == 1
+        assert factory.stats.queries == 5
+        assert factory.stats.rows > 0
+
+    def test_reset(self, sqlite_connection: model.IConnection) -> None:
+        factory = plugin.InstrumentedConnectionFactory(plugin.SQLiteDatabaseExplorer.connect)
+        plugin.SQLiteDatabaseExplorer(factory).extract(sqlite_connection)
+
+        factory.stats.reset()
+
+        assert factory.stats == plugin.QueryStats()
+
+    def test_replay(self, mysql_connection: model.IConnection, mysql_catalog_file: Path) -> None:
+        factory = plugin.InstrumentedConnectionFactory(plugin.CatalogReplayer(mysql_catalog_file))
+        schema = plugin.MySQLDatabaseExplorer(factory).extract(mysql_connection)
+
+        assert len(schema.tables) == 3
+        assert factory.stats.connections == 1
+        assert factory.stats.queries > 1
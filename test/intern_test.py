@@ -0,0 +1,88 @@
+# *******************************************************************************************
+#  File:  intern_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import sys
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+
+
+class TestStringInterner:
+    def test_intern(self) -> None:
+        interner = plugin.StringInterner()
+        first = ''.join(['var', 'char'])
+        second = ''.join(['var', 'char'])
+
+        assert interner(first) is first
+        assert interner(second) is first
+        assert interner(first) is first
+        assert interner(None) is None
+
+        assert len(interner) == 1
+        assert interner.stats.lookups == 3
+        assert interner.stats.duplicates == 1
+        assert interner.stats.bytes_saved == sys.getsizeof(second)
+
+    def test_clear(self) -> None:
+        interner = plugin.StringInterner()
+        interner('album')
+        interner.clear()
+
+        assert len(interner) == 0
+        assert interner.stats == plugin.InternStats()
+
+
+class TestExtraction:
+    def test_shared_strings(self, sqlite_connection: model.IConnection) -> None:
+        interner = plugin.StringInterner()
+        schema = plugin.SQLiteDatabaseExplorer(interner=interner).extract(sqlite_connection)
+
+        names = {name: name for name in schema.tables}
+        for table in schema.tables.values():
+            for key in table.foreign_keys:
+                assert key.foreign_table is names[key.foreign_table]
+            for index in table.indexes:
+                for column in index.columns:
+                    assert column is table.columns[column].name
+
+        data_types = {col.data_type for table in schema.tables.values() for col in table.columns.values()}
+        data_type_objects = {id(col.data_type) for table in schema.tables.values() for col in table.columns.values()}
+        assert len(data_type_objects) == len(data_types)
+        assert interner.stats.bytes_saved > 0
+
+    def test_across_schemas(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        interner = plugin.StringInterner()
+        explorer = plugin.SQLiteDatabaseExplorer(interner=interner)
+
+        first = explorer.extract(sqlite_connection)
+        strings = len(interner)
+        second = explorer.to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+
+        assert len(interner) == strings
+        assert all(name is second.tables[name].name for name in first.tables)
+        assert second == plugin.SQLiteDatabaseExplorer().to_standard_schema(sqlite_connection,
+                                                                             sample_sqlite_type_map)
+
+    def test_ddl(self, mysql_dump_connection: model.IConnection) -> None:
+        interner = plugin.StringInterner()
+        schema = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.MySQL, interner=interner).extract(
+            mysql_dump_connection)
+
+        assert schema == plugin.DdlDumpDatabaseExplorer(model.DatabaseType.MySQL).extract(mysql_dump_connection)
+        assert interner.stats.duplicates > 0
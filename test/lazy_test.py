@@ -0,0 +1,121 @@
+# *******************************************************************************************
+#  File:  lazy_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import pytest
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+
+
+class TestLazyDatabaseMetadata:
+    def test_matches_standard_schema(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        explorer = plugin.SQLiteDatabaseExplorer()
+        schema = plugin.LazyDatabaseMetadata(explorer.extract(sqlite_connection), sample_sqlite_type_map)
+        expected = explorer.to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+
+        assert schema.name == expected.name
+        assert schema.type == expected.type
+        assert list(schema.tables) == list(expected.tables)
+        assert schema == expected
+        assert schema.to_metadata() == expected
+
+    def test_loaded_on_access(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        database = plugin.SQLiteDatabaseExplorer().extract(sqlite_connection)
+        schema = plugin.LazyDatabaseMetadata(database, sample_sqlite_type_map)
+
+        assert schema.loaded_tables == 0
+        assert 'album' in schema.tables
+        assert len(schema.tables) == len(database.tables)
+        assert schema.loaded_tables == 0
+
+        album = schema.tables['album']
+        assert schema.tables['album'] is album
+        assert schema.loaded_tables == 1
+        assert album.columns['ID'].data_type == model.StandardDataType.Integer
+
+        with pytest.raises(KeyError):
+            _ = schema.tables['missing']
+
+
+class TestLazyDatabase:
+    def test_matches_extract(self, sqlite_connection: model.IConnection) -> None:
+        explorer = plugin.SQLiteDatabaseExplorer()
+        schema = plugin.LazyDatabase(explorer, sqlite_connection)
+        expected = explorer.extract(sqlite_connection)
+
+        assert schema.name == expected.name
+        assert schema.type == expected.type
+        assert list(schema.tables) == list(expected.tables)
+        assert schema.views == expected.views
+        assert schema == expected
+        assert schema.to_database() == expected
+
+    def test_loaded_on_access(self, sqlite_connection: model.IConnection) -> None:
+        factory = plugin.InstrumentedConnectionFactory(plugin.SQLiteDatabaseExplorer.connect)
+        schema = plugin.LazyDatabase(plugin.SQLiteDatabaseExplorer(factory), sqlite_connection)
+
+        assert factory.stats.queries == 1
+        assert 'album' in schema.tables
+        assert schema.loaded_tables == 0
+
+        album = schema.tables['album']
+        assert schema.tables['album'] is album
+        assert schema.loads == 1
+        assert 'ID' in album.columns
+
+        with pytest.raises(KeyError):
+            _ = schema.tables['missing']
+        assert schema.loads == 1
+
+    def test_least_recently_used(self, sqlite_connection: model.IConnection) -> None:
+        schema = plugin.LazyDatabase(plugin.SQLiteDatabaseExplorer(), sqlite_connection, max_tables=2)
+        first, second, third = list(schema.tables)[:3]
+
+        table = schema.tables[first]
+        _ = schema.tables[second]
+        assert schema.tables[first] is table
+        _ = schema.tables[third]
+
+        assert schema.loaded_tables == 2
+        assert schema.loads == 3
+        assert schema.tables[first] is table
+        _ = schema.tables[second]
+        assert schema.loads == 4
+
+    def test_prefetch(self, sqlite_connection: model.IConnection) -> None:
+        factory = plugin.InstrumentedConnectionFactory(plugin.SQLiteDatabaseExplorer.connect)
+        schema = plugin.LazyDatabase(plugin.SQLiteDatabaseExplorer(factory), sqlite_connection)
+        names = list(schema.tables)
+
+        schema.prefetch(names + ['missing'])
+        queries = factory.stats.queries
+        assert schema.loads == 1
+        assert schema.loaded_tables == len(names)
+
+        _ = [schema.tables[name] for name in names]
+        assert factory.stats.queries == queries
+
+    def test_values_in_batches(self, sqlite_connection: model.IConnection) -> None:
+        explorer = plugin.SQLiteDatabaseExplorer()
+        schema = plugin.LazyDatabase(explorer, sqlite_connection, max_tables=3)
+        expected = explorer.extract(sqlite_connection)
+
+        assert list(schema.tables.values()) == list(expected.tables.values())
+        assert schema.loads == -(-len(expected.tables) // 3)
+        assert schema.loaded_tables <= 3
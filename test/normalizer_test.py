@@ -0,0 +1,138 @@
+# *******************************************************************************************
+#  File:  normalizer_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import attrs
+import pytest
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+from hi_henry.src.data_maps import TypeMap, TypeOverrides, OverrideRule
+
+
+class _CountingTypeMap(TypeMap):
+    lookups: int = 0
+
+    def __getitem__(self, item) -> str:
+        self.lookups += 1
+        return super().__getitem__(item)
+
+
+class TestSchemaBuilder:
+    def test_build(self) -> None:
+        builder = plugin.SchemaBuilder('sample', model.DatabaseType.SQLite)
+        builder.add_table('album')
+        builder.add_column('album', 'id', 'INTEGER', 0, 0)
+        builder.set_column_flags('album', 'id', is_auto=True, is_primary=True)
+        builder.add_index('album', 'album_ix', ['id'], is_unique=True)
+        builder.add_foreign_key('album', 'Unknown', 'id', 'artist', 'id')
+        builder.add_view('albums')
+        builder.add_view_column('albums', 'id', 'INTEGER', 0)
+
+        schema = builder.build()
+
+        assert isinstance(schema, model.Database)
+        col = schema.tables['album'].columns['id']
+        assert col.is_auto
+        assert col.is_primary
+        assert schema.tables['album'].indexes[0].columns == ['id']
+        assert schema.tables['album'].foreign_keys[0].foreign_table == 'artist'
+        assert schema.views['albums'].columns['id'].data_type == 'INTEGER'
+
+    def test_validate(self) -> None:
+        for validate in (True, False):
+            builder = plugin.SchemaBuilder('sample', model.DatabaseType.SQLite, validate)
+            builder.add_table('album')
+            builder.add_column('album', 'id', 'INTEGER', '0')
+
+            if validate:
+                with pytest.raises(TypeError):
+                    builder.build()
+            else:
+                assert builder.build().tables['album'].columns['id'].order == '0'
+
+    def test_validation_left_on(self) -> None:
+        class CheckingBuilder(plugin.SchemaBuilder):
+            validators_run: bool = False
+
+            def _freeze(self) -> model.Database:
+                self.validators_run = attrs.validators.get_disabled() is False
+                return super()._freeze()
+
+        builder = CheckingBuilder('sample', model.DatabaseType.SQLite, False)
+        builder.add_table('album')
+        builder.add_column('album', 'id', 'INTEGER', '0')
+
+        assert builder.build().tables['album'].columns['id'].order == '0'
+        assert builder.validators_run
+
+    def test_without_validation(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        trusted = plugin.SQLiteDatabaseExplorer(validate=False)
+        explorer = plugin.SQLiteDatabaseExplorer()
+
+        assert trusted.extract(sqlite_connection) == explorer.extract(sqlite_connection)
+        assert trusted.to_standard_schema(sqlite_connection, sample_sqlite_type_map) == \
+               explorer.to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+
+
+class TestStandardSchemaBuilder:
+    def test_matches_normalize(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        explorer = plugin.SQLiteDatabaseExplorer()
+
+        schema = explorer.to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+
+        assert schema == plugin.normalize(explorer.extract(sqlite_connection), sample_sqlite_type_map)
+
+    def test_type_cache(self, sqlite_connection: model.IConnection) -> None:
+        type_map = _CountingTypeMap("SQLite_To_Standard", "SQLite", "Standard", "String")
+        type_map['INTEGER'] = 'Integer'
+
+        explorer = plugin.SQLiteDatabaseExplorer()
+        explorer.to_standard_schema(sqlite_connection, type_map)
+
+        raw = explorer.extract(sqlite_connection)
+        data_types = {col.data_type for table in raw.tables.values() for col in table.columns.values()}
+        data_types |= {col.data_type for view in raw.views.values() for col in view.columns.values()}
+        assert type_map.lookups == len(data_types)
+
+    def test_replay(self, mysql_connection: model.IConnection, mysql_catalog_file, sample_mysql_type_map) -> None:
+        explorer = plugin.MySQLDatabaseExplorer(plugin.CatalogReplayer(mysql_catalog_file))
+
+        schema = explorer.to_standard_schema(mysql_connection, sample_mysql_type_map)
+
+        assert schema == plugin.normalize(explorer.extract(mysql_connection), sample_mysql_type_map)
+        assert schema.tables['album'].columns['id'].is_primary
+
+
+class TestTypeOverrides:
+    def test_builders(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        overrides = TypeOverrides([OverrideRule('*.*_at', "DateTime"), OverrideRule('*.ID', "Decimal")])
+
+        explorer = plugin.SQLiteDatabaseExplorer()
+        schema = explorer.to_standard_schema(sqlite_connection, sample_sqlite_type_map, overrides)
+
+        assert schema.tables['activity_log'].columns['logged_at'].data_type == model.StandardDataType.DateTime
+        assert schema.tables['artist'].columns['ID'].data_type == model.StandardDataType.Decimal
+        assert schema.tables['artist'].columns['name'].data_type == model.StandardDataType.String
+        assert explorer.to_columnar_schema(sqlite_connection, sample_sqlite_type_map, overrides) == schema
+        assert plugin.LazyDatabaseMetadata(explorer.extract(sqlite_connection), sample_sqlite_type_map,
+                                           overrides).to_metadata() == schema
+        assert plugin.normalize(explorer.extract(sqlite_connection), sample_sqlite_type_map,
+                                overrides=overrides) == schema
+        assert dict(overrides.hits())[OverrideRule('*.ID', "Decimal")] > 0
+        assert explorer.to_standard_schema(sqlite_connection, sample_sqlite_type_map) != schema
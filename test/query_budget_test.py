@@ -0,0 +1,96 @@
+# *******************************************************************************************
+#  File:  query_budget_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import pytest
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+import hi_henry.src.synthetic as synthetic
+
+
+class TestSQLiteQueryBudget:
+    def test_mistral(self, sqlite_connection: model.IConnection, assert_query_budget) -> None:
+        assert_query_budget(plugin.SQLiteDatabaseExplorer, plugin.SQLiteDatabaseExplorer.connect, sqlite_connection,
+                            queries=lambda tables: 5)
+
+    @pytest.mark.parametrize("tables", [10, 200])
+    def test_synthetic(self, tables: int, tmp_path: Path, connection_type, assert_query_budget) -> None:
+        database_file = tmp_path.joinpath('synthetic.sqlite')
+        synthetic.create_sqlite_database(synthetic.SchemaSpec(tables=tables, views=5), database_file)
+        connection = connection_type(database="synthetic", host=str(database_file))
+
+        stats = assert_query_budget(plugin.SQLiteDatabaseExplorer, plugin.SQLiteDatabaseExplorer.connect,
+                                    connection, queries=lambda count: 5)
+
+        assert stats.rows > tables
+
+    def test_over_budget(self, sqlite_connection: model.IConnection, assert_query_budget) -> None:
+        with pytest.raises(AssertionError) as e:
+            assert_query_budget(plugin.SQLiteDatabaseExplorer, plugin.SQLiteDatabaseExplorer.connect,
+                                sqlite_connection, queries=lambda tables: 1)
+
+        assert 'catalog queries for 26 tables' in str(e)
+
+
+class TestMySQLQueryBudget:
+    def test_mistral(self, mysql_connection: model.IConnection, mysql_catalog_file: Path,
+                     assert_query_budget) -> None:
+        assert_query_budget(plugin.MySQLDatabaseExplorer, plugin.CatalogReplayer(mysql_catalog_file),
+                            mysql_connection, queries=lambda tables: 5)
+
+    def test_concurrent_extractions(self, mysql_connection: model.IConnection, mysql_catalog_file: Path) -> None:
+        replayer = plugin.CatalogReplayer(mysql_catalog_file)
+        opened = threading.Barrier(2, timeout=5)
+
+        class Connection:
+            def __init__(self):
+                self.closed = False
+                self.connection = replayer(mysql_connection)
+                opened.wait()
+
+            def cursor(self, *args, **kwargs):
+                assert not self.closed, "The connection was closed by another extraction"
+                return self.connection.cursor(*args, **kwargs)
+
+            def close(self):
+                self.closed = True
+
+        connections = list()
+
+        def factory(con: model.IConnection) -> Connection:
+            connection = Connection()
+            connections.append(connection)
+            return connection
+
+        explorer = plugin.MySQLDatabaseExplorer(factory)
+        with ThreadPoolExecutor(2) as executor:
+            schemas = list(executor.map(explorer.extract, [mysql_connection] * 2))
+
+        assert schemas[0] == schemas[1]
+        assert len(connections) == 2 and all(connection.closed for connection in connections)
+
+
+class TestPostgreSqlQueryBudget:
+    def test_mistral(self, postgresql_connection: model.IConnection, postgresql_catalog_file: Path,
+                     assert_query_budget) -> None:
+        assert_query_budget(plugin.PostgreSqlDatabaseExplorer, plugin.CatalogReplayer(postgresql_catalog_file),
+                            postgresql_connection, queries=lambda tables: 7)
@@ -0,0 +1,87 @@
+# *******************************************************************************************
+#  File:  query_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import gc
+import weakref
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+
+
+class TestSchemaQuery:
+    def test_columns(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        schema = plugin.SQLiteDatabaseExplorer().to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+        query = schema.build_query()
+
+        expected = [(table.name, col) for table in schema.tables.values() for col in table.columns.values()
+                    if col.data_type == model.StandardDataType.Integer and col.is_nullable]
+        assert query.columns(data_type=model.StandardDataType.Integer, is_nullable=True) == expected
+
+        expected = [(table.name, col) for table in schema.tables.values() for col in table.columns.values()
+                    if col.name == 'lock_version' and not col.is_unique]
+        assert query.columns(name='lock_version', is_unique=False) == expected
+        assert query.columns(name='missing') == []
+        assert len(query.columns()) == sum(len(table.columns) for table in schema.tables.values())
+
+    def test_name_without_case(self, sqlite_connection: model.IConnection) -> None:
+        query = model.schema_query(plugin.SQLiteDatabaseExplorer().extract(sqlite_connection))
+
+        assert query.columns(name='id') == []
+        assert [table for table, _ in query.columns(name='id', ignore_case=True)] == \
+               [table for table, _ in query.columns(name='ID')]
+
+    def test_indexed(self, sqlite_connection: model.IConnection) -> None:
+        schema = plugin.SQLiteDatabaseExplorer().extract(sqlite_connection)
+
+        expected = [(table.name, col) for table in schema.tables.values() for col in table.columns.values()
+                    if any(col.name in index.columns for index in table.indexes)]
+        assert model.schema_query(schema).columns(indexed=True) == expected
+        assert len(model.schema_query(schema).columns(indexed=False)) == \
+               sum(len(table.columns) for table in schema.tables.values()) - len(expected)
+
+    def test_tables(self) -> None:
+        columns = {'id': model.ColumnMetadata('id', model.StandardDataType.Integer, is_primary=True)}
+        foreign_keys = [model.ForeignKeyMetadata('album_artist', 'artist_id', 'artist', 'id')]
+        schema = model.DatabaseMetadata('sample', model.DatabaseType.SQLite, {
+            'album': model.TableMetaData('album', columns, foreign_keys=foreign_keys),
+            'artist': model.TableMetaData('artist', columns),
+            'log': model.TableMetaData('log', {'message': model.ColumnMetadata('message',
+                                                                               model.StandardDataType.String)}),
+            'tag': model.TableMetaData('tag', indexes=[model.IndexMetadata('PRIMARY', ['name'], True, True)])})
+
+        query = schema.build_query()
+        assert query.tables(has_primary_key=False) == ['log']
+        assert query.tables(has_primary_key=True, has_foreign_keys=False) == ['artist', 'tag']
+        assert query.tables() == list(schema.tables)
+
+    def test_not_kept(self) -> None:
+        schemas = [model.DatabaseMetadata(f"sample_{position}", model.DatabaseType.SQLite, {
+            'log': model.TableMetaData('log', {'id': model.ColumnMetadata('id', model.StandardDataType.Integer)})})
+            for position in range(5)]
+        references = [weakref.ref(schema) for schema in schemas]
+        for schema in schemas:
+            assert len(schema.build_query().columns(name='id')) == 1
+
+        schemas[0].tables['tag'] = model.TableMetaData('tag', {'id': model.ColumnMetadata(
+            'id', model.StandardDataType.Integer)})
+        assert [table for table, _ in schemas[0].build_query().columns(name='id')] == ['log', 'tag']
+
+        del schema, schemas
+        gc.collect()
+        assert all(reference() is None for reference in references)
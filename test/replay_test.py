@@ -0,0 +1,133 @@
+# *******************************************************************************************
+#  File:  replay_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import json
+import sqlite3
+import time
+import pytest
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+import hi_henry.src.errors as errors
+
+
+class TestCatalogRecorder:
+    def test_record_and_replay(self, sqlite_connection: model.IConnection, tmp_path) -> None:
+        recording = tmp_path.joinpath('catalog.jsonl')
+        recorder = plugin.CatalogRecorder(lambda con: sqlite3.connect(con.host), recording)
+
+        cursor = recorder(sqlite_connection).cursor()
+        cursor.execute("SELECT name FROM sqlite_schema WHERE type = ? ORDER BY name;", ('view',))
+        expected = cursor.fetchall()
+        cursor.execute("SELECT count(*) FROM sqlite_schema;")
+        count = cursor.fetchone()
+        cursor.close()
+
+        assert expected == [('albums',), ('playlists',)]
+
+        replayer = plugin.CatalogReplayer(recording)
+        cursor = replayer(sqlite_connection).cursor()
+        cursor.execute("SELECT name FROM sqlite_schema\n    WHERE type = ? ORDER BY name;", ('view',))
+        assert cursor.fetchall() == expected
+        cursor.execute("SELECT count(*) FROM sqlite_schema;")
+        assert cursor.fetchone() == count
+
+    def test_record_error(self, sqlite_connection: model.IConnection, tmp_path) -> None:
+        recording = tmp_path.joinpath('catalog.jsonl')
+        recorder = plugin.CatalogRecorder(lambda con: sqlite3.connect(con.host), recording)
+
+        with pytest.raises(sqlite3.OperationalError):
+            recorder(sqlite_connection).cursor().execute("SELECT * FROM missing_table;")
+
+        replayer = plugin.CatalogReplayer(recording)
+        with pytest.raises(sqlite3.OperationalError) as e:
+            replayer(sqlite_connection).cursor().execute("SELECT * FROM missing_table;")
+
+        assert 'missing_table' in str(e)
+
+
+class TestCatalogReplayer:
+    def test_mysql_explorer(self, mysql_connection: model.IConnection, mysql_catalog_file) -> None:
+        explorer = plugin.MySQLDatabaseExplorer(plugin.CatalogReplayer(mysql_catalog_file))
+        schema = explorer.extract(mysql_connection)
+
+        assert schema.type == model.DatabaseType.MySQL
+        assert list(schema.tables) == ['album', 'artist', 'track']
+        assert list(schema.views) == ['albums']
+
+        album = schema.tables['album']
+        col = album.columns['id']
+        assert col.is_primary
+        assert col.is_auto
+        assert col.data_type == 'int'
+        assert album.columns['created_at'].default == 'CURRENT_TIMESTAMP'
+
+        assert len(album.indexes) == 3
+        assert album.indexes[1].name == 'artist_album'
+        assert album.indexes[1].columns == ['artist_id']
+
+        fk = album.foreign_keys[0]
+        assert fk.foreign_table == 'artist'
+        assert fk.foreign_column == 'id'
+        assert fk.column == 'artist_id'
+
+    def test_postgresql_explorer(self, postgresql_connection: model.IConnection, postgresql_catalog_file) -> None:
+        explorer = plugin.PostgreSqlDatabaseExplorer(plugin.CatalogReplayer(postgresql_catalog_file))
+        schema = explorer.extract(postgresql_connection)
+
+        assert schema.type == model.DatabaseType.PostgreSQL
+        assert list(schema.tables) == ['album', 'artist', 'track']
+        assert list(schema.views) == ['albums']
+
+        col = schema.tables['album'].columns['id']
+        assert col.is_primary
+        assert col.is_auto
+        assert col.data_type == 'integer'
+
+    def test_latency(self, mysql_connection: model.IConnection, mysql_catalog_file) -> None:
+        explorer = plugin.MySQLDatabaseExplorer(plugin.CatalogReplayer(mysql_catalog_file, latency=0.005))
+
+        start = time.perf_counter()
+        explorer.extract(mysql_connection)
+        elapsed = time.perf_counter() - start
+
+        with mysql_catalog_file.open() as f:
+            queries = sum(1 for _ in f)
+
+        assert elapsed >= queries * 0.005
+
+    def test_unrecorded_query(self, mysql_connection: model.IConnection, mysql_catalog_file) -> None:
+        replayer = plugin.CatalogReplayer(mysql_catalog_file)
+
+        with pytest.raises(errors.CatalogReplayError) as e:
+            replayer(mysql_connection).cursor().execute("SELECT 1;")
+
+        assert 'The following query was not recorded' in str(e)
+
+    @pytest.mark.parametrize('error', ['os.system', 'builtins.exec', 'sqlite3.connect', 'sqlite3.Missing'])
+    def test_recorded_error_not_a_driver_error(self, mysql_connection: model.IConnection, tmp_path,
+                                               error: str) -> None:
+        recording = tmp_path.joinpath('catalog.jsonl')
+        recording.write_text(json.dumps({'sql': 'SELECT 1;', 'params': None, 'error': error,
+                                         'message': 'echo replayed'}) + '\n', encoding='utf-8')
+
+        with pytest.raises(errors.CatalogReplayError) as e:
+            plugin.CatalogReplayer(recording)(mysql_connection).cursor().execute("SELECT 1;")
+
+        assert 'echo replayed' in str(e)
@@ -0,0 +1,94 @@
+# *******************************************************************************************
+#  File:  snapshot_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+from pathlib import Path
+import pytest
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+
+
+class TestSchemaSnapshot:
+    def test_round_trip(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        expected = plugin.SQLiteDatabaseExplorer().to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+        snapshot = model.SchemaSnapshot(model.dump_snapshot(expected))
+
+        assert snapshot.name == expected.name
+        assert snapshot.type == expected.type
+        assert list(snapshot.tables) == list(expected.tables)
+        assert list(snapshot.views) == list(expected.views)
+        assert snapshot == expected
+        assert snapshot.to_metadata() == expected
+
+    @pytest.mark.parametrize('dialect', ['mysql', 'postgresql'])
+    def test_replay(self, dialect: str, request: pytest.FixtureRequest) -> None:
+        explorer_type = plugin.MySQLDatabaseExplorer if dialect == 'mysql' else plugin.PostgreSqlDatabaseExplorer
+        con = request.getfixturevalue(f"{dialect}_connection")
+        catalog_file = request.getfixturevalue(f"{dialect}_catalog_file")
+        type_map = request.getfixturevalue(f"sample_{dialect}_type_map")
+
+        expected = explorer_type(plugin.CatalogReplayer(catalog_file)).to_standard_schema(con, type_map)
+        assert model.SchemaSnapshot(model.dump_snapshot(expected)).to_metadata() == expected
+
+    def test_columnar(self, sqlite_connection: model.IConnection, sample_sqlite_type_map) -> None:
+        explorer = plugin.SQLiteDatabaseExplorer()
+        schema = explorer.to_columnar_schema(sqlite_connection, sample_sqlite_type_map)
+
+        assert model.dump_snapshot(schema) == model.dump_snapshot(schema.to_metadata())
+
+    def test_file(self, sqlite_connection: model.IConnection, sample_sqlite_type_map, tmp_path: Path) -> None:
+        expected = plugin.SQLiteDatabaseExplorer().to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+        file_name = tmp_path.joinpath('mistral.snapshot')
+        model.write_snapshot(expected, file_name)
+
+        with model.SchemaSnapshot.open(file_name) as snapshot:
+            assert snapshot.tables['album'] == expected.tables['album']
+            assert 'missing' not in snapshot.tables
+            with pytest.raises(KeyError):
+                _ = snapshot.tables['missing']
+            assert snapshot == expected
+
+    def test_lookup_by_name(self) -> None:
+        column = model.ColumnMetadata('id', model.StandardDataType.Integer)
+        tables = {f"t_{index:05d}": model.TableMetaData(f"t_{index:05d}", {'id': column}) for index in range(5000)}
+        expected = model.DatabaseMetadata('sample', model.DatabaseType.SQLite, tables)
+        snapshot = model.SchemaSnapshot(model.dump_snapshot(expected))
+        decoded = len(snapshot._strings)
+
+        assert snapshot.tables['t_04321'] == tables['t_04321']
+        assert 't_05000' not in snapshot.tables and 7 not in snapshot.tables
+        assert len(snapshot._strings) - decoded < 20
+        assert 'v' not in snapshot.views
+
+    def test_lengths_and_flags(self) -> None:
+        columns = {'id': model.ColumnMetadata('id', model.StandardDataType.Integer, None, False, True, True, True),
+                   'notes': model.ColumnMetadata('notes', model.StandardDataType.String, 4294967295, True)}
+        indexes = [model.IndexMetadata('PRIMARY', ['id'], True, True)]
+        view_columns = {'id': model.ViewColumnMetadata('id', model.StandardDataType.Integer, 1)}
+        expected = model.DatabaseMetadata('sample', model.DatabaseType.MySQL,
+                                          {'album': model.TableMetaData('album', columns, indexes)},
+                                          {'albums': model.ViewMetaData('albums', view_columns)})
+
+        assert model.SchemaSnapshot(model.dump_snapshot(expected)).to_metadata() == expected
+
+    def test_not_a_snapshot(self) -> None:
+        with pytest.raises(ValueError):
+            model.SchemaSnapshot(b'not a snapshot')
+        with pytest.raises(ValueError):
+            model.SchemaSnapshot(b'\0' * 256)
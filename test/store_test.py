@@ -0,0 +1,112 @@
+# *******************************************************************************************
+#  File:  store_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import copy
+from pathlib import Path
+import attrs
+import pytest
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+
+
+@pytest.fixture()
+def schema(sqlite_connection: model.IConnection, sample_sqlite_type_map) -> model.DatabaseMetadata:
+    return plugin.SQLiteDatabaseExplorer().to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+
+
+class TestSchemaStore:
+    def test_round_trip(self, schema: model.DatabaseMetadata, tmp_path: Path) -> None:
+        store = model.SchemaStore(tmp_path)
+        store.save('mistral', schema)
+
+        assert store.load('mistral') == schema
+        assert store.load('missing') is None
+        assert store.projects() == ['mistral']
+        assert len(store) == len(schema.tables) + len(schema.views)
+
+    def test_other_schema_types(self, schema: model.DatabaseMetadata, tmp_path: Path) -> None:
+        store = model.SchemaStore(tmp_path)
+        store.save('standard', schema)
+        store.save('columnar', model.ColumnarDatabaseMetadata.from_metadata(schema))
+        snapshot_file = tmp_path.joinpath('mistral.snapshot')
+        model.write_snapshot(schema, snapshot_file)
+        store.save('snapshot', model.SchemaSnapshot.open(snapshot_file))
+
+        assert store.load('columnar') == schema
+        assert store.load('snapshot') == schema
+        assert len(store) == len(schema.tables) + len(schema.views)
+
+    def test_shared_tables(self, schema: model.DatabaseMetadata, tmp_path: Path) -> None:
+        album = schema.tables['album']
+        changed = attrs.evolve(album, columns={**album.columns, 'Notes': model.ColumnMetadata(
+            'Notes', model.StandardDataType.String, 100, True)})
+        tenant = attrs.evolve(schema, name='tenant', tables={**schema.tables, 'album': changed})
+
+        store = model.SchemaStore(tmp_path)
+        store.save('first', schema)
+        store.save('tenant/2', tenant)
+        assert len(store) == len(schema.tables) + len(schema.views) + 1
+
+        reader = model.SchemaStore(tmp_path)
+        first, second = reader.load('first'), reader.load('tenant/2')
+        assert first == schema
+        assert second == tenant
+        assert first.tables['track'] is second.tables['track']
+        assert reader.projects() == ['first', 'tenant/2']
+
+        notes = model.ColumnMetadata('Notes', model.StandardDataType.String, 100, True)
+        with pytest.raises(TypeError):
+            first.tables['track'].columns['Notes'] = notes
+        with pytest.raises(TypeError):
+            first.tables['track'].indexes.append(model.IndexMetadata('ix', ['Notes']))
+        with pytest.raises(TypeError):
+            first.tables['track'].indexes[0].columns.append('Notes')
+        assert 'Notes' not in second.tables['track'].columns
+
+        changed = copy.deepcopy(first.tables['track'])
+        changed.columns['Notes'] = notes
+        first.tables['track'] = changed
+        assert 'Notes' not in second.tables['track'].columns
+
+    def test_changed_after_save(self, schema: model.DatabaseMetadata, tmp_path: Path) -> None:
+        store = model.SchemaStore(tmp_path)
+        store.save('first', schema)
+        schema.tables['album'].columns['Notes'] = model.ColumnMetadata('Notes', model.StandardDataType.String)
+        store.save('second', schema)
+
+        assert 'Notes' not in model.SchemaStore(tmp_path).load('first').tables['album'].columns
+        assert 'Notes' in model.SchemaStore(tmp_path).load('second').tables['album'].columns
+
+    def test_collect(self, schema: model.DatabaseMetadata, tmp_path: Path) -> None:
+        store = model.SchemaStore(tmp_path)
+        store.save('mistral', schema)
+        store.save('empty', attrs.evolve(schema, tables={}, views={}))
+        assert store.collect() == 0
+
+        in_progress = tmp_path.joinpath('objects', 'ab', 'cdef.1234.tmp')
+        in_progress.parent.mkdir(exist_ok=True)
+        in_progress.write_text('{}')
+
+        assert store.delete('mistral')
+        assert not store.delete('mistral')
+        assert store.collect() == len(schema.tables) + len(schema.views)
+        assert len(store) == 0
+        assert store.load('empty') == attrs.evolve(schema, tables={}, views={})
+        assert in_progress.exists()
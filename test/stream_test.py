@@ -0,0 +1,88 @@
+# *******************************************************************************************
+#  File:  stream_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+import json
+from pathlib import Path
+import pytest
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+
+
+class TestSchemaJson:
+    @pytest.mark.parametrize('json_lines', [True, False])
+    def test_round_trip(self, sqlite_connection: model.IConnection, sample_sqlite_type_map, tmp_path: Path,
+                        json_lines: bool) -> None:
+        expected = plugin.SQLiteDatabaseExplorer().to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+        file_name = tmp_path.joinpath('mistral.json')
+        model.write_schema_json(expected, file_name, json_lines)
+
+        with model.SchemaJsonReader(file_name) as reader:
+            assert reader.name == expected.name
+            assert reader.type == expected.type
+            assert list(reader.tables) == list(expected.tables)
+            assert list(reader.views) == list(expected.views)
+            assert reader.tables['album'] == expected.tables['album']
+            assert 'missing' not in reader.tables
+            with pytest.raises(KeyError):
+                _ = reader.tables['missing']
+            assert reader == expected
+            assert reader.to_metadata() == expected
+
+    def test_json_document(self, sqlite_connection: model.IConnection, sample_sqlite_type_map,
+                           tmp_path: Path) -> None:
+        expected = plugin.SQLiteDatabaseExplorer().to_standard_schema(sqlite_connection, sample_sqlite_type_map)
+        file_name = tmp_path.joinpath('mistral.json')
+        model.write_schema_json(expected, file_name, json_lines=False)
+
+        records = json.loads(file_name.read_text(encoding='utf-8'))
+        assert records[0] == {'database': expected.name, 'type': expected.type.value}
+        assert [record['table'] for record in records if 'table' in record] == list(expected.tables)
+
+    def test_columnar(self, sqlite_connection: model.IConnection, sample_sqlite_type_map, tmp_path: Path) -> None:
+        schema = plugin.SQLiteDatabaseExplorer().to_columnar_schema(sqlite_connection, sample_sqlite_type_map)
+        file_name = tmp_path.joinpath('mistral.jsonl')
+        model.write_schema_json(schema, file_name)
+
+        with model.SchemaJsonReader(file_name) as reader:
+            assert reader.to_metadata() == schema.to_metadata()
+
+    def test_writer(self, tmp_path: Path) -> None:
+        columns = {'id': model.ColumnMetadata('id', model.StandardDataType.Integer, None, False, True, True, True),
+                   'notes': model.ColumnMetadata('notes', model.StandardDataType.String, 4294967295, True)}
+        indexes = [model.IndexMetadata('PRIMARY', ['id'], True, True)]
+        view_columns = {'id': model.ViewColumnMetadata('id', model.StandardDataType.Integer, 1)}
+        table = model.TableMetaData('album "é"', columns, indexes)
+        view = model.ViewMetaData('albums', view_columns)
+
+        file_name = tmp_path.joinpath('sample.jsonl')
+        with model.SchemaJsonWriter(file_name, 'sample', model.DatabaseType.MySQL) as writer:
+            writer.write_view(view)
+            writer.write_table(table)
+
+        with model.SchemaJsonReader(file_name) as reader:
+            assert reader.to_metadata() == model.DatabaseMetadata('sample', model.DatabaseType.MySQL,
+                                                                  {table.name: table}, {view.name: view})
+
+    def test_not_a_schema(self, tmp_path: Path) -> None:
+        file_name = tmp_path.joinpath('empty.jsonl')
+        file_name.write_text('{"name": "sample"}\n', encoding='utf-8')
+
+        with pytest.raises(ValueError):
+            model.SchemaJsonReader(file_name)
@@ -0,0 +1,121 @@
+# *******************************************************************************************
+#  File:  synthetic_test.py
+#
+#  Created: 19-10-2026
+#
+#  History:
+#  19-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__contact__ = "james@developernotes.org"
+__copyright__ = "Copyright (c) 2022 James Dooley <james@dooley.ch>"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+__all__ = []
+
+from pathlib import Path
+import pytest
+import hi_henry.src.plugin as plugin
+import hi_henry.src.model as model
+import hi_henry.src.synthetic as synthetic
+
+
+@pytest.fixture(scope="module")
+def spec() -> synthetic.SchemaSpec:
+    return synthetic.SchemaSpec(tables=40, columns_per_table=8, indexes_per_table=2, foreign_keys_per_table=1,
+                                views=5, partitions=4, partitioned_tables=2, seed=42)
+
+
+class TestSyntheticSchema:
+    def test_sqlite_database(self, spec: synthetic.SchemaSpec, tmp_path: Path, connection_type) -> None:
+        database_file = tmp_path.joinpath('synthetic.sqlite')
+        synthetic.create_sqlite_database(spec, database_file)
+
+        connection = connection_type(database="synthetic", host=str(database_file))
+        schema = plugin.SQLiteDatabaseExplorer().extract(connection)
+
+        assert len(schema.tables) == 40
+        assert len(schema.views) == 5
+        assert all(len(table.columns) == 8 for table in schema.tables.values())
+        assert all(len(table.indexes) == 2 for table in schema.tables.values())
+        assert not schema.tables['t_00000'].foreign_keys
+        assert all(len(schema.tables[f"t_{index:05d}"].foreign_keys) == 1 for index in range(1, 40))
+
+    def test_mysql_script(self, spec: synthetic.SchemaSpec, tmp_path: Path, connection_type) -> None:
+        script_file = tmp_path.joinpath('synthetic_mysql.sql')
+        synthetic.write_ddl_script(spec, model.DatabaseType.MySQL, script_file)
+
+        assert 'PARTITION BY HASH (id) PARTITIONS 4' in script_file.read_text()
+
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.MySQL)
+        schema = explorer.extract(connection_type(database="synthetic", host=str(script_file)))
+
+        assert len(schema.tables) == 40
+        assert len(schema.views) == 5
+        assert all(len(table.columns) == 8 for table in schema.tables.values())
+        # Partitioned tables carry no foreign keys in MySQL
+        assert not schema.tables['t_00001'].foreign_keys
+        assert len(schema.tables['t_00002'].foreign_keys) == 1
+
+    def test_postgresql_script(self, spec: synthetic.SchemaSpec, tmp_path: Path, connection_type) -> None:
+        script_file = tmp_path.joinpath('synthetic_postgresql.sql')
+        synthetic.write_ddl_script(spec, model.DatabaseType.PostgreSQL, script_file)
+
+        explorer = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.PostgreSQL)
+        schema = explorer.extract(connection_type(database="synthetic", host=str(script_file)))
+
+        assert len(schema.tables) == 40 + 2 * 4
+        assert 't_00001_p3' in schema.tables
+        assert len(schema.views) == 5
+
+    def test_type_distribution(self, tmp_path: Path, connection_type) -> None:
+        spec = synthetic.SchemaSpec(tables=20, columns_per_table=50, indexes_per_table=0, foreign_keys_per_table=0,
+                                    views=0)
+        script_file = tmp_path.joinpath('synthetic_mysql.sql')
+        synthetic.write_ddl_script(spec, model.DatabaseType.MySQL, script_file)
+
+        schema = plugin.DdlDumpDatabaseExplorer(model.DatabaseType.MySQL).extract(
+            connection_type(database="synthetic", host=str(script_file)))
+        data_types = [column.data_type for table in schema.tables.values() for column in table.columns.values()]
+
+        assert len(set(data_types)) > 10
+        assert data_types.count('varchar') + data_types.count('char') + data_types.count('text') > \
+               data_types.count('double')
+
+    @pytest.mark.parametrize('dbms, unindexed', [
+        (model.DatabaseType.MySQL, {'tinytext', 'text', 'mediumtext', 'longtext', 'tinyblob', 'blob', 'mediumblob',
+                                    'longblob', 'json'}),
+        (model.DatabaseType.PostgreSQL, {'json'})])
+    def test_indexed_column_types(self, dbms: model.DatabaseType, unindexed: set[str], tmp_path: Path,
+                                  connection_type) -> None:
+        spec = synthetic.SchemaSpec(tables=30, columns_per_table=12, indexes_per_table=4, views=0)
+        script_file = tmp_path.joinpath('synthetic.sql')
+        synthetic.write_ddl_script(spec, dbms, script_file)
+
+        schema = plugin.DdlDumpDatabaseExplorer(dbms).extract(
+            connection_type(database="synthetic", host=str(script_file)))
+        indexed_types = [table.columns[column].data_type for table in schema.tables.values()
+                         for index in table.indexes for column in index.columns]
+
+        assert len(indexed_types) >= 30 * 4
+        assert not unindexed & set(indexed_types)
+        all_types = {column.data_type for table in schema.tables.values() for column in table.columns.values()}
+        assert unindexed & all_types
+
+    def test_seed(self, spec: synthetic.SchemaSpec) -> None:
+        first = list(synthetic.generate_ddl(spec, model.DatabaseType.SQLite))
+        second = list(synthetic.generate_ddl(spec, model.DatabaseType.SQLite))
+        other = list(synthetic.generate_ddl(synthetic.SchemaSpec(tables=40, columns_per_table=8, seed=1),
+                                            model.DatabaseType.SQLite))
+
+        assert first == second
+        assert first != other
+
+    def test_invalid_spec(self) -> None:
+        with pytest.raises(ValueError):
+            synthetic.SchemaSpec(tables=0)